@@ -24,7 +24,8 @@ from .const import (
     CONF_PARAMS_FULL,
     CONF_LANG,
     CONF_LANG_EN,
-    CONF_LANG_DE
+    CONF_LANG_DE,
+    DATA_BRIDGES,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -124,8 +125,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry_id = entry.entry_id
     hass.data[DOMAIN][entry_id] = entry.data
 
-    # Forward the setup to the sensor platform
+    # Reload when the options (e.g. deadbands) change
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+
+    # Forward the setup to the sensor platform, which creates the bridge;
+    # the binary sensors reuse that bridge and are set up afterwards
     await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+    await hass.config_entries.async_forward_entry_setups(entry, ["binary_sensor"])
 
     # Register diagnostics service (only once)
     if not hass.services.has_service(DOMAIN, "get_diagnostics"):
@@ -153,11 +159,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry after the options were changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor", "binary_sensor"])
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        hass.data[DOMAIN].get(DATA_BRIDGES, {}).pop(entry.entry_id, None)
 
     return unload_ok
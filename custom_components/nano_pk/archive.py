@@ -0,0 +1,306 @@
+"""Append-only archive of the raw `pm` frames received from a boiler.
+
+The session (see connection.py) archives every pm line it frames, including
+the frames it passes over when catching up on a backlog. Lines are archived
+as framed, i.e. with telnet noise removed (see framing.py). Frames are
+stored as compact binary records in segment files:
+
+    segment = MAGIC record*
+    record  = timestamp (float64, seconds since epoch) | length (uint32) | raw line
+
+all little-endian, the raw line without its line terminator. Appending from
+the event loop only enqueues the frame; a background thread writes the
+records, fsyncs in batches and rotates segments by size or age. The age is
+measured on the record timestamps, from the first record of a segment to
+the one being written, so archives written offline with historical
+timestamps rotate like live ones; an idle segment stays open until the next
+record or `close()`. Closed segments are compressed with zlib (gzip
+container) or lzma, so a whole heating season can be kept and replayed with
+`read_archive()`.
+
+This module has no Home Assistant dependencies so that tools can read
+archives standalone.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import lzma
+import os
+from pathlib import Path
+import queue
+import shutil
+import struct
+import threading
+import time
+from typing import Iterator
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"NPKA\x01"
+RECORD = struct.Struct("<dI")
+SEGMENT_SUFFIX = ".npka"
+
+COMPRESSION_NONE = "none"
+COMPRESSION_ZLIB = "zlib"
+COMPRESSION_LZMA = "lzma"
+COMPRESSIONS = {
+    COMPRESSION_NONE: ("", None),
+    COMPRESSION_ZLIB: (".gz", gzip.open),
+    COMPRESSION_LZMA: (".xz", lzma.open),
+}
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE = 24 * 3600
+DEFAULT_FSYNC_INTERVAL = 5.0
+DEFAULT_QUEUE_SIZE = 10000
+
+_STOP = object()
+
+
+def _open_for_reading(path: Path):
+    """Open a segment for reading, compressed or not."""
+    name = path.name
+    for suffix, opener in COMPRESSIONS.values():
+        if suffix and name.endswith(SEGMENT_SUFFIX + suffix):
+            return opener(path, "rb")
+    return open(path, "rb")
+
+
+def read_archive(path: str | Path) -> Iterator[tuple[float, bytes]]:
+    """Yield (timestamp, raw line) of every record in one segment.
+
+    A record cut off at the end (e.g. by a crash before the last fsync) ends
+    the iteration silently.
+    """
+    with _open_for_reading(Path(path)) as stream:
+        if stream.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a pm frame archive")
+        while True:
+            header = stream.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            timestamp, length = RECORD.unpack(header)
+            line = stream.read(length)
+            if len(line) < length:
+                return
+            yield timestamp, line
+
+
+def _segment_order(path: Path) -> tuple[str, int]:
+    """Sort key of a segment name pm-<stamp>-<counter>.npka[.gz|.xz]."""
+    stamp, _, counter = path.name.split(SEGMENT_SUFFIX)[0].rpartition("-")
+    return stamp, int(counter) if counter.isdigit() else 0
+
+
+def archive_segments(directory: str | Path) -> list[Path]:
+    """Return the segments of an archive directory, oldest first."""
+    return sorted(
+        (p for p in Path(directory).iterdir() if SEGMENT_SUFFIX in p.name),
+        key=_segment_order,
+    )
+
+
+def read_archive_dir(directory: str | Path) -> Iterator[tuple[float, bytes]]:
+    """Yield the records of all segments of an archive directory in order."""
+    for path in archive_segments(directory):
+        yield from read_archive(path)
+
+
+def read_capture(path: str | Path) -> list[tuple[float | None, bytes]]:
+    """Return (timestamp or None, raw line) of a capture to replay.
+
+    Archives (a segment or its directory) keep their timestamps, plain text
+    captures have one pm line per line and no timestamps.
+    """
+    path = Path(path)
+    if path.is_dir():
+        return list(read_archive_dir(path))
+    if SEGMENT_SUFFIX in path.name:
+        return list(read_archive(path))
+    with open(path, "rb") as capture:
+        return [(None, line.strip()) for line in capture if line.lstrip().startswith(b"pm")]
+
+
+class HargassnerArchiveWriter:
+    """Write raw pm frames to rotating segments from a background thread."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        compression: str = COMPRESSION_LZMA,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown archive compression '{compression}'")
+        self._directory = Path(directory)
+        self._compression = compression
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._fsync_interval = fsync_interval
+        self._queue: queue.Queue = queue.Queue(queue_size)
+        self._thread: threading.Thread | None = None
+        self._file = None
+        self._path: Path | None = None
+        self._opened = 0.0  # timestamp of the first record in the segment
+        self._size = 0
+        self.records = 0  # records written
+        self.dropped = 0  # frames dropped because the queue was full
+        self.segments = 0  # segments closed
+        self.errors = 0  # I/O errors in the writer thread
+
+    @property
+    def directory(self) -> Path:
+        """Return the archive directory."""
+        return self._directory
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="nano_pk archive", daemon=True)
+        self._thread.start()
+
+    def append(self, line: bytes, timestamp: float | None = None, block: bool = False) -> None:
+        """Queue one raw frame.
+
+        Does not block by default (frames are dropped if the writer lags);
+        offline tools pass `block` to wait for the writer instead.
+        """
+        item = (time.time() if timestamp is None else timestamp, line)
+        if block:
+            self._queue.put(item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Flush, close and compress the current segment and stop the thread (blocking)."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def diagnostics(self) -> dict:
+        """Return archive counters."""
+        return {
+            "directory": str(self._directory),
+            "compression": self._compression,
+            "records": self.records,
+            "dropped": self.dropped,
+            "segments": self.segments,
+            "errors": self.errors,
+            "queued": self._queue.qsize(),
+        }
+
+    def _run(self) -> None:
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            # segments left uncompressed by an unclean shutdown
+            for path in self._directory.glob("*" + SEGMENT_SUFFIX):
+                self._compress(path)
+        except OSError as err:
+            self.errors += 1
+            _LOGGER.error("Hargassner archive %s: %s", self._directory, err)
+        last_sync = time.monotonic()
+        dirty = False
+        while True:
+            try:
+                item = self._queue.get(timeout=self._fsync_interval)
+            except queue.Empty:
+                item = None
+            try:
+                if item is _STOP:
+                    self._close_segment()
+                    return
+                if item is not None:
+                    self._write(*item)
+                    dirty = True
+                    # take whatever piled up meanwhile in the same batch
+                    while True:
+                        try:
+                            item = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if item is _STOP:
+                            self._close_segment()
+                            return
+                        self._write(*item)
+                now = time.monotonic()
+                if dirty and now - last_sync >= self._fsync_interval:
+                    self._sync()
+                    dirty = False
+                    last_sync = now
+                if self._rotation_due(None):
+                    self._close_segment()
+            except OSError as err:
+                self.errors += 1
+                _LOGGER.error("Hargassner archive %s: %s", self._directory, err)
+                if self._file is not None:
+                    try:
+                        self._file.close()
+                    except OSError:
+                        pass
+                    self._file = None
+
+    def _rotation_due(self, timestamp: float | None) -> bool:
+        """Segment full, or the record at `timestamp` is max_age past its first record."""
+        return self._file is not None and (
+            self._size >= self._max_bytes
+            or (timestamp is not None and timestamp - self._opened >= self._max_age)
+        )
+
+    def _write(self, timestamp: float, line: bytes) -> None:
+        if self._rotation_due(timestamp):
+            self._close_segment()
+        if self._file is None:
+            self._open_segment(timestamp)
+        self._file.write(RECORD.pack(timestamp, len(line)))
+        self._file.write(line)
+        self._size += RECORD.size + len(line)
+        self.records += 1
+
+    def _open_segment(self, timestamp: float) -> None:
+        # names sort chronologically: UTC time of the first record in milliseconds
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(timestamp)) + "%03d" % (timestamp % 1 * 1000)
+        counter = 1
+        path = self._directory / f"pm-{stamp}-{counter}{SEGMENT_SUFFIX}"
+        while path.exists() or Path(str(path) + COMPRESSIONS[self._compression][0]).exists():
+            counter += 1
+            path = self._directory / f"pm-{stamp}-{counter}{SEGMENT_SUFFIX}"
+        self._file = open(path, "ab")
+        self._file.write(MAGIC)
+        self._path = path
+        self._opened = timestamp
+        self._size = len(MAGIC)
+
+    def _sync(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _close_segment(self) -> None:
+        if self._file is None:
+            return
+        self._sync()
+        self._file.close()
+        self._file = None
+        self.segments += 1
+        self._compress(self._path)
+
+    def _compress(self, path: Path) -> None:
+        """Compress a closed segment next to it and remove the original."""
+        suffix, opener = COMPRESSIONS[self._compression]
+        if opener is None:
+            return
+        target = Path(str(path) + suffix)
+        with open(path, "rb") as source, opener(target, "wb") as sink:
+            shutil.copyfileobj(source, sink)
+        path.unlink()
@@ -0,0 +1,102 @@
+"""Binary sensors for the digital channels of a Hargassner boiler.
+
+The bridge decodes each digital word once per frame and only notifies the
+entities whose bit flipped, so these entities are cheap even in FULL mode.
+"""
+import logging
+import time
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.core import HomeAssistant, callback
+from .const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_PARAMS,
+    CONF_PARAMS_FULL,
+    BRIDGE_STATE_OK,
+    DATA_BRIDGES,
+)
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> None:
+    """Set up binary sensors for the digital channels (FULL mode only)."""
+    if entry.data[CONF_PARAMS] != CONF_PARAMS_FULL:
+        return
+
+    bridge = hass.data[DOMAIN].get(DATA_BRIDGES, {}).get(entry.entry_id)
+    if bridge is None:
+        _LOGGER.debug("No bridge available for %s; skipping binary sensors.", entry.title)
+        return
+
+    name = entry.data[CONF_NAME]
+    plan = bridge.decodePlan()
+    async_add_entities(
+        HargassnerBinarySensor(bridge, name+" "+bridge.data()[key].description(), key)
+        for key in plan.digital_keys
+    )
+
+
+class HargassnerBinarySensor(BinarySensorEntity):
+    """Representation of one digital channel bit."""
+
+    def __init__(self, bridge, description, paramName):
+        """Initialize the binary sensor."""
+        self._bridge = bridge
+        self._description = description
+        self._paramName = paramName
+        self._unique_id = bridge.getUniqueIdBase()
+        self._is_on = None
+        self._written = None
+
+    @property
+    def name(self):
+        """Return the name of the binary sensor."""
+        return self._description
+
+    @property
+    def is_on(self):
+        """Return True if the bit is set."""
+        return self._is_on
+
+    @property
+    def available(self):
+        if self._bridge.state == BRIDGE_STATE_OK: return True
+        else: return False
+
+    @property
+    def should_poll(self):
+        """Values are pushed by the bridge reader task."""
+        return False
+
+    @property
+    def entity_registry_enabled_default(self):
+        """Disabled by default, the FULL set already exposes the bits as sensors."""
+        return False
+
+    async def async_added_to_hass(self):
+        """Subscribe to bit changes pushed by the bridge."""
+        await super().async_added_to_hass()
+        self._is_on = self._bridge.getValue(self._paramName)
+        self.async_on_remove(
+            self._bridge.async_add_listener(self._handle_bridge_update, (self._paramName,))
+        )
+
+    @callback
+    def _handle_bridge_update(self, frame_time):
+        """Take over the flipped bit, write the state only if it changed."""
+        self._is_on = self._bridge.getValue(self._paramName)
+        snapshot = (self._is_on, self.available)
+        if snapshot == self._written:
+            return
+        self._written = snapshot
+        started = time.perf_counter()
+        self.async_write_ha_state()
+        self._bridge.timing().add_state_write(time.perf_counter() - started)
+
+    @property
+    def unique_id(self):
+        """Return the unique id of the binary sensor."""
+        return self._unique_id + self._paramName + "-B"
@@ -5,8 +5,8 @@ Special thanks to @TheRealKillaruna for the original integration
 """
 from __future__ import annotations
 
+import asyncio
 import logging
-import socket
 import telnetlib
 from pathlib import Path
 from typing import Any
@@ -32,8 +32,34 @@ from .const import (
     CONF_LANG_EN,
     CONF_LANG_DE,
     CONF_UNIQUE_ID,
+    CONF_DEADBAND_TEMPERATURE,
+    CONF_DEADBAND_PERCENT,
+    CONF_DEADBAND_DEFAULT,
+    CONF_DEADBAND_CHANNELS,
+    CONF_HEARTBEAT,
+    CONF_STATISTICS_CHANNELS,
+    CONF_ARCHIVE,
+    CONF_ARCHIVE_COMPRESSION,
+    CONF_ARCHIVE_MAX_SIZE,
+    CONF_ARCHIVE_MAX_AGE,
+    DEFAULT_DEADBAND_TEMPERATURE,
+    DEFAULT_DEADBAND_PERCENT,
+    DEFAULT_DEADBAND_DEFAULT,
+    DEFAULT_HEARTBEAT,
+    DEFAULT_ARCHIVE_COMPRESSION,
+    DEFAULT_ARCHIVE_MAX_SIZE,
+    DEFAULT_ARCHIVE_MAX_AGE,
 )
-from .daq_fetcher import async_fetch_daq_template, DaqFetchError
+from .connection import async_get_connection_manager
+from .deadband import parse_deadband_overrides
+from .daq_fetcher import (
+    async_request_daq_template,
+    encode_command,
+    extract_daq_template,
+    DAQ_TERMINATOR,
+    DaqFetchError,
+)
+from .transport import parse_transport
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,6 +72,12 @@ TEMPLATE_NANO_PK_FULL = "NANO_PK_FULL"
 AVAILABLE_TEMPLATES = {
     TEMPLATE_AUTO_FETCH: "Fetch from boiler via telnet ($DAQ DESC)",
     TEMPLATE_NANO_PK_FULL: "Hargassner Nano-PK (Full - 97 channels)",
+    "NANO_V14K": "Hargassner Nano-PK firmware V14K",
+    "NANO_V14L": "Hargassner Nano-PK firmware V14L",
+    "NANO_V14M": "Hargassner Nano-PK firmware V14M",
+    "NANO_V14N": "Hargassner Nano-PK firmware V14N",
+    "NANO_V14N2": "Hargassner Nano-PK firmware V14N2",
+    "NANO_V14O3": "Hargassner Nano-PK firmware V14O3",
     TEMPLATE_CUSTOM: "Custom XML (paste your own)",
 }
 
@@ -145,7 +177,7 @@ class HargassnerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self.async_step_reconfigure_custom_xml()
             if self._template == TEMPLATE_AUTO_FETCH:
                 try:
-                    xml_content = await async_fetch_daq_template(self._host)
+                    xml_content = await self._fetch_template(self._host)
                 except DaqFetchError as err:
                     _LOGGER.error("Failed to fetch DAQ template: %s", err)
                     errors["base"] = "fetch_failed"
@@ -323,7 +355,7 @@ class HargassnerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self.async_step_custom_xml()
             if self._template == TEMPLATE_AUTO_FETCH:
                 try:
-                    xml_content = await async_fetch_daq_template(self._host)
+                    xml_content = await self._fetch_template(self._host)
                 except DaqFetchError as err:
                     _LOGGER.error("Failed to fetch DAQ template: %s", err)
                     errors["base"] = "fetch_failed"
@@ -475,18 +507,38 @@ class HargassnerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     async def _test_connection(self, host: str) -> None:
-        """Test connection to the boiler."""
+        """Test connection to the boiler (any address accepted by transport.py)."""
+        connection = async_get_connection_manager(self.hass).get(host)
+        if connection is not None and connection.connected:
+            # A bridge already holds a session, do not take another telnet slot
+            return
 
-        def _sync_test() -> None:
-            """Synchronous connection test."""
+        try:
+            transport = parse_transport(host)
+            _reader, writer = await asyncio.wait_for(transport.async_open(), timeout=5)
+        except (ValueError, OSError, asyncio.TimeoutError) as err:
+            raise ConnectionError(f"Cannot connect to {host}: {err}") from err
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    async def _fetch_template(self, host: str) -> str:
+        """Fetch the DAQPRJ XML, over the live session of a bridge if there is one."""
+        connection = async_get_connection_manager(self.hass).get(host)
+        if connection is None or not connection.connected:
             try:
-                # Test TCP connection on port 23
-                with socket.create_connection((host, 23), timeout=5):
-                    pass
-            except (socket.timeout, OSError) as err:
-                raise ConnectionError(f"Cannot connect to {host}:23") from err
-
-        await self.hass.async_add_executor_job(_sync_test)
+                transport = parse_transport(host)
+                reader, writer = await asyncio.wait_for(transport.async_open(), timeout=8.0)
+            except (ValueError, OSError, asyncio.TimeoutError) as err:
+                raise DaqFetchError(f"Failed to open connection: {err}") from err
+            return await async_request_daq_template(reader, writer)
+        try:
+            payload = await connection.async_command(encode_command(), DAQ_TERMINATOR, timeout=5.0)
+        except (OSError, asyncio.TimeoutError) as err:
+            raise DaqFetchError(f"Failed to read DAQPRJ response: {err}") from err
+        return extract_daq_template(payload)
 
     async def _load_template(self, template_name: str) -> str:
         """Load a template XML file."""
@@ -570,8 +622,19 @@ class HargassnerOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                parse_deadband_overrides(user_input.get(CONF_DEADBAND_CHANNELS))
+            except ValueError as err:
+                _LOGGER.error("Deadband validation failed: %s", err)
+                errors["base"] = "invalid_deadband"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        band = vol.All(vol.Coerce(float), vol.Range(min=0))
 
         return self.async_show_form(
             step_id="init",
@@ -587,6 +650,47 @@ class HargassnerOptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_LANG,
                         default=self.config_entry.data.get(CONF_LANG, CONF_LANG_EN),
                     ): vol.In([CONF_LANG_EN, CONF_LANG_DE]),
+                    vol.Required(
+                        CONF_DEADBAND_TEMPERATURE,
+                        default=options.get(CONF_DEADBAND_TEMPERATURE, DEFAULT_DEADBAND_TEMPERATURE),
+                    ): band,
+                    vol.Required(
+                        CONF_DEADBAND_PERCENT,
+                        default=options.get(CONF_DEADBAND_PERCENT, DEFAULT_DEADBAND_PERCENT),
+                    ): band,
+                    vol.Required(
+                        CONF_DEADBAND_DEFAULT,
+                        default=options.get(CONF_DEADBAND_DEFAULT, DEFAULT_DEADBAND_DEFAULT),
+                    ): band,
+                    vol.Optional(
+                        CONF_DEADBAND_CHANNELS,
+                        default=options.get(CONF_DEADBAND_CHANNELS, ""),
+                    ): cv.string,
+                    vol.Required(
+                        CONF_HEARTBEAT,
+                        default=options.get(CONF_HEARTBEAT, DEFAULT_HEARTBEAT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_STATISTICS_CHANNELS,
+                        default=options.get(CONF_STATISTICS_CHANNELS, ""),
+                    ): cv.string,
+                    vol.Required(
+                        CONF_ARCHIVE,
+                        default=options.get(CONF_ARCHIVE, False),
+                    ): cv.boolean,
+                    vol.Required(
+                        CONF_ARCHIVE_COMPRESSION,
+                        default=options.get(CONF_ARCHIVE_COMPRESSION, DEFAULT_ARCHIVE_COMPRESSION),
+                    ): vol.In(["zlib", "lzma", "none"]),
+                    vol.Required(
+                        CONF_ARCHIVE_MAX_SIZE,
+                        default=options.get(CONF_ARCHIVE_MAX_SIZE, DEFAULT_ARCHIVE_MAX_SIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Required(
+                        CONF_ARCHIVE_MAX_AGE,
+                        default=options.get(CONF_ARCHIVE_MAX_AGE, DEFAULT_ARCHIVE_MAX_AGE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
                 }
             ),
+            errors=errors,
         )
@@ -0,0 +1,509 @@
+"""Shared telnet sessions to the boilers and their supervisor.
+
+The boiler's telnet server accepts only a few clients, so every bridge that
+talks to the same address (e.g. the legacy YAML platform and the imported
+config entry) shares one session. The address selects the transport, see
+transport.py: TCP on any port, a Unix socket, a serial device or a replayed
+capture. The session frames the stream once and
+hands every complete `pm` line to all subscribers; it lives as long as it has
+subscribers. The config flow reuses a live session for its connection test
+and for fetching the DAQPRJ descriptor instead of opening another socket.
+
+One manager per HA instance supervises all sessions and bridges: it caps the
+number of concurrent connection attempts, reconnects are staggered with
+jitter so a network blip does not make the whole fleet reconnect at once,
+and it reports the aggregate health of all boilers.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from datetime import datetime
+import logging
+import random
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DOMAIN, DATA_CONNECTIONS, BRIDGE_TIMEOUT
+from .framing import PmLineFramer
+from .timing import HargassnerFrameTiming
+from .transport import HargassnerTransport, parse_transport
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HargassnerConnection:
+    """One session to a boiler, fanned out to its subscribers."""
+
+    # Exponential backoff constants
+    _RECONNECT_DELAY_MIN = 1.0  # Start with 1 second
+    _RECONNECT_DELAY_MAX = 30.0  # Max 30 seconds
+    _RECONNECT_BACKOFF_FACTOR = 2.0  # Double each time
+    _RECONNECT_JITTER = 0.25  # Randomize each delay by +/- 25%
+
+    # Maximum number of bytes taken from the socket per read
+    _READ_SIZE = 64 * 1024
+
+    # A read carrying more line breaks than this is a backlog (e.g. after HA
+    # stalled); only its newest frame is handed out then
+    _BACKLOG_LINES = 2
+
+    # Seconds async_stop waits for the cancelled reader task to finish
+    _STOP_TIMEOUT = 5.0
+
+    def __init__(self, manager: HargassnerConnectionManager, transport: HargassnerTransport) -> None:
+        self._manager = manager
+        self._hass = manager.hass
+        self.transport = transport
+        self.key = transport.key
+        self.framer = PmLineFramer()
+        self.timing = HargassnerFrameTiming()  # read and framing, see timing.py
+        self._connected = False
+        self._reader = None
+        self._writer = None
+        self._task = None
+        # (line_callback, state_callback) per subscriber
+        self._subscribers: list[tuple[Callable[[bytes], None], Callable[[bool], None]]] = []
+        # pending command responses: (terminator, buffer, future)
+        self._captures: list[tuple[bytes, bytearray, asyncio.Future]] = []
+        # raw frame archives of the subscribers, fed before backlogs are skipped
+        self._archives: list = []
+
+        # Connection statistics and retry logic
+        self.reconnect_delay = self._RECONNECT_DELAY_MIN
+        self.connection_attempts = 0
+        self.total_reconnects = 0
+        self.last_error = None
+        self.last_attempt = None
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the session is up."""
+        return self._connected
+
+    @property
+    def subscriber_count(self) -> int:
+        """Return the number of subscribers sharing this session."""
+        return len(self._subscribers)
+
+    @callback
+    def async_add_subscriber(
+        self, line_callback: Callable[[bytes], None], state_callback: Callable[[bool], None]
+    ) -> None:
+        """Add a subscriber and start the session with the first one.
+
+        `line_callback(line)` gets every complete pm line, `state_callback(connected)`
+        every change of the connection state (and the current state right away
+        if the session is already up).
+        """
+        self._subscribers.append((line_callback, state_callback))
+        if self._task is None:
+            self._task = self._hass.async_create_background_task(
+                self._async_reader_loop(), f"nano_pk reader {self.key}"
+            )
+        elif self._connected:
+            state_callback(True)
+
+    @callback
+    def async_remove_subscriber(self, line_callback: Callable[[bytes], None]) -> None:
+        """Remove the subscriber registered with `line_callback`."""
+        self._subscribers = [s for s in self._subscribers if s[0] != line_callback]
+
+    @callback
+    def async_add_archive(self, archive) -> CALLBACK_TYPE:
+        """Append every pm line of the session to `archive` (a HargassnerArchiveWriter).
+
+        Unlike the subscribers, the archive also gets the frames passed over
+        when catching up on a backlog. Returns a function that removes the
+        archive again.
+        """
+        self._archives.append(archive)
+
+        @callback
+        def remove_archive() -> None:
+            if archive in self._archives:
+                self._archives.remove(archive)
+
+        return remove_archive
+
+    async def async_stop(self) -> None:
+        """Stop the reader task and close the session.
+
+        Waits at most _STOP_TIMEOUT seconds for the reader task, so that a
+        task which does not finish cannot hang unloading; it is logged and
+        left behind then.
+        """
+        if self._task is not None:
+            task, self._task = self._task, None
+            task.cancel()
+            done, _ = await asyncio.wait((task,), timeout=self._STOP_TIMEOUT)
+            if not done:
+                _LOGGER.error(
+                    "Hargassner %s: Reader task did not stop within %.1fs after cancelling it",
+                    self.key, self._STOP_TIMEOUT
+                )
+            elif not task.cancelled() and task.exception() is not None:
+                _LOGGER.error(
+                    "Hargassner %s: Reader task failed: %s",
+                    self.key, task.exception()
+                )
+        await self._async_close()
+        self._connected = False
+
+    @callback
+    def async_reconnect(self) -> None:
+        """Drop the session, the reader task reconnects with backoff."""
+        self._async_set_connected(False)
+
+    async def async_command(self, command: bytes, until: bytes, timeout: float) -> bytes:
+        """Send `command` over the live session and return the response up to `until`.
+
+        The response is captured from the raw stream while the pm lines keep
+        flowing to the subscribers. Raises ConnectionError if the session is
+        down and asyncio.TimeoutError if the terminator does not arrive.
+        """
+        if not self._connected or self._writer is None:
+            raise ConnectionError(f"No live session to {self.key}")
+        capture = (until, bytearray(), self._hass.loop.create_future())
+        self._captures.append(capture)
+        try:
+            self._writer.write(command)
+            await self._writer.drain()
+            return await asyncio.wait_for(capture[2], timeout=timeout)
+        finally:
+            self._captures.remove(capture)
+
+    @callback
+    def _async_set_connected(self, connected: bool) -> None:
+        """Update the connection flag and publish the change."""
+        if self._connected == connected:
+            return
+        self._connected = connected
+        for _, state_callback in list(self._subscribers):
+            state_callback(connected)
+
+    def _reset_reconnect_delay(self):
+        """Reset reconnect delay after successful connection."""
+        self.reconnect_delay = self._RECONNECT_DELAY_MIN
+        self.connection_attempts = 0
+
+    def _increase_reconnect_delay(self):
+        """Increase reconnect delay using exponential backoff."""
+        self.reconnect_delay = min(
+            self.reconnect_delay * self._RECONNECT_BACKOFF_FACTOR,
+            self._RECONNECT_DELAY_MAX
+        )
+        self.connection_attempts += 1
+
+    def _jittered(self, delay: float) -> float:
+        """Spread `delay` randomly so that sessions do not retry in lockstep."""
+        return delay * random.uniform(1.0 - self._RECONNECT_JITTER, 1.0 + self._RECONNECT_JITTER)
+
+    async def _async_reader_loop(self) -> None:
+        """Connect, read frames as they arrive and reconnect with backoff."""
+        dropped = False
+        while True:
+            if self._cancel_lost():
+                raise asyncio.CancelledError
+            if not self._connected:
+                if dropped:
+                    # all sessions drop together on a network blip, stagger their first retry
+                    dropped = False
+                    await asyncio.sleep(random.uniform(0.0, self._RECONNECT_DELAY_MIN))
+                if not await self._async_connect():
+                    delay = self._jittered(self.reconnect_delay)
+                    _LOGGER.debug(
+                        "Hargassner %s: Waiting %.1fs before next reconnect attempt",
+                        self.key, delay
+                    )
+                    await asyncio.sleep(delay)
+                continue
+            await self._async_read_frames()
+            dropped = not self._connected
+
+    @staticmethod
+    def _cancel_lost() -> bool:
+        """Return True if the running task was cancelled but keeps running.
+
+        asyncio.wait_for before Python 3.12 drops a cancellation that arrives
+        while the awaited read completes; the task is then left "cancelling"
+        and would loop on forever.
+        """
+        task = asyncio.current_task()
+        cancelling = getattr(task, "cancelling", None)  # Python 3.11+
+        return cancelling is not None and cancelling() > 0
+
+    async def _async_read_frames(self) -> None:
+        """Read the next chunk of the stream and hand out its complete frames.
+
+        A frame cut across two reads stays in the framer until its remainder
+        arrives, so it is neither lost nor counted as a miss.
+        """
+        try:
+            started = time.perf_counter()
+            data = await asyncio.wait_for(self._reader.read(self._READ_SIZE), timeout=BRIDGE_TIMEOUT)
+
+            if not data:
+                _LOGGER.warning(
+                    "Hargassner %s: Empty data received, connection might be closed",
+                    self.key
+                )
+                self._async_set_connected(False)
+                return
+
+            received = time.perf_counter()
+            self.timing.read.add(received - started)
+            if self._captures:
+                self._capture(data)
+
+            if data.count(b"\n") > self._BACKLOG_LINES:
+                if self._archives:
+                    # the archives keep every frame, the subscribers get the newest
+                    lines = self.framer.feed(data)
+                    self._archive(lines)
+                    line = lines[-1] if lines else None
+                    skipped = max(len(lines) - 1, 0)
+                    self.framer.skipped += skipped
+                else:
+                    line, skipped = self.framer.feed_latest(data)
+                self.timing.framing.add(time.perf_counter() - received)
+                if skipped:
+                    _LOGGER.debug(
+                        "Hargassner %s: Backlog of %d frames, parsing only the newest",
+                        self.key, skipped + 1
+                    )
+                if line is not None:
+                    self._dispatch(line)
+                return
+
+            lines = self.framer.feed(data)
+            self.timing.framing.add(time.perf_counter() - received)
+            if self._archives:
+                self._archive(lines)
+            for line in lines:
+                self._dispatch(line)
+                if not self._connected:
+                    break
+
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "Hargassner %s: Timeout reading data (%.1fs)",
+                self.key, BRIDGE_TIMEOUT
+            )
+            self._async_set_connected(False)
+        except Exception as e:
+            _LOGGER.error(
+                "Hargassner %s: Connection error: %s",
+                self.key, e, exc_info=True
+            )
+            self.last_error = str(e)
+            self._async_set_connected(False)
+
+    @callback
+    def _dispatch(self, line: bytes) -> None:
+        """Hand one pm line to every subscriber."""
+        for line_callback, _ in list(self._subscribers):
+            line_callback(line)
+
+    def _archive(self, lines: list[bytes]) -> None:
+        """Queue pm lines to every archive, stamped with the time they were read."""
+        now = time.time()
+        for archive in self._archives:
+            for line in lines:
+                archive.append(line, now)
+
+    def _capture(self, data: bytes) -> None:
+        """Append raw data to pending command responses, resolve completed ones."""
+        for until, buffer, future in self._captures:
+            if future.done():
+                continue
+            buffer.extend(data)
+            end = buffer.find(until)
+            if end != -1:
+                future.set_result(bytes(buffer[:end + len(until)]))
+
+    async def _async_connect(self) -> bool:
+        """Open the transport, return True on success."""
+        self.last_attempt = datetime.now()
+        _LOGGER.info(
+            "Hargassner %s: Attempting connection (attempt #%d, delay: %.1fs)",
+            self.key, self.connection_attempts + 1, self.reconnect_delay
+        )
+
+        try:
+            await self._async_close()
+
+            async with self._manager.connect_slot():
+                self._reader, self._writer = await asyncio.wait_for(
+                    self.transport.async_open(),
+                    timeout=BRIDGE_TIMEOUT
+                )
+
+            self.total_reconnects += 1
+            self._reset_reconnect_delay()
+            self.framer.reset()
+            self._async_set_connected(True)
+
+            _LOGGER.info(
+                "Hargassner %s: Successfully connected (total reconnects: %d, subscribers: %d)",
+                self.key, self.total_reconnects, len(self._subscribers)
+            )
+            return True
+
+        except asyncio.TimeoutError:
+            error_msg = f"Connection timeout after {BRIDGE_TIMEOUT}s"
+            _LOGGER.warning("Hargassner %s: %s", self.key, error_msg)
+            self.last_error = error_msg
+            self._increase_reconnect_delay()
+        except OSError as e:
+            error_msg = f"Network error: {e}"
+            _LOGGER.warning("Hargassner %s: %s", self.key, error_msg)
+            self.last_error = error_msg
+            self._increase_reconnect_delay()
+        except Exception as e:
+            error_msg = f"Unexpected error: {e}"
+            _LOGGER.error("Hargassner %s: %s", self.key, error_msg, exc_info=True)
+            self.last_error = error_msg
+            self._increase_reconnect_delay()
+        return False
+
+    async def _async_close(self) -> None:
+        """Close the current connection, if any."""
+        if self._writer:
+            try:
+                self._writer.close()
+                await self._writer.wait_closed()
+            except Exception as e:
+                _LOGGER.debug(
+                    "Hargassner %s: Error closing old connection: %s",
+                    self.key, e
+                )
+        self._reader = None
+        self._writer = None
+
+    def diagnostics(self) -> dict:
+        """Return session diagnostics."""
+        return {
+            "status": "connected" if self._connected else "disconnected",
+            "transport": self.transport.scheme,
+            "subscribers": len(self._subscribers),
+            "total_reconnects": self.total_reconnects,
+            "current_connection_attempts": self.connection_attempts,
+            "reconnect_delay_seconds": round(self.reconnect_delay, 2),
+            "last_connection_error": self.last_error,
+            "last_connection_attempt": self.last_attempt.isoformat() if self.last_attempt else None,
+        }
+
+
+class HargassnerConnectionManager:
+    """Process-wide supervisor of the shared sessions (keyed by address) and bridges."""
+
+    # Maximum number of connection attempts in flight across all boilers
+    MAX_CONCURRENT_CONNECTS = 2
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._connections: dict[str, HargassnerConnection] = {}
+        self._bridges: list = []
+        self._connect_slots = asyncio.Semaphore(self.MAX_CONCURRENT_CONNECTS)
+        self._connects_waiting = 0
+        self._connects_running = 0
+
+    def get(self, address: str) -> HargassnerConnection | None:
+        """Return the session to an address (see transport.py) if one exists."""
+        try:
+            return self._connections.get(parse_transport(address).key)
+        except ValueError:
+            return None
+
+    @asynccontextmanager
+    async def connect_slot(self):
+        """Hold one of the limited connection attempt slots."""
+        self._connects_waiting += 1
+        try:
+            await self._connect_slots.acquire()
+        finally:
+            self._connects_waiting -= 1
+        self._connects_running += 1
+        try:
+            yield
+        finally:
+            self._connects_running -= 1
+            self._connect_slots.release()
+
+    @callback
+    def async_register_bridge(self, bridge) -> CALLBACK_TYPE:
+        """Put a bridge under supervision, returns a function to release it."""
+        self._bridges.append(bridge)
+
+        @callback
+        def unregister() -> None:
+            if bridge in self._bridges:
+                self._bridges.remove(bridge)
+
+        return unregister
+
+    @callback
+    def async_subscribe(
+        self,
+        address: str,
+        line_callback: Callable[[bytes], None],
+        state_callback: Callable[[bool], None],
+    ) -> HargassnerConnection:
+        """Subscribe to the session to an address, opening it if needed.
+
+        Raises ValueError if the address does not select a transport.
+        """
+        transport = parse_transport(address)
+        connection = self._connections.get(transport.key)
+        if connection is None:
+            connection = self._connections[transport.key] = HargassnerConnection(self, transport)
+        connection.async_add_subscriber(line_callback, state_callback)
+        return connection
+
+    async def async_unsubscribe(
+        self, connection: HargassnerConnection, line_callback: Callable[[bytes], None]
+    ) -> None:
+        """Unsubscribe, the last subscriber closes the session."""
+        connection.async_remove_subscriber(line_callback)
+        if connection.subscriber_count:
+            return
+        if self._connections.get(connection.key) is connection:
+            del self._connections[connection.key]
+        await connection.async_stop()
+
+    def health(self) -> dict:
+        """Return the aggregate health of all sessions and bridges."""
+        connections = self._connections.values()
+        return {
+            "sessions": len(self._connections),
+            "sessions_connected": sum(1 for c in connections if c.connected),
+            "bridges": len(self._bridges),
+            "bridges_with_recent_data": sum(1 for b in self._bridges if b.hasRecentData()),
+            "total_reconnects": sum(c.total_reconnects for c in connections),
+            "connects_running": self._connects_running,
+            "connects_waiting": self._connects_waiting,
+            "max_concurrent_connects": self.MAX_CONCURRENT_CONNECTS,
+        }
+
+    def diagnostics(self) -> dict:
+        """Return diagnostics of all sessions and bridges."""
+        return {
+            "health": self.health(),
+            "sessions": {key: connection.diagnostics() for key, connection in self._connections.items()},
+            "bridges": [bridge.get_diagnostics_data() for bridge in self._bridges],
+        }
+
+
+@callback
+def async_get_connection_manager(hass: HomeAssistant) -> HargassnerConnectionManager:
+    """Return the connection manager shared by all bridges."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    manager = domain_data.get(DATA_CONNECTIONS)
+    if manager is None:
+        manager = domain_data[DATA_CONNECTIONS] = HargassnerConnectionManager(hass)
+    return manager
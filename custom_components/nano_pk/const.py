@@ -11,7 +11,31 @@ CONF_LANG = "language"
 CONF_LANG_EN = "EN"
 CONF_LANG_DE = "DE"
 CONF_UNIQUE_ID = "unique_id"
+CONF_DEADBAND_TEMPERATURE = "deadband_temperature"
+CONF_DEADBAND_PERCENT = "deadband_percent"
+CONF_DEADBAND_DEFAULT = "deadband_default"
+CONF_DEADBAND_CHANNELS = "deadband_channels"
+CONF_HEARTBEAT = "heartbeat"
+CONF_STATISTICS_CHANNELS = "statistics_channels"
+CONF_ARCHIVE = "archive"
+CONF_ARCHIVE_COMPRESSION = "archive_compression"
+CONF_ARCHIVE_MAX_SIZE = "archive_max_size"
+CONF_ARCHIVE_MAX_AGE = "archive_max_age"
+
+DEFAULT_DEADBAND_TEMPERATURE = 0.0
+DEFAULT_DEADBAND_PERCENT = 0.0
+DEFAULT_DEADBAND_DEFAULT = 0.0
+DEFAULT_HEARTBEAT = 600
+DEFAULT_ARCHIVE_COMPRESSION = "lzma"
+DEFAULT_ARCHIVE_MAX_SIZE = 64  # MiB per segment
+DEFAULT_ARCHIVE_MAX_AGE = 24  # hours per segment
+ARCHIVE_DIRECTORY = "nano_pk_archive"
+
+DATA_BRIDGES = "bridges"
+DATA_LAYOUTS = "layouts"
+DATA_CONNECTIONS = "connections"
 
 BRIDGE_STATE_OK = "OK"
 BRIDGE_STATE_DISCONNECTED = "Disconnected"
 BRIDGE_TIMEOUT = 2.0
+TELNET_PORT = 23
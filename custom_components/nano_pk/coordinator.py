@@ -0,0 +1,84 @@
+"""Fan-out of decoded frames from one bridge to its entities.
+
+Listeners are indexed by the parameter keys they depend on, so dispatching a
+frame costs one dict lookup per changed key instead of one check per entity.
+Every listener is called at most once per frame, all with the same frame
+timestamp.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+
+class HargassnerCoordinator:
+    """Dispatch changed parameter keys of one bridge to the subscribed entities."""
+
+    def __init__(self) -> None:
+        self._by_key: dict[str, list[Callable]] = {}
+        self._unkeyed: list[Callable] = []
+        self._listeners: list[Callable] = []
+        self._frame_time: datetime | None = None
+
+    @property
+    def frame_time(self) -> datetime | None:
+        """Timestamp of the frame dispatched last."""
+        return self._frame_time
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable, keys: Iterable[str] | None = None
+    ) -> CALLBACK_TYPE:
+        """Register `update_callback(frame_time)` for the given keys.
+
+        Without keys the callback fires for every frame. Returns a function
+        that removes the listener again.
+        """
+        keys = tuple(dict.fromkeys(keys)) if keys is not None else None
+        self._listeners.append(update_callback)
+        if keys is None:
+            self._unkeyed.append(update_callback)
+        else:
+            for key in keys:
+                self._by_key.setdefault(key, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+            if keys is None:
+                if update_callback in self._unkeyed:
+                    self._unkeyed.remove(update_callback)
+                return
+            for key in keys:
+                callbacks = self._by_key.get(key)
+                if callbacks and update_callback in callbacks:
+                    callbacks.remove(update_callback)
+                    if not callbacks:
+                        del self._by_key[key]
+
+        return remove_listener
+
+    @callback
+    def async_dispatch(self, changed: Iterable[str] | None, frame_time: datetime | None) -> int:
+        """Call the listeners of the `changed` keys once, in one batch.
+
+        `changed` None notifies every listener (e.g. on connection changes).
+        Returns the number of listeners called.
+        """
+        self._frame_time = frame_time
+        if changed is None:
+            targets = list(self._listeners)
+        else:
+            targets = dict.fromkeys(self._unkeyed)
+            by_key = self._by_key
+            for key in changed:
+                callbacks = by_key.get(key)
+                if callbacks:
+                    targets.update(dict.fromkeys(callbacks))
+            targets = list(targets)
+        for update_callback in targets:
+            update_callback(frame_time)
+        return len(targets)
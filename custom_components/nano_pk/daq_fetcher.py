@@ -6,14 +6,17 @@ import asyncio
 import re
 from typing import Optional
 
+from .framing import replace_prompt_markers
+
 DEFAULT_COMMAND = "$DAQ DESC"
+DAQ_TERMINATOR = b"</DAQPRJ>"
 _DAQ_PATTERN = re.compile(r"<DAQPRJ[\s\S]+?</DAQPRJ>", re.IGNORECASE)
 _PM_LINE_RE = re.compile(r"\npm [^\n]*")
 
 
-def _clean_telnet_noise(text: str) -> str:
-    """Remove prompt markers injected into the DAQ response."""
-    text = text.replace(">>>", ">").replace("$<<<", "<")
+def _clean_telnet_noise(payload: bytes) -> str:
+    """Restore the brackets of the prompt markers and drop interleaved pm lines."""
+    text = replace_prompt_markers(payload, brackets=True).decode("latin-1", errors="ignore")
     return _PM_LINE_RE.sub("\n", text)
 
 
@@ -21,6 +24,21 @@ class DaqFetchError(RuntimeError):
     """Raised when fetching the DAQ template fails."""
 
 
+def encode_command(command: str = DEFAULT_COMMAND) -> bytes:
+    """Return the telnet bytes of a boiler command."""
+    return command.strip().encode("ascii") + b"\r\n"
+
+
+def extract_daq_template(payload: bytes) -> str:
+    """Extract the DAQPRJ XML from a raw `$DAQ DESC` response."""
+    response = _clean_telnet_noise(payload)
+
+    match = _DAQ_PATTERN.search(response)
+    if not match:
+        raise DaqFetchError("No <DAQPRJ> block found in response")
+    return match.group(0)
+
+
 async def async_fetch_daq_template(
     host: str,
     port: int = 23,
@@ -29,8 +47,6 @@ async def async_fetch_daq_template(
     read_timeout: float = 5.0,
 ) -> str:
     """Fetch the DAQPRJ XML definition from a boiler via telnet."""
-    message = command.strip().encode("ascii") + b"\r\n"
-
     try:
         reader, writer = await asyncio.wait_for(
             asyncio.open_connection(host, port), timeout=connect_timeout
@@ -38,13 +54,23 @@ async def async_fetch_daq_template(
     except Exception as exc:
         raise DaqFetchError(f"Failed to open telnet connection: {exc}") from exc
 
+    return await async_request_daq_template(reader, writer, command, read_timeout)
+
+
+async def async_request_daq_template(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    command: str = DEFAULT_COMMAND,
+    read_timeout: float = 5.0,
+) -> str:
+    """Request the DAQPRJ XML over an open stream and close it afterwards."""
     try:
-        writer.write(message)
+        writer.write(encode_command(command))
         await writer.drain()
 
         try:
             payload = await asyncio.wait_for(
-                reader.readuntil(b"</DAQPRJ>"), timeout=read_timeout
+                reader.readuntil(DAQ_TERMINATOR), timeout=read_timeout
             )
         except asyncio.IncompleteReadError as exc:
             payload = exc.partial
@@ -58,12 +84,7 @@ async def async_fetch_daq_template(
         except Exception:
             pass
 
-    response = _clean_telnet_noise(payload.decode("latin-1", errors="ignore"))
-
-    match = _DAQ_PATTERN.search(response)
-    if not match:
-        raise DaqFetchError("No <DAQPRJ> block found in response")
-    return match.group(0)
+    return extract_daq_template(payload)
 
 
 def fetch_daq_template(
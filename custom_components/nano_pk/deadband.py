@@ -0,0 +1,92 @@
+"""Deadband filtering of decoded analogue channel values.
+
+A channel is only reported as changed when its value leaves the band around
+the value that was last emitted, or when that value is older than the
+heartbeat (max-age). A band of 0 means exact match.
+"""
+
+from __future__ import annotations
+
+from typing import Mapping
+
+_MISSING = object()
+
+
+def parse_deadband_overrides(text: str | None) -> dict[str, float]:
+    """Parse per-channel overrides written as `key=band` separated by ';' or newlines.
+
+    Raises ValueError on malformed entries or negative bands.
+    """
+    overrides: dict[str, float] = {}
+    if not text:
+        return overrides
+    for entry in text.replace("\n", ";").split(";"):
+        entry = entry.strip()
+        if not entry:
+            continue
+        key, sep, band = entry.rpartition("=")
+        key = key.strip()
+        if not sep or not key:
+            raise ValueError(f"Invalid deadband entry '{entry}', expected key=value")
+        try:
+            value = float(band)
+        except ValueError as err:
+            raise ValueError(f"Invalid deadband value in '{entry}'") from err
+        if value < 0:
+            raise ValueError(f"Deadband in '{entry}' must not be negative")
+        overrides[key] = value
+    return overrides
+
+
+class HargassnerDeadbandFilter:
+    """Track emitted values and report the channels that left their band."""
+
+    __slots__ = ("_bands", "_max_age", "_emitted", "_heartbeat")
+
+    def __init__(self, bands: Mapping[str, float], max_age: float | None = None) -> None:
+        """`bands` maps keys to their band (missing keys use exact match).
+
+        `max_age` is the heartbeat in seconds after which a value is emitted
+        even if it stayed in its band; None or 0 disables it.
+        """
+        self._bands = dict(bands)
+        self._max_age = max_age or None
+        self._emitted: dict[str, tuple] = {}
+        self._heartbeat: list[str] = []
+
+    def reset(self) -> None:
+        """Forget all emitted values so the next frame is reported in full."""
+        self._emitted.clear()
+        self._heartbeat = []
+
+    def band(self, key: str) -> float:
+        """Return the band configured for `key`."""
+        return self._bands.get(key, 0.0)
+
+    def heartbeat(self) -> list[str]:
+        """Return the keys the last `changed` call emitted only because of the heartbeat."""
+        return self._heartbeat
+
+    def changed(self, values: Mapping[str, int | float | None], now: float) -> list[str]:
+        """Return the keys of `values` that have to be emitted at time `now`."""
+        emitted = self._emitted
+        bands = self._bands
+        max_age = self._max_age
+        changed = []
+        heartbeat = []
+        for key, value in values.items():
+            last = emitted.get(key, _MISSING)
+            if last is not _MISSING:
+                old, stamp = last
+                if value == old or (
+                    value is not None
+                    and old is not None
+                    and abs(value - old) <= bands.get(key, 0.0)
+                ):
+                    if max_age is None or now - stamp < max_age:
+                        continue
+                    heartbeat.append(key)
+            emitted[key] = (value, now)
+            changed.append(key)
+        self._heartbeat = heartbeat
+        return changed
@@ -0,0 +1,171 @@
+"""Compiled single-pass decoder for Hargassner `pm` frames.
+
+The DAQPRJ layout is turned into a decode plan once, when the message format
+is set. Decoding a frame then is one `itemgetter` call for the analogue
+section and one integer parse per digital word, instead of a method call
+per channel. Analogue values are converted to int/float once, rounded to
+the `dop` (decimal places) of their channel; channels without `dop` keep the
+float as sent. Digital words are kept as
+integer bitsets; comparing them with the previous frame yields the bits that
+actually flipped.
+"""
+
+from __future__ import annotations
+
+from operator import itemgetter
+from typing import Iterable, Sequence
+
+# round() digits of an analogue channel without `dop` attribute: more decimal
+# places than a float has, so round() returns the float unchanged
+_UNROUNDED = 400
+
+
+def parse_word(raw: bytes | str) -> int | None:
+    """Parse a digital word the way the boiler sends it (hex, float fallback)."""
+    try:
+        return int(raw, 16)
+    except Exception:
+        try:
+            return int(float(raw))
+        except Exception:
+            return None
+
+
+def convert_analog(raw: bytes | str, digits: int | None) -> int | float | None:
+    """Convert one analogue field, rounded to `digits` (None for int, see _UNROUNDED)."""
+    try:
+        return round(float(raw), digits)
+    except (ValueError, OverflowError):
+        return None
+
+
+class HargassnerDecodePlan:
+    """Decode plan compiled from the analogue and digital channels of a layout."""
+
+    __slots__ = (
+        "analog_keys",
+        "analog_indices",
+        "analog_digits",
+        "digital_words",
+        "digital_keys",
+        "bits",
+        "keys",
+        "min_length",
+        "_word_indices",
+        "_word_masks",
+        "_analog_getter",
+    )
+
+    def __init__(
+        self,
+        analog: Iterable[tuple[str, int, int]],
+        digital: Iterable[tuple[str, int, int]],
+    ) -> None:
+        """Compile the plan.
+
+        `analog` holds (key, index, dop) and `digital` (key, index, bitmask)
+        triples, both with final (unique) parameter keys and absolute indices
+        into the frame without the leading "pm". A dop of None leaves the
+        channel unrounded.
+        """
+        analog = list(analog)
+        self.analog_keys = tuple(key for key, _, _ in analog)
+        self.analog_indices = tuple(index for _, index, _ in analog)
+        # round(x, None) yields an int, which is what dop='0' channels carry
+        self.analog_digits = tuple(
+            _UNROUNDED if dop is None else dop if dop else None for _, _, dop in analog
+        )
+
+        words: dict[int, list[tuple[str, int]]] = {}
+        for key, index, bitmask in digital:
+            words.setdefault(index, []).append((key, bitmask))
+        self.digital_words = tuple(
+            (index, tuple(bits)) for index, bits in sorted(words.items())
+        )
+        self._word_indices = tuple(index for index, _ in self.digital_words)
+        self._word_masks = tuple(
+            _union_mask(bits) for _, bits in self.digital_words
+        )
+        # key -> (position in the decoded word tuple, bitmask)
+        self.bits = {
+            key: (pos, bitmask)
+            for pos, (_, bits) in enumerate(self.digital_words)
+            for key, bitmask in bits
+        }
+        self.digital_keys = tuple(self.bits)
+
+        self.keys = self.analog_keys + self.digital_keys
+        indices = self.analog_indices + tuple(index for index, _ in self.digital_words)
+        # fields that have to be split out; negative indices (a DAQPRJ id
+        # below 0) count from the end of the frame, which needs all of them
+        if indices and min(indices) < 0:
+            self.min_length = None
+        else:
+            self.min_length = max(indices) + 1 if indices else 0
+
+        if len(self.analog_indices) == 1:
+            single = self.analog_indices[0]
+            self._analog_getter = lambda msg: (msg[single],)
+        elif self.analog_indices:
+            self._analog_getter = itemgetter(*self.analog_indices)
+        else:
+            self._analog_getter = lambda msg: ()
+
+    def decode(
+        self, msg: Sequence[bytes | str]
+    ) -> tuple[dict[str, int | float | None], tuple[int | None, ...]]:
+        """Decode one frame (fields without the leading "pm", bytes or str).
+
+        Returns the typed analogue values by key (None where a field is not
+        numeric) and the digital words as integer bitsets (None where a word
+        could not be parsed).
+        """
+        raw = self._analog_getter(msg)
+        try:
+            numbers = list(map(round, map(float, raw), self.analog_digits))
+        except (ValueError, OverflowError):
+            numbers = list(map(convert_analog, raw, self.analog_digits))
+        values = dict(zip(self.analog_keys, numbers))
+        words = tuple(parse_word(msg[index]) for index in self._word_indices)
+        return values, words
+
+    def bit(self, words: Sequence[int | None], key: str) -> bool | None:
+        """Return the state of digital channel `key` in the decoded words."""
+        pos, bitmask = self.bits[key]
+        word = words[pos]
+        if word is None:
+            return None
+        return (word & bitmask) > 0
+
+    def changed_bits(
+        self,
+        previous: Sequence[int | None] | None,
+        words: Sequence[int | None],
+    ) -> list[str]:
+        """Return the digital keys whose state differs between two frames.
+
+        Every bit counts as changed when there is no previous frame or when a
+        word switches between parseable and unparseable.
+        """
+        if previous is None:
+            return list(self.digital_keys)
+        changed = []
+        for pos, (old, new) in enumerate(zip(previous, words)):
+            if old == new:
+                continue
+            _, bits = self.digital_words[pos]
+            if old is None or new is None:
+                changed.extend(key for key, _ in bits)
+                continue
+            flipped = (old ^ new) & self._word_masks[pos]
+            if flipped:
+                changed.extend(key for key, bitmask in bits if flipped & bitmask)
+        return changed
+
+
+def _union_mask(bits: Iterable[tuple[str, int]]) -> int:
+    """Return the OR of all bitmasks used in one digital word."""
+    mask = 0
+    for _, bitmask in bits:
+        mask |= bitmask
+    return mask
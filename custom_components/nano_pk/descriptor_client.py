@@ -6,6 +6,8 @@ import asyncio
 import logging
 from typing import Final
 
+from .framing import replace_prompt_markers
+
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_PORT: Final[int] = 23
@@ -116,7 +118,7 @@ async def async_fetch_descriptor(
 def _normalise_descriptor(payload: bytes) -> str:
     """Strip transmission markers and decode the descriptor payload."""
 
-    cleaned = payload.replace(b"$<<<", b"<").replace(b">>>", b">")
+    cleaned = replace_prompt_markers(payload, brackets=True)
     cleaned = cleaned.replace(b"\r", b"").strip()
 
     if not cleaned:
@@ -14,6 +14,8 @@ from .const import (
     CONF_PARAMS,
     CONF_LANG,
     CONF_UNIQUE_ID,
+    DATA_LAYOUTS,
+    DATA_CONNECTIONS,
 )
 
 
@@ -38,6 +40,12 @@ async def async_get_integration_diagnostics(hass) -> dict[str, Any]:
         "entities": {},
     }
 
+    if DATA_CONNECTIONS in data:
+        diagnostics["supervisor"] = data[DATA_CONNECTIONS].diagnostics()
+
+    if DATA_LAYOUTS in data:
+        diagnostics["layout_cache"] = data[DATA_LAYOUTS].diagnostics()
+
     # Get all states for nano_pk entities
     for state in hass.states.async_all():
         # Check if entity belongs to this integration
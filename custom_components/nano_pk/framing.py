@@ -0,0 +1,183 @@
+"""Incremental framing of the boiler's telnet stream into `pm` lines.
+
+Socket reads do not respect line boundaries, so a frame may be split across
+two reads. The framer keeps the unconsumed tail of the stream and only hands
+out complete lines; bytes that were already searched for a line break are
+never scanned again.
+
+Lines stay `bytes` all the way into the decode plan: `float()` and `int()`
+accept bytes directly, so there is no UTF-8 decode step that a stray byte
+could break, and only the fields covered by the layout are split out.
+"""
+
+from __future__ import annotations
+
+import re
+
+DEFAULT_MAX_BUFFER = 64 * 1024
+
+# Telnet IAC sequences: subnegotiation, option negotiation, two-byte commands
+_IAC_RE = re.compile(rb"\xff(?:\xfa.*?\xff\xf0|[\xfb-\xfe].|[\xf0-\xf9\xff])", re.DOTALL)
+# Prompt markers the boiler injects into its output, with the bracket each one
+# stands for in the DAQPRJ descriptor
+_PROMPT_MARKERS = {b"$<<<": b"<", b">>>": b">"}
+# Bytes that start telnet noise: IAC and the prompt markers' first bytes
+_NOISE_BYTES = (b"\xff", b"$", b">")
+# Start of a pm line without telnet noise: line.strip().startswith(b"pm")
+_PM_START_RE = re.compile(rb"[ \t\r\x0b\x0c]*pm")
+_PM_AFTER_BREAK_RE = re.compile(rb"\n[ \t\r\x0b\x0c]*pm")
+
+
+def replace_prompt_markers(data: bytes, brackets: bool) -> bytes:
+    """Replace the boiler's prompt markers in `data`.
+
+    In the descriptor a marker stands for the bracket of a tag, `brackets`
+    puts the bracket back (daq_fetcher, descriptor_client). In the pm stream
+    a marker is noise glued to a line and is dropped, so that the line still
+    starts with "pm".
+    """
+    for marker, bracket in _PROMPT_MARKERS.items():
+        if marker in data:
+            data = data.replace(marker, bracket if brackets else b"")
+    return data
+
+
+def clean_telnet_noise(line: bytes) -> bytes:
+    """Remove telnet IAC sequences and prompt markers from one pm line."""
+    if b"\xff" in line:
+        line = _IAC_RE.sub(b"", line)
+    return replace_prompt_markers(line, brackets=False).strip()
+
+
+def split_pm_fields(line: bytes, needed: int | None) -> tuple[list[bytes], int]:
+    """Split a pm line into its data fields.
+
+    Only the first `needed` fields are split out individually, the remainder
+    (if any) stays one trailing chunk and is just counted; `needed` None
+    splits all of them. Returns the fields without the leading "pm" and the
+    total number of data fields.
+    """
+    if needed is None:
+        fields = line.split()
+        del fields[:1]
+        return fields, len(fields)
+    fields = line.split(None, needed + 1)
+    del fields[:1]  # remove first field "pm"
+    count = len(fields)
+    if count > needed:
+        count = needed + len(fields[-1].split())
+    return fields, count
+
+
+class PmLineFramer:
+    """Split a byte stream into complete `pm` lines."""
+
+    __slots__ = (
+        "_buffer", "_scanned", "_max_buffer",
+        "lines", "discarded", "overflows", "cleaned", "skipped",
+    )
+
+    def __init__(self, max_buffer: int = DEFAULT_MAX_BUFFER) -> None:
+        """`max_buffer` bounds the carried-over tail of an unterminated line."""
+        self._buffer = bytearray()
+        self._scanned = 0
+        self._max_buffer = max_buffer
+        self.lines = 0  # complete pm lines handed out
+        self.discarded = 0  # complete lines that were not pm frames
+        self.overflows = 0  # unterminated tails dropped for exceeding max_buffer
+        self.cleaned = 0  # lines that carried telnet noise
+        self.skipped = 0  # pm lines passed over by feed_latest()
+
+    def __len__(self) -> int:
+        """Return the number of buffered bytes not yet framed."""
+        return len(self._buffer)
+
+    def reset(self) -> None:
+        """Drop the buffered tail, e.g. after a reconnect."""
+        self._buffer.clear()
+        self._scanned = 0
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Append `data` and return the complete pm lines it finished.
+
+        Lines are returned without the line terminator, cleaned from telnet
+        noise and with the leading "pm" still in place.
+        """
+        buffer = self._buffer
+        buffer.extend(data)
+        lines = []
+        start = 0
+        end = buffer.find(b"\n", self._scanned)
+        while end != -1:
+            line = self._line(start, end)
+            if line.startswith(b"pm"):
+                lines.append(line)
+            elif line:
+                self.discarded += 1
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        self._consume(start)
+        self.lines += len(lines)
+        return lines
+
+    def feed_latest(self, data: bytes) -> tuple[bytes | None, int]:
+        """Append `data` and return only the newest complete pm line.
+
+        Meant for catching up on a backlog: the buffer is searched backwards
+        from its end, so only the last record is copied and parsed no matter
+        how many frames piled up. The older pm lines are counted (at C speed
+        unless they carry telnet noise) rather than framed. Returns the line
+        (or None) and the number of pm lines skipped.
+        """
+        buffer = self._buffer
+        buffer.extend(data)
+        last = buffer.rfind(b"\n")
+        if last < self._scanned:
+            self._consume(0)
+            return None, 0
+        line = None
+        begin = 0
+        end = last
+        while end >= 0:
+            begin = buffer.rfind(b"\n", 0, end) + 1
+            candidate = self._line(begin, end)
+            if candidate.startswith(b"pm"):
+                line = candidate
+                break
+            if candidate:
+                self.discarded += 1
+            end = begin - 1
+        skipped = self._count_pm(begin)
+        self._consume(last + 1)
+        if line is not None:
+            self.lines += 1
+        self.skipped += skipped
+        return line, skipped
+
+    def _count_pm(self, end: int) -> int:
+        """Count the lines before `end` (a line start) that feed() would hand out."""
+        buffer = self._buffer
+        # single bytes are found at memchr speed, the markers are not
+        if all(buffer.find(byte, 0, end) == -1 for byte in _NOISE_BYTES):
+            first = 1 if _PM_START_RE.match(buffer, 0, end) else 0
+            return first + len(_PM_AFTER_BREAK_RE.findall(buffer, 0, end))
+        lines = bytes(buffer[:end]).split(b"\n")
+        return sum(1 for line in lines if clean_telnet_noise(line).startswith(b"pm"))
+
+    def _line(self, start: int, end: int) -> bytes:
+        """Copy one line out of the buffer and clean it."""
+        line = bytes(self._buffer[start:end])
+        if b"\xff" in line or b">>>" in line or b"$<<<" in line:
+            self.cleaned += 1
+            return clean_telnet_noise(line)
+        return line.strip()
+
+    def _consume(self, length: int) -> None:
+        """Drop `length` framed bytes and bound the remaining tail."""
+        buffer = self._buffer
+        if length:
+            del buffer[:length]
+        if len(buffer) > self._max_buffer:
+            buffer.clear()
+            self.overflows += 1
+        self._scanned = len(buffer)
@@ -6,18 +6,34 @@ Original code by @TheRealKillaruna
 Enhanced error handling and reconnection logic by @Django1982 with Claude Code
 """
 
-import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
-import xml.etree.ElementTree as xml
+from functools import lru_cache
+from pathlib import Path
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
-from .const import BRIDGE_STATE_OK, BRIDGE_STATE_DISCONNECTED, BRIDGE_TIMEOUT
+from homeassistant.util import dt as dt_util
+from .const import BRIDGE_STATE_OK, BRIDGE_STATE_DISCONNECTED, DEFAULT_HEARTBEAT
+from .connection import async_get_connection_manager
+from .coordinator import HargassnerCoordinator
+from .deadband import HargassnerDeadbandFilter
+from .decoder import HargassnerDecodePlan
+from .framing import split_pm_fields
+from .layout import parse_layout
+from .long_term_statistics import HargassnerStatistics, async_write_statistics
+from .timing import HargassnerFrameTiming
 
 _LOGGER = logging.getLogger(__name__)
 
 
 
 class HargassnerMessageTemplates:
+    """Names of the built-in DAQPRJ templates.
+
+    The templates live in the msgformats directory as <name>.xml and are only
+    read when a configuration actually refers to one of them.
+    """
 
     NANO_V14K = "NANO_V14K"
     NANO_V14L = "NANO_V14L"
@@ -26,14 +42,20 @@ class HargassnerMessageTemplates:
     NANO_V14N2 = "NANO_V14N2"
     NANO_V14O3 = "NANO_V14O3"
 
-    DICT = {
-        NANO_V14K : "<DAQPRJ><ANALOG><CHANNEL id='0' name='ZK' unit=''/><CHANNEL id='1' name='O2' unit='%'/><CHANNEL id='2' name='O2soll' unit='%'/><CHANNEL id='3' name='TK' unit='°C'/><CHANNEL id='4' name='TKsoll' unit='°C'/><CHANNEL id='5' name='TRG' unit='°C'/><CHANNEL id='6' name='SZist' unit='%'/><CHANNEL id='7' name='SZsoll' unit='%'/><CHANNEL id='8' name='Leistung' unit='%'/><CHANNEL id='9' name='ESsoll' unit='%'/><CHANNEL id='10' name='I Es' unit='mA'/><CHANNEL id='11' name='I Ra' unit='mA'/><CHANNEL id='12' name='I Aa' unit='mA'/><CHANNEL id='13' name='I Sr' unit='mA'/><CHANNEL id='14' name='I Rein' unit='mA'/><CHANNEL id='15' name='Taus' unit='°C'/><CHANNEL id='16' name='TA Gem.' unit='°C'/><CHANNEL id='17' name='TPo' unit='°C'/><CHANNEL id='18' name='TPmo' unit='°C'/><CHANNEL id='19' name='TPm' unit='°C'/><CHANNEL id='20' name='TPmu' unit='°C'/><CHANNEL id='21' name='TPu' unit='°C'/><CHANNEL id='22' name='TFW' unit='°C'/><CHANNEL id='23' name='TRL' unit='°C'/><CHANNEL id='24' name='TRLsoll' unit='°C'/><CHANNEL id='25' name='Tplat' unit='°C'/><CHANNEL id='26' name='BRT' unit='°C'/><CHANNEL id='27' name='Regler K' unit=''/><CHANNEL id='28' name='KeBrstScale' unit='%'/><CHANNEL id='29' name='ESRegler' unit='%'/><CHANNEL id='30' name='BLDC_ES ist' unit='rpm'/><CHANNEL id='31' name='BLDC_ES soll' unit='rpm'/><CHANNEL id='32' name='LZ ES seit Füll.' unit='Min'/><CHANNEL id='33' name='LZ ES seit Ent.' unit='Min'/><CHANNEL id='34' name='Anzahl Entasch.' unit=''/><CHANNEL id='35' name='Anzahl SR Beweg.' unit=''/><CHANNEL id='36' name='Heiz P Lambda' unit='W'/><CHANNEL id='37' name='Heiz U Lambda' unit='V'/><CHANNEL id='38' name='Heiz I Lambda' unit='mA'/><CHANNEL id='39' name='Sens U Lambda' unit='mV'/><CHANNEL id='40' name='PuffZustand' unit=''/><CHANNEL id='41' name='Puffer_soll' unit='°C'/><CHANNEL id='42' name='Puff Füllgrad' unit='%'/><CHANNEL id='43' name='max.Leist.P3F.HT' unit='%'/><CHANNEL id='44' name='Spreizung' unit='°C'/><CHANNEL id='45' name='AIN17' unit='V'/><CHANNEL id='46' name='Lagerstand' unit='kg'/><CHANNEL id='47' name='Verbrauchszähler' unit='kg'/><CHANNEL id='48' name='UsePos' unit=''/><CHANNEL id='49' name='Störungs Nr' unit=''/><CHANNEL id='50' name='TVL_A' unit='°C'/><CHANNEL id='51' name='TVLs_A' unit='°C'/><CHANNEL id='52' name='TRA_A' unit='°C'/><CHANNEL id='53' name='TRs_A' unit='°C'/><CHANNEL id='54' name='HKZustand_A' unit=''/><CHANNEL id='55' name='FRA Zustand' unit=''/><CHANNEL id='56' name='TVL_1' unit='°C'/><CHANNEL id='57' name='TVLs_1' unit='°C'/><CHANNEL id='58' name='TRA_1' unit='°C'/><CHANNEL id='59' name='TRs_1' unit='°C'/><CHANNEL id='60' name='HKZustand_1' unit=''/><CHANNEL id='61' name='FR1 Zustand' unit=''/><CHANNEL id='62' name='TVL_2' unit='°C'/><CHANNEL id='63' name='TVLs_2' unit='°C'/><CHANNEL id='64' name='TRA_2' unit='°C'/><CHANNEL id='65' name='TRs_2' unit='°C'/><CHANNEL id='66' name='HKZustand_2' unit=''/><CHANNEL id='67' name='FR2 Zustand' unit=''/><CHANNEL id='68' name='TVL_3' unit='°C'/><CHANNEL id='69' name='TVLs_3' unit='°C'/><CHANNEL id='70' name='TRA_3' unit='°C'/><CHANNEL id='71' name='TRs_3' unit='°C'/><CHANNEL id='72' name='HKZustand_3' unit=''/><CHANNEL id='73' name='FR3 Zustand' unit=''/><CHANNEL id='74' name='TVL_4' unit='°C'/><CHANNEL id='75' name='TVLs_4' unit='°C'/><CHANNEL id='76' name='TRA_4' unit='°C'/><CHANNEL id='77' name='TRs_4' unit='°C'/><CHANNEL id='78' name='HKZustand_4' unit=''/><CHANNEL id='79' name='FR4 Zustand' unit=''/><CHANNEL id='80' name='TVL_5' unit='°C'/><CHANNEL id='81' name='TVLs_5' unit='°C'/><CHANNEL id='82' name='TRA_5' unit='°C'/><CHANNEL id='83' name='TRs_5' unit='°C'/><CHANNEL id='84' name='HKZustand_5' unit=''/><CHANNEL id='85' name='FR5 Zustand' unit=''/><CHANNEL id='86' name='TVL_6' unit='°C'/><CHANNEL id='87' name='TVLs_6' unit='°C'/><CHANNEL id='88' name='TRA_6' unit='°C'/><CHANNEL id='89' name='TRs_6' unit='°C'/><CHANNEL id='90' name='HKZustand_6' unit=''/><CHANNEL id='91' name='FR6 Zustand' unit=''/><CHANNEL id='92' name='TBA' unit='°C'/><CHANNEL id='93' name='TBs_A' unit='°C'/><CHANNEL id='94' name='BoiZustand_A' unit=''/><CHANNEL id='95' name='TB1' unit='°C'/><CHANNEL id='96' name='TBs_1' unit='°C'/><CHANNEL id='97' name='BoiZustand_1' unit=''/><CHANNEL id='98' name='TB2' unit='°C'/><CHANNEL id='99' name='TBs_2' unit='°C'/><CHANNEL id='100' name='BoiZustand_2' unit=''/><CHANNEL id='101' name='TB3' unit='°C'/><CHANNEL id='102' name='TBs_3' unit='°C'/><CHANNEL id='103' name='BoiZustand_3' unit=''/><CHANNEL id='104' name='Ext.HK Soll' unit=''/><CHANNEL id='105' name='Ext.HK Soll_2' unit=''/><CHANNEL id='106' name='Ext.HK Soll_3' unit=''/><CHANNEL id='107' name='Höchste Anf' unit=''/><CHANNEL id='108' name='Anf. HKR0' unit='°C'/><CHANNEL id='109' name='Anf. HKR1' unit='°C'/><CHANNEL id='110' name='Anf. HKR2' unit='°C'/><CHANNEL id='111' name='Anf. HKR3' unit='°C'/><CHANNEL id='112' name='Anf. HKR4' unit='°C'/><CHANNEL id='113' name='Anf. HKR5' unit='°C'/><CHANNEL id='114' name='Anf. HKR6' unit='°C'/><CHANNEL id='115' name='Anf. HKR7' unit='°C'/><CHANNEL id='116' name='Anf. HKR8' unit='°C'/><CHANNEL id='117' name='Anf. HKR9' unit='°C'/><CHANNEL id='118' name='Anf. HKR10' unit='°C'/><CHANNEL id='119' name='Anf. HKR11' unit='°C'/><CHANNEL id='120' name='Anf. HKR12' unit='°C'/><CHANNEL id='121' name='Anf. HKR13' unit='°C'/><CHANNEL id='122' name='Anf. HKR14' unit='°C'/><CHANNEL id='123' name='Anf. HKR15' unit='°C'/><CHANNEL id='124' name='KaskSollTmp_1' unit='°C'/><CHANNEL id='125' name='KaskSollTmp_2' unit='°C'/><CHANNEL id='126' name='KaskSollTmp_3' unit='°C'/><CHANNEL id='127' name='KaskSollTmp_4' unit='°C'/><CHANNEL id='128' name='KaskIstTmp_1' unit='°C'/><CHANNEL id='129' name='KaskIstTmp_2' unit='°C'/><CHANNEL id='130' name='KaskIstTmp_3' unit='°C'/><CHANNEL id='131' name='KaskIstTmp_4' unit='°C'/><CHANNEL id='132' name='T Spülung' unit='°C'/><CHANNEL id='133' name='DiffReg S1' unit='°C'/><CHANNEL id='134' name='DiffReg S2' unit='°C'/><CHANNEL id='135' name='TVG' unit='°C'/><CHANNEL id='136' name='WMZ_1_TVL' unit='°C'/><CHANNEL id='137' name='WMZ_1_TRL' unit='°C'/><CHANNEL id='138' name='WMZ_1_PWR' unit='kW'/><CHANNEL id='139' name='WMZ_1_FLOW' unit='l/h'/><CHANNEL id='140' name='WMZ_2_TVL' unit='°C'/><CHANNEL id='141' name='WMZ_2_TRL' unit='°C'/><CHANNEL id='142' name='WMZ_2_PWR' unit='kW'/><CHANNEL id='143' name='WMZ_2_FLOW' unit='l/h'/><CHANNEL id='144' name='WMZ_3_TVL' unit='°C'/><CHANNEL id='145' name='WMZ_3_TRL' unit='°C'/><CHANNEL id='146' name='WMZ_3_PWR' unit='kW'/><CHANNEL id='147' name='WMZ_3_FLOW' unit='l/h'/><CHANNEL id='148' name='WMZ_4_TVL' unit='°C'/><CHANNEL id='149' name='WMZ_4_TRL' unit='°C'/><CHANNEL id='150' name='WMZ_4_PWR' unit='kW'/><CHANNEL id='151' name='WMZ_4_FLOW' unit='l/h'/><CHANNEL id='152' name='WMZ_5_TVL' unit='°C'/><CHANNEL id='153' name='WMZ_5_TRL' unit='°C'/><CHANNEL id='154' name='WMZ_5_PWR' unit='kW'/><CHANNEL id='155' name='WMZ_5_FLOW' unit='l/h'/><CHANNEL id='156' name='WMZ_6_TVL' unit='°C'/><CHANNEL id='157' name='WMZ_6_TRL' unit='°C'/><CHANNEL id='158' name='WMZ_6_PWR' unit='kW'/><CHANNEL id='159' name='WMZ_6_FLOW' unit='l/h'/><CHANNEL id='160' name='FWS1 Anf.' unit='°C'/><CHANNEL id='161' name='FWS1 Pumpe' unit='%'/><CHANNEL id='162' name='FWS1 Leist' unit='kW'/><CHANNEL id='163' name='FWS1 T' unit='°C'/><CHANNEL id='164' name='FWS1 D' unit='l/min'/><CHANNEL id='165' name='FWS2 Anf.' unit='°C'/><CHANNEL id='166' name='FWS2 Pumpe' unit='%'/><CHANNEL id='167' name='FWS2 Leist' unit='kW'/><CHANNEL id='168' name='FWS2 T' unit='°C'/><CHANNEL id='169' name='FWS2 D' unit='l/min'/><CHANNEL id='170' name='FWS3 Anf.' unit='°C'/><CHANNEL id='171' name='FWS3 Pumpe' unit='%'/><CHANNEL id='172' name='FWS3 Leist' unit='kW'/><CHANNEL id='173' name='FWS3 T' unit='°C'/><CHANNEL id='174' name='FWS3 D' unit='l/min'/><CHANNEL id='175' name='FWS4 Anf.' unit='°C'/><CHANNEL id='176' name='FWS4 Pumpe' unit='%'/><CHANNEL id='177' name='FWS4 Leist' unit='kW'/><CHANNEL id='178' name='FWS4 T' unit='°C'/><CHANNEL id='179' name='FWS4 D' unit='l/min'/><CHANNEL id='180' name='DiffReg2 S3' unit='°C'/><CHANNEL id='181' name='DiffReg2 S4' unit='°C'/></ANALOG><DIGITAL><CHANNEL id='0' bit='0' name='Stb'/><CHANNEL id='0' bit='1' name='Fuellstand'/><CHANNEL id='0' bit='3' name='Es Rein Endl'/><CHANNEL id='0' bit='4' name='HKPA'/><CHANNEL id='0' bit='5' name='MAA'/><CHANNEL id='0' bit='6' name='MAZ'/><CHANNEL id='0' bit='7' name='HKP1'/><CHANNEL id='0' bit='8' name='M1A'/><CHANNEL id='0' bit='9' name='M1Z'/><CHANNEL id='0' bit='10' name='HKP2'/><CHANNEL id='0' bit='11' name='M2A'/><CHANNEL id='0' bit='12' name='M2Z'/><CHANNEL id='0' bit='13' name='Störung'/><CHANNEL id='1' bit='0' name='L Heiz.'/><CHANNEL id='1' bit='1' name='Z Heiz.'/><CHANNEL id='1' bit='2' name='Z Geb.'/><CHANNEL id='1' bit='3' name='AA Run'/><CHANNEL id='1' bit='4' name='AA Dir'/><CHANNEL id='1' bit='5' name='ES Run'/><CHANNEL id='1' bit='6' name='ES Dir'/><CHANNEL id='1' bit='7' name='AS Saug'/><CHANNEL id='1' bit='8' name='AS RA Run'/><CHANNEL id='1' bit='9' name='AS RA Dir'/><CHANNEL id='1' bit='10' name='Rein En'/><CHANNEL id='1' bit='11' name='Rein Run'/><CHANNEL id='1' bit='12' name='RLm_auf'/><CHANNEL id='1' bit='13' name='RLm_zu'/><CHANNEL id='1' bit='14' name='RL Pumpe'/><CHANNEL id='2' bit='0' name='BPA'/><CHANNEL id='2' bit='1' name='BP1'/><CHANNEL id='2' bit='2' name='BP2'/><CHANNEL id='2' bit='3' name='BP3'/><CHANNEL id='2' bit='4' name='BZPA'/><CHANNEL id='2' bit='5' name='BZP1'/><CHANNEL id='2' bit='6' name='BZP2'/><CHANNEL id='2' bit='7' name='BZP3'/><CHANNEL id='2' bit='8' name='EHKP'/><CHANNEL id='2' bit='9' name='EHKP2'/><CHANNEL id='2' bit='10' name='EHKP3'/><CHANNEL id='2' bit='11' name='EHK Anf'/><CHANNEL id='2' bit='12' name='EHK Anf2'/><CHANNEL id='2' bit='13' name='EHK Anf3'/><CHANNEL id='3' bit='0' name='HKP3'/><CHANNEL id='3' bit='1' name='M3A'/><CHANNEL id='3' bit='2' name='M3Z'/><CHANNEL id='3' bit='3' name='HKP4'/><CHANNEL id='3' bit='4' name='M4A'/><CHANNEL id='3' bit='5' name='M4Z'/><CHANNEL id='3' bit='6' name='HKP5'/><CHANNEL id='3' bit='7' name='M5A'/><CHANNEL id='3' bit='8' name='M5Z'/><CHANNEL id='3' bit='9' name='HKP6'/><CHANNEL id='3' bit='10' name='M6A'/><CHANNEL id='3' bit='11' name='M6Z'/><CHANNEL id='3' bit='13' name='PuffP'/><CHANNEL id='3' bit='14' name='Entasch gesp.'/><CHANNEL id='3' bit='15' name='ATW'/><CHANNEL id='4' bit='8' name='KASK1 Run'/><CHANNEL id='4' bit='9' name='KASK2 Run'/><CHANNEL id='4' bit='10' name='KASK3 Run'/><CHANNEL id='4' bit='11' name='KASK4 Run'/><CHANNEL id='4' bit='12' name='FW Freig.'/><CHANNEL id='4' bit='13' name='sAS Anf Füll'/><CHANNEL id='4' bit='14' name='HKV'/><CHANNEL id='4' bit='15' name='FLP'/><CHANNEL id='5' bit='5' name='Netztrafo'/><CHANNEL id='5' bit='6' name='Netzrelais'/><CHANNEL id='5' bit='7' name='Lagerraum'/><CHANNEL id='5' bit='8' name='Aschebox'/><CHANNEL id='6' bit='0' name='gFlP'/><CHANNEL id='6' bit='1' name='gFlM auf'/><CHANNEL id='6' bit='2' name='gFlM zu'/><CHANNEL id='6' bit='4' name='Spülung Aktiv'/><CHANNEL id='7' bit='0' name='DReg P1'/><CHANNEL id='7' bit='1' name='DReg P2'/><CHANNEL id='7' bit='2' name='DReg Mi auf'/><CHANNEL id='7' bit='3' name='DReg Mi zu'/><CHANNEL id='7' bit='4' name='Oel Out'/><CHANNEL id='7' bit='5' name='DReg2 P1'/><CHANNEL id='7' bit='6' name='DReg2 P2'/><CHANNEL id='7' bit='7' name='DReg2 Mi auf'/><CHANNEL id='7' bit='8' name='DReg2 Mi zu'/></DIGITAL></DAQPRJ>",
-        NANO_V14L : "<DAQPRJ><ANALOG><CHANNEL id='0' name='ZK' unit=''/><CHANNEL id='1' name='O2' unit='%'/><CHANNEL id='2' name='O2soll' unit='%'/><CHANNEL id='3' name='TK' unit='°C'/><CHANNEL id='4' name='TKsoll' unit='°C'/><CHANNEL id='5' name='TRG' unit='°C'/><CHANNEL id='6' name='SZist' unit='%'/><CHANNEL id='7' name='SZsoll' unit='%'/><CHANNEL id='8' name='Leistung' unit='%'/><CHANNEL id='9' name='ESsoll' unit='%'/><CHANNEL id='10' name='I Es' unit='mA'/><CHANNEL id='11' name='I Ra' unit='mA'/><CHANNEL id='12' name='I Aa' unit='mA'/><CHANNEL id='13' name='I Sr' unit='mA'/><CHANNEL id='14' name='I Rein' unit='mA'/><CHANNEL id='15' name='Taus' unit='°C'/><CHANNEL id='16' name='TA Gem.' unit='°C'/><CHANNEL id='17' name='TPo' unit='°C'/><CHANNEL id='18' name='TPmo' unit='°C'/><CHANNEL id='19' name='TPm' unit='°C'/><CHANNEL id='20' name='TPmu' unit='°C'/><CHANNEL id='21' name='TPu' unit='°C'/><CHANNEL id='22' name='TFW' unit='°C'/><CHANNEL id='23' name='TRL' unit='°C'/><CHANNEL id='24' name='TRLsoll' unit='°C'/><CHANNEL id='25' name='Tplat' unit='°C'/><CHANNEL id='26' name='BRT' unit='°C'/><CHANNEL id='27' name='Regler K' unit=''/><CHANNEL id='28' name='KeBrstScale' unit='%'/><CHANNEL id='29' name='ESRegler' unit='%'/><CHANNEL id='30' name='BLDC_ES ist' unit='rpm'/><CHANNEL id='31' name='BLDC_ES soll' unit='rpm'/><CHANNEL id='32' name='LZ ES seit Füll.' unit='Min'/><CHANNEL id='33' name='LZ ES seit Ent.' unit='Min'/><CHANNEL id='34' name='Anzahl Entasch.' unit=''/><CHANNEL id='35' name='Anzahl SR Beweg.' unit=''/><CHANNEL id='36' name='Heiz P Lambda' unit='W'/><CHANNEL id='37' name='Heiz U Lambda' unit='V'/><CHANNEL id='38' name='Heiz I Lambda' unit='mA'/><CHANNEL id='39' name='Sens U Lambda' unit='mV'/><CHANNEL id='40' name='PuffZustand' unit=''/><CHANNEL id='41' name='Puffer_soll' unit='°C'/><CHANNEL id='42' name='Puff Füllgrad' unit='%'/><CHANNEL id='43' name='max.Leist.P3F.HT' unit='%'/><CHANNEL id='44' name='Spreizung' unit='°C'/><CHANNEL id='45' name='AIN17' unit='V'/><CHANNEL id='46' name='Lagerstand' unit='kg'/><CHANNEL id='47' name='Verbrauchszähler' unit='kg'/><CHANNEL id='48' name='UsePos' unit=''/><CHANNEL id='49' name='Störungs Nr' unit=''/><CHANNEL id='50' name='TVL_A' unit='°C'/><CHANNEL id='51' name='TVLs_A' unit='°C'/><CHANNEL id='52' name='TRA_A' unit='°C'/><CHANNEL id='53' name='TRs_A' unit='°C'/><CHANNEL id='54' name='HKZustand_A' unit=''/><CHANNEL id='55' name='FRA Zustand' unit=''/><CHANNEL id='56' name='TVL_1' unit='°C'/><CHANNEL id='57' name='TVLs_1' unit='°C'/><CHANNEL id='58' name='TRA_1' unit='°C'/><CHANNEL id='59' name='TRs_1' unit='°C'/><CHANNEL id='60' name='HKZustand_1' unit=''/><CHANNEL id='61' name='FR1 Zustand' unit=''/><CHANNEL id='62' name='TVL_2' unit='°C'/><CHANNEL id='63' name='TVLs_2' unit='°C'/><CHANNEL id='64' name='TRA_2' unit='°C'/><CHANNEL id='65' name='TRs_2' unit='°C'/><CHANNEL id='66' name='HKZustand_2' unit=''/><CHANNEL id='67' name='FR2 Zustand' unit=''/><CHANNEL id='68' name='TVL_3' unit='°C'/><CHANNEL id='69' name='TVLs_3' unit='°C'/><CHANNEL id='70' name='TRA_3' unit='°C'/><CHANNEL id='71' name='TRs_3' unit='°C'/><CHANNEL id='72' name='HKZustand_3' unit=''/><CHANNEL id='73' name='FR3 Zustand' unit=''/><CHANNEL id='74' name='TVL_4' unit='°C'/><CHANNEL id='75' name='TVLs_4' unit='°C'/><CHANNEL id='76' name='TRA_4' unit='°C'/><CHANNEL id='77' name='TRs_4' unit='°C'/><CHANNEL id='78' name='HKZustand_4' unit=''/><CHANNEL id='79' name='FR4 Zustand' unit=''/><CHANNEL id='80' name='TVL_5' unit='°C'/><CHANNEL id='81' name='TVLs_5' unit='°C'/><CHANNEL id='82' name='TRA_5' unit='°C'/><CHANNEL id='83' name='TRs_5' unit='°C'/><CHANNEL id='84' name='HKZustand_5' unit=''/><CHANNEL id='85' name='FR5 Zustand' unit=''/><CHANNEL id='86' name='TVL_6' unit='°C'/><CHANNEL id='87' name='TVLs_6' unit='°C'/><CHANNEL id='88' name='TRA_6' unit='°C'/><CHANNEL id='89' name='TRs_6' unit='°C'/><CHANNEL id='90' name='HKZustand_6' unit=''/><CHANNEL id='91' name='FR6 Zustand' unit=''/><CHANNEL id='92' name='TBA' unit='°C'/><CHANNEL id='93' name='TBs_A' unit='°C'/><CHANNEL id='94' name='BoiZustand_A' unit=''/><CHANNEL id='95' name='TB1' unit='°C'/><CHANNEL id='96' name='TBs_1' unit='°C'/><CHANNEL id='97' name='BoiZustand_1' unit=''/><CHANNEL id='98' name='TB2' unit='°C'/><CHANNEL id='99' name='TBs_2' unit='°C'/><CHANNEL id='100' name='BoiZustand_2' unit=''/><CHANNEL id='101' name='TB3' unit='°C'/><CHANNEL id='102' name='TBs_3' unit='°C'/><CHANNEL id='103' name='BoiZustand_3' unit=''/><CHANNEL id='104' name='Ext.HK Soll' unit=''/><CHANNEL id='105' name='Ext.HK Soll_2' unit=''/><CHANNEL id='106' name='Ext.HK Soll_3' unit=''/><CHANNEL id='107' name='Höchste Anf' unit=''/><CHANNEL id='108' name='Anf. HKR0' unit='°C'/><CHANNEL id='109' name='Anf. HKR1' unit='°C'/><CHANNEL id='110' name='Anf. HKR2' unit='°C'/><CHANNEL id='111' name='Anf. HKR3' unit='°C'/><CHANNEL id='112' name='Anf. HKR4' unit='°C'/><CHANNEL id='113' name='Anf. HKR5' unit='°C'/><CHANNEL id='114' name='Anf. HKR6' unit='°C'/><CHANNEL id='115' name='Anf. HKR7' unit='°C'/><CHANNEL id='116' name='Anf. HKR8' unit='°C'/><CHANNEL id='117' name='Anf. HKR9' unit='°C'/><CHANNEL id='118' name='Anf. HKR10' unit='°C'/><CHANNEL id='119' name='Anf. HKR11' unit='°C'/><CHANNEL id='120' name='Anf. HKR12' unit='°C'/><CHANNEL id='121' name='Anf. HKR13' unit='°C'/><CHANNEL id='122' name='Anf. HKR14' unit='°C'/><CHANNEL id='123' name='Anf. HKR15' unit='°C'/><CHANNEL id='124' name='T Spülung' unit='°C'/><CHANNEL id='125' name='DiffReg S1' unit='°C'/><CHANNEL id='126' name='DiffReg S2' unit='°C'/><CHANNEL id='127' name='TVG' unit='°C'/><CHANNEL id='128' name='DiffReg2 S3' unit='°C'/><CHANNEL id='129' name='DiffReg2 S4' unit='°C'/><CHANNEL id='130' name='U Netzteil' unit='mV'/><CHANNEL id='131' name='TBB' unit='°C'/><CHANNEL id='132' name='TBs_B' unit='°C'/><CHANNEL id='133' name='BoiZustand_B' unit=''/><CHANNEL id='134' name='TVL_B' unit='°C'/><CHANNEL id='135' name='TVLs_B' unit='°C'/><CHANNEL id='136' name='TRB' unit='°C'/><CHANNEL id='137' name='TRs_B' unit='°C'/><CHANNEL id='138' name='HKZustand_B' unit=''/><CHANNEL id='139' name='TRA_B' unit='°C'/><CHANNEL id='140' name='FRB Zustand' unit=''/></ANALOG><DIGITAL><CHANNEL id='0' bit='0' name='Stb'/><CHANNEL id='0' bit='1' name='Fuellstand'/><CHANNEL id='0' bit='3' name='Es Rein Endl'/><CHANNEL id='0' bit='4' name='HKPA'/><CHANNEL id='0' bit='5' name='MAA'/><CHANNEL id='0' bit='6' name='MAZ'/><CHANNEL id='0' bit='7' name='HKP1'/><CHANNEL id='0' bit='8' name='M1A'/><CHANNEL id='0' bit='9' name='M1Z'/><CHANNEL id='0' bit='10' name='HKP2'/><CHANNEL id='0' bit='11' name='M2A'/><CHANNEL id='0' bit='12' name='M2Z'/><CHANNEL id='0' bit='13' name='Störung'/><CHANNEL id='1' bit='0' name='L Heiz.'/><CHANNEL id='1' bit='1' name='Z Heiz.'/><CHANNEL id='1' bit='2' name='Z Geb.'/><CHANNEL id='1' bit='3' name='AA Run'/><CHANNEL id='1' bit='4' name='AA Dir'/><CHANNEL id='1' bit='5' name='ES Run'/><CHANNEL id='1' bit='6' name='ES Dir'/><CHANNEL id='1' bit='7' name='AS Saug'/><CHANNEL id='1' bit='8' name='AS RA Run'/><CHANNEL id='1' bit='9' name='AS RA Dir'/><CHANNEL id='1' bit='10' name='Rein En'/><CHANNEL id='1' bit='11' name='Rein Run'/><CHANNEL id='1' bit='12' name='RLm_auf'/><CHANNEL id='1' bit='13' name='RLm_zu'/><CHANNEL id='1' bit='14' name='RL Pumpe'/><CHANNEL id='2' bit='0' name='BPA'/><CHANNEL id='2' bit='1' name='BP1'/><CHANNEL id='2' bit='2' name='BP2'/><CHANNEL id='2' bit='3' name='BP3'/><CHANNEL id='2' bit='4' name='BZPA'/><CHANNEL id='2' bit='5' name='BZP1'/><CHANNEL id='2' bit='6' name='BZP2'/><CHANNEL id='2' bit='7' name='BZP3'/><CHANNEL id='2' bit='8' name='EHKP'/><CHANNEL id='2' bit='9' name='EHKP2'/><CHANNEL id='2' bit='10' name='EHKP3'/><CHANNEL id='2' bit='11' name='EHK Anf'/><CHANNEL id='2' bit='12' name='EHK Anf2'/><CHANNEL id='2' bit='13' name='EHK Anf3'/><CHANNEL id='3' bit='0' name='HKP3'/><CHANNEL id='3' bit='1' name='M3A'/><CHANNEL id='3' bit='2' name='M3Z'/><CHANNEL id='3' bit='3' name='HKP4'/><CHANNEL id='3' bit='4' name='M4A'/><CHANNEL id='3' bit='5' name='M4Z'/><CHANNEL id='3' bit='6' name='HKP5'/><CHANNEL id='3' bit='7' name='M5A'/><CHANNEL id='3' bit='8' name='M5Z'/><CHANNEL id='3' bit='9' name='HKP6'/><CHANNEL id='3' bit='10' name='M6A'/><CHANNEL id='3' bit='11' name='M6Z'/><CHANNEL id='3' bit='13' name='PuffP'/><CHANNEL id='3' bit='14' name='Entasch gesp.'/><CHANNEL id='3' bit='15' name='ATW'/><CHANNEL id='4' bit='0' name='HKPB'/><CHANNEL id='4' bit='1' name='MBA'/><CHANNEL id='4' bit='2' name='MBZ'/><CHANNEL id='4' bit='3' name='BPB'/><CHANNEL id='4' bit='4' name='BZPB'/><CHANNEL id='4' bit='8' name='KASK1 Run'/><CHANNEL id='4' bit='9' name='KASK2 Run'/><CHANNEL id='4' bit='10' name='KASK3 Run'/><CHANNEL id='4' bit='11' name='KASK4 Run'/><CHANNEL id='4' bit='12' name='FW Freig.'/><CHANNEL id='4' bit='13' name='sAS Anf Füll'/><CHANNEL id='4' bit='14' name='HKV'/><CHANNEL id='4' bit='15' name='FLP'/><CHANNEL id='5' bit='5' name='Netztrafo'/><CHANNEL id='5' bit='6' name='Netzrelais'/><CHANNEL id='5' bit='7' name='Lagerraum'/><CHANNEL id='5' bit='8' name='Aschebox'/><CHANNEL id='6' bit='0' name='gFlP'/><CHANNEL id='6' bit='1' name='gFlM auf'/><CHANNEL id='6' bit='2' name='gFlM zu'/><CHANNEL id='6' bit='4' name='Spülung Aktiv'/><CHANNEL id='7' bit='0' name='DReg P1'/><CHANNEL id='7' bit='1' name='DReg P2'/><CHANNEL id='7' bit='2' name='DReg Mi auf'/><CHANNEL id='7' bit='3' name='DReg Mi zu'/><CHANNEL id='7' bit='4' name='Oel Out'/><CHANNEL id='7' bit='5' name='DReg2 P1'/><CHANNEL id='7' bit='6' name='DReg2 P2'/><CHANNEL id='7' bit='7' name='DReg2 Mi auf'/><CHANNEL id='7' bit='8' name='DReg2 Mi zu'/></DIGITAL></DAQPRJ>",
-        NANO_V14M : "<DAQPRJ><ANALOG><CHANNEL id='0' name='ZK' unit=''/><CHANNEL id='1' name='O2' unit='%'/><CHANNEL id='2' name='O2soll' unit='%'/><CHANNEL id='3' name='TK' unit='°C'/><CHANNEL id='4' name='TKsoll' unit='°C'/><CHANNEL id='5' name='TRG' unit='°C'/><CHANNEL id='6' name='SZist' unit='%'/><CHANNEL id='7' name='SZsoll' unit='%'/><CHANNEL id='8' name='Leistung' unit='%'/><CHANNEL id='9' name='ESsoll' unit='%'/><CHANNEL id='10' name='I Es' unit='mA'/><CHANNEL id='11' name='I Ra' unit='mA'/><CHANNEL id='12' name='I Aa' unit='mA'/><CHANNEL id='13' name='I Sr' unit='mA'/><CHANNEL id='14' name='I Rein' unit='mA'/><CHANNEL id='15' name='Taus' unit='°C'/><CHANNEL id='16' name='TA Gem.' unit='°C'/><CHANNEL id='17' name='TPo' unit='°C'/><CHANNEL id='18' name='TPmo' unit='°C'/><CHANNEL id='19' name='TPm' unit='°C'/><CHANNEL id='20' name='TPmu' unit='°C'/><CHANNEL id='21' name='TPu' unit='°C'/><CHANNEL id='22' name='TFW' unit='°C'/><CHANNEL id='23' name='TRL' unit='°C'/><CHANNEL id='24' name='TRLsoll' unit='°C'/><CHANNEL id='25' name='Tplat' unit='°C'/><CHANNEL id='26' name='BRT' unit='°C'/><CHANNEL id='27' name='Regler K' unit=''/><CHANNEL id='28' name='KeBrstScale' unit='%'/><CHANNEL id='29' name='ESRegler' unit='%'/><CHANNEL id='30' name='BLDC_ES ist' unit='rpm'/><CHANNEL id='31' name='BLDC_ES soll' unit='rpm'/><CHANNEL id='32' name='LZ ES seit Füll.' unit='Min'/><CHANNEL id='33' name='LZ ES seit Ent.' unit='Min'/><CHANNEL id='34' name='Anzahl Entasch.' unit=''/><CHANNEL id='35' name='Anzahl SR Beweg.' unit=''/><CHANNEL id='36' name='Heiz P Lambda' unit='W'/><CHANNEL id='37' name='Heiz U Lambda' unit='V'/><CHANNEL id='38' name='Heiz I Lambda' unit='mA'/><CHANNEL id='39' name='Sens U Lambda' unit='mV'/><CHANNEL id='40' name='PuffZustand' unit=''/><CHANNEL id='41' name='Puffer_soll' unit='°C'/><CHANNEL id='42' name='Puff Füllgrad' unit='%'/><CHANNEL id='43' name='max.Leist.P3F.HT' unit='%'/><CHANNEL id='44' name='Spreizung' unit='°C'/><CHANNEL id='45' name='AIN17' unit='V'/><CHANNEL id='46' name='Lagerstand' unit='kg'/><CHANNEL id='47' name='Verbrauchszähler' unit='kg'/><CHANNEL id='48' name='UsePos' unit=''/><CHANNEL id='49' name='Störungs Nr' unit=''/><CHANNEL id='50' name='TVL_A' unit='°C'/><CHANNEL id='51' name='TVLs_A' unit='°C'/><CHANNEL id='52' name='TRA_A' unit='°C'/><CHANNEL id='53' name='TRs_A' unit='°C'/><CHANNEL id='54' name='HKZustand_A' unit=''/><CHANNEL id='55' name='FRA Zustand' unit=''/><CHANNEL id='56' name='TVL_1' unit='°C'/><CHANNEL id='57' name='TVLs_1' unit='°C'/><CHANNEL id='58' name='TRA_1' unit='°C'/><CHANNEL id='59' name='TRs_1' unit='°C'/><CHANNEL id='60' name='HKZustand_1' unit=''/><CHANNEL id='61' name='FR1 Zustand' unit=''/><CHANNEL id='62' name='TVL_2' unit='°C'/><CHANNEL id='63' name='TVLs_2' unit='°C'/><CHANNEL id='64' name='TRA_2' unit='°C'/><CHANNEL id='65' name='TRs_2' unit='°C'/><CHANNEL id='66' name='HKZustand_2' unit=''/><CHANNEL id='67' name='FR2 Zustand' unit=''/><CHANNEL id='68' name='TVL_3' unit='°C'/><CHANNEL id='69' name='TVLs_3' unit='°C'/><CHANNEL id='70' name='TRA_3' unit='°C'/><CHANNEL id='71' name='TRs_3' unit='°C'/><CHANNEL id='72' name='HKZustand_3' unit=''/><CHANNEL id='73' name='FR3 Zustand' unit=''/><CHANNEL id='74' name='TVL_4' unit='°C'/><CHANNEL id='75' name='TVLs_4' unit='°C'/><CHANNEL id='76' name='TRA_4' unit='°C'/><CHANNEL id='77' name='TRs_4' unit='°C'/><CHANNEL id='78' name='HKZustand_4' unit=''/><CHANNEL id='79' name='FR4 Zustand' unit=''/><CHANNEL id='80' name='TVL_5' unit='°C'/><CHANNEL id='81' name='TVLs_5' unit='°C'/><CHANNEL id='82' name='TRA_5' unit='°C'/><CHANNEL id='83' name='TRs_5' unit='°C'/><CHANNEL id='84' name='HKZustand_5' unit=''/><CHANNEL id='85' name='FR5 Zustand' unit=''/><CHANNEL id='86' name='TVL_6' unit='°C'/><CHANNEL id='87' name='TVLs_6' unit='°C'/><CHANNEL id='88' name='TRA_6' unit='°C'/><CHANNEL id='89' name='TRs_6' unit='°C'/><CHANNEL id='90' name='HKZustand_6' unit=''/><CHANNEL id='91' name='FR6 Zustand' unit=''/><CHANNEL id='92' name='TBA' unit='°C'/><CHANNEL id='93' name='TBs_A' unit='°C'/><CHANNEL id='94' name='DUMMY' unit=''/><CHANNEL id='95' name='TB1' unit='°C'/><CHANNEL id='96' name='TBs_1' unit='°C'/><CHANNEL id='97' name='DUMMY' unit=''/><CHANNEL id='98' name='TB2' unit='°C'/><CHANNEL id='99' name='TBs_2' unit='°C'/><CHANNEL id='100' name='DUMMY' unit=''/><CHANNEL id='101' name='TB3' unit='°C'/><CHANNEL id='102' name='TBs_3' unit='°C'/><CHANNEL id='103' name='DUMMY' unit=''/><CHANNEL id='104' name='Ext.HK Soll' unit=''/><CHANNEL id='105' name='Ext.HK Soll_2' unit=''/><CHANNEL id='106' name='Ext.HK Soll_3' unit=''/><CHANNEL id='107' name='Höchste Anf' unit=''/><CHANNEL id='108' name='Anf. HKR0' unit='°C'/><CHANNEL id='109' name='Anf. HKR1' unit='°C'/><CHANNEL id='110' name='Anf. HKR2' unit='°C'/><CHANNEL id='111' name='Anf. HKR3' unit='°C'/><CHANNEL id='112' name='Anf. HKR4' unit='°C'/><CHANNEL id='113' name='Anf. HKR5' unit='°C'/><CHANNEL id='114' name='Anf. HKR6' unit='°C'/><CHANNEL id='115' name='Anf. HKR7' unit='°C'/><CHANNEL id='116' name='Anf. HKR8' unit='°C'/><CHANNEL id='117' name='Anf. HKR9' unit='°C'/><CHANNEL id='118' name='Anf. HKR10' unit='°C'/><CHANNEL id='119' name='Anf. HKR11' unit='°C'/><CHANNEL id='120' name='Anf. HKR12' unit='°C'/><CHANNEL id='121' name='Anf. HKR13' unit='°C'/><CHANNEL id='122' name='Anf. HKR14' unit='°C'/><CHANNEL id='123' name='Anf. HKR15' unit='°C'/><CHANNEL id='124' name='T Spülung' unit='°C'/><CHANNEL id='125' name='Programm HKM1' unit=''/><CHANNEL id='126' name='Programm HKM2' unit=''/><CHANNEL id='127' name='TVG' unit='°C'/><CHANNEL id='128' name='DUMMY' unit=''/><CHANNEL id='129' name='DUMMY' unit=''/><CHANNEL id='130' name='U Netzteil' unit='mV'/><CHANNEL id='131' name='TBB' unit='°C'/><CHANNEL id='132' name='TBs_B' unit='°C'/><CHANNEL id='133' name='DUMMY' unit=''/><CHANNEL id='134' name='TVL_B' unit='°C'/><CHANNEL id='135' name='TVLs_B' unit='°C'/><CHANNEL id='136' name='TRB' unit='°C'/><CHANNEL id='137' name='TRs_B' unit='°C'/><CHANNEL id='138' name='HKZustand_B' unit=''/><CHANNEL id='139' name='TRA_B' unit='°C'/><CHANNEL id='140' name='FRB Zustand' unit=''/><CHANNEL id='141' name='Programm' unit=''/><CHANNEL id='142' name='Anf. EHK Spg' unit='V'/><CHANNEL id='143' name='Puffer_soll oben' unit='°C'/><CHANNEL id='144' name='Puffer_soll unten' unit='°C'/><CHANNEL id='145' name='BoiZustand_1' unit=''/></ANALOG><DIGITAL><CHANNEL id='0' bit='0' name='Stb'/><CHANNEL id='0' bit='1' name='Fuellstand'/><CHANNEL id='0' bit='3' name='Es Rein Endl'/><CHANNEL id='0' bit='4' name='HKPA'/><CHANNEL id='0' bit='5' name='MAA'/><CHANNEL id='0' bit='6' name='MAZ'/><CHANNEL id='0' bit='7' name='HKP1'/><CHANNEL id='0' bit='8' name='M1A'/><CHANNEL id='0' bit='9' name='M1Z'/><CHANNEL id='0' bit='10' name='HKP2'/><CHANNEL id='0' bit='11' name='M2A'/><CHANNEL id='0' bit='12' name='M2Z'/><CHANNEL id='0' bit='13' name='Störung'/><CHANNEL id='0' bit='14' name='WS freig.'/><CHANNEL id='0' bit='15' name='Akt. Code'/><CHANNEL id='1' bit='0' name='L Heiz.'/><CHANNEL id='1' bit='1' name='Z Heiz.'/><CHANNEL id='1' bit='2' name='Z Geb.'/><CHANNEL id='1' bit='3' name='AA Run'/><CHANNEL id='1' bit='4' name='AA Dir'/><CHANNEL id='1' bit='5' name='ES Run'/><CHANNEL id='1' bit='6' name='ES Dir'/><CHANNEL id='1' bit='7' name='AS Saug'/><CHANNEL id='1' bit='8' name='AS RA Run'/><CHANNEL id='1' bit='9' name='AS RA Dir'/><CHANNEL id='1' bit='10' name='Rein En'/><CHANNEL id='1' bit='11' name='Rein Run'/><CHANNEL id='1' bit='12' name='RLm_auf'/><CHANNEL id='1' bit='13' name='RLm_zu'/><CHANNEL id='1' bit='14' name='RLP/PuffP'/><CHANNEL id='2' bit='0' name='BPA'/><CHANNEL id='2' bit='1' name='BP1'/><CHANNEL id='2' bit='2' name='BP2'/><CHANNEL id='2' bit='3' name='BP3'/><CHANNEL id='2' bit='4' name='BZPA'/><CHANNEL id='2' bit='5' name='BZP1'/><CHANNEL id='2' bit='6' name='BZP2'/><CHANNEL id='2' bit='7' name='BZP3'/><CHANNEL id='2' bit='8' name='EHKP'/><CHANNEL id='2' bit='9' name='EHKP2'/><CHANNEL id='2' bit='10' name='EHKP3'/><CHANNEL id='2' bit='11' name='EHK Anf'/><CHANNEL id='2' bit='12' name='EHK Anf2'/><CHANNEL id='2' bit='13' name='EHK Anf3'/><CHANNEL id='3' bit='0' name='HKP3'/><CHANNEL id='3' bit='1' name='M3A'/><CHANNEL id='3' bit='2' name='M3Z'/><CHANNEL id='3' bit='3' name='HKP4'/><CHANNEL id='3' bit='4' name='M4A'/><CHANNEL id='3' bit='5' name='M4Z'/><CHANNEL id='3' bit='6' name='HKP5'/><CHANNEL id='3' bit='7' name='M5A'/><CHANNEL id='3' bit='8' name='M5Z'/><CHANNEL id='3' bit='9' name='HKP6'/><CHANNEL id='3' bit='10' name='M6A'/><CHANNEL id='3' bit='11' name='M6Z'/><CHANNEL id='3' bit='14' name='Entasch gesp.'/><CHANNEL id='3' bit='15' name='ATW'/><CHANNEL id='4' bit='0' name='HKPB'/><CHANNEL id='4' bit='1' name='MBA'/><CHANNEL id='4' bit='2' name='MBZ'/><CHANNEL id='4' bit='3' name='BPB'/><CHANNEL id='4' bit='4' name='BZPB'/><CHANNEL id='4' bit='5' name='KASK KWK OK'/><CHANNEL id='4' bit='6' name='KASK FW OK'/><CHANNEL id='4' bit='8' name='KASK1 Run'/><CHANNEL id='4' bit='9' name='KASK2 Run'/><CHANNEL id='4' bit='10' name='KASK3 Run'/><CHANNEL id='4' bit='11' name='KASK4 Run'/><CHANNEL id='4' bit='12' name='FW Freig.'/><CHANNEL id='4' bit='13' name='sAS Anf Füll'/><CHANNEL id='4' bit='14' name='HKV'/><CHANNEL id='4' bit='15' name='FLP'/><CHANNEL id='5' bit='5' name='Netztrafo'/><CHANNEL id='5' bit='6' name='Netzrelais'/><CHANNEL id='5' bit='7' name='Lagerraum'/><CHANNEL id='5' bit='8' name='Aschebox'/><CHANNEL id='5' bit='16' name='KASK1 OK'/><CHANNEL id='5' bit='17' name='KASK2 OK'/><CHANNEL id='5' bit='18' name='KASK3 OK'/><CHANNEL id='5' bit='19' name='KASK4 OK'/><CHANNEL id='6' bit='0' name='gFlP'/><CHANNEL id='6' bit='1' name='gFlM auf'/><CHANNEL id='6' bit='2' name='gFlM zu'/><CHANNEL id='6' bit='4' name='Spülung Aktiv'/><CHANNEL id='7' bit='0' name='DReg P2'/><CHANNEL id='7' bit='1' name='DReg P3'/><CHANNEL id='7' bit='2' name='DReg Mi auf'/><CHANNEL id='7' bit='3' name='DReg Mi zu'/><CHANNEL id='7' bit='4' name='Kask FW Out'/><CHANNEL id='7' bit='5' name='DReg2 P2'/><CHANNEL id='7' bit='6' name='DReg2 P3'/><CHANNEL id='7' bit='7' name='DReg2 Mi auf'/><CHANNEL id='7' bit='8' name='DReg2 Mi zu'/><CHANNEL id='7' bit='9' name='Kask KWK Out'/><CHANNEL id='7' bit='20' name='DReg3 P2'/><CHANNEL id='7' bit='21' name='DReg3 P3'/><CHANNEL id='7' bit='22' name='DReg3 Mi auf'/><CHANNEL id='7' bit='23' name='DReg3 Mi zu'/></DIGITAL></DAQPRJ>",
-        NANO_V14N : "<DAQPRJ><ANALOG><CHANNEL id='0' name='ZK' dop='0'/><CHANNEL id='1' name='O2' unit='%'/><CHANNEL id='2' name='O2soll' unit='%'/><CHANNEL id='3' name='TK' unit='°C'/><CHANNEL id='4' name='TKsoll' unit='°C' dop='0'/><CHANNEL id='5' name='TRL' unit='°C'/><CHANNEL id='6' name='TRLsoll' unit='°C' dop='0'/><CHANNEL id='7' name='Spreizung' unit='°C'/><CHANNEL id='8' name='TRG' unit='°C'/><CHANNEL id='9' name='SZist' unit='%' dop='0'/><CHANNEL id='10' name='SZsoll' unit='%'/><CHANNEL id='11' name='TPo' unit='°C'/><CHANNEL id='12' name='TPm' unit='°C'/><CHANNEL id='13' name='TPu' unit='°C'/><CHANNEL id='14' name='Puff Füllgrad' unit='%' dop='0'/><CHANNEL id='15' name='Puffer_soll oben' unit='°C' dop='0'/><CHANNEL id='16' name='Puffer_soll unten' unit='°C' dop='0'/><CHANNEL id='17' name='PuffZustand' dop='0'/><CHANNEL id='18' name='Höchste Anf' dop='0'/><CHANNEL id='19' name='TFW' unit='°C' dop='0'/><CHANNEL id='20' name='Leistung' unit='%' dop='0'/><CHANNEL id='21' name='ESsoll' unit='%'/><CHANNEL id='22' name='min.Leist.TRG' unit='%'/><CHANNEL id='23' name='max.Leist.TRG' unit='%'/><CHANNEL id='24' name='max.Leist.Fuell' unit='%'/><CHANNEL id='25' name='max.Leist.TPO' unit='%'/><CHANNEL id='26' name='ESRegler' unit='%' dop='0'/><CHANNEL id='27' name='Regler K'/><CHANNEL id='28' name='KeBrstScale' unit='%' dop='0'/><CHANNEL id='29' name='Programm' dop='0'/><CHANNEL id='30' name='Störungs Nr' dop='0'/><CHANNEL id='31' name='I Es' unit='mA' dop='0'/><CHANNEL id='32' name='I Ra' unit='mA' dop='0'/><CHANNEL id='33' name='I Aa' unit='mA' dop='0'/><CHANNEL id='34' name='I Sr' unit='mA' dop='0'/><CHANNEL id='35' name='I Rein' unit='mA' dop='0'/><CHANNEL id='36' name='LZ ES seit Füll.' unit='Min' dop='0'/><CHANNEL id='37' name='LZ ES seit Ent.' unit='Min' dop='0'/><CHANNEL id='38' name='Anzahl Entasch.' dop='0'/><CHANNEL id='39' name='Anzahl SR Beweg.' dop='0'/><CHANNEL id='40' name='Lagerstand' unit='kg' dop='0'/><CHANNEL id='41' name='Verbrauchszähler' unit='kg' dop='0'/><CHANNEL id='42' name='Heiz P Lambda' unit='W' dop='2'/><CHANNEL id='43' name='Heiz U Lambda' unit='V' dop='2'/><CHANNEL id='44' name='Heiz I Lambda' unit='mA' dop='0'/><CHANNEL id='45' name='U_Lambda' unit='mV'/><CHANNEL id='46' name='U Netzteil' unit='mV' dop='0'/><CHANNEL id='47' name='T Spülung' unit='°C'/><CHANNEL id='48' name='BRT' unit='°C'/><CHANNEL id='49' name='Tplat' unit='°C' dop='0'/><CHANNEL id='50' name='TVG' unit='°C'/><CHANNEL id='51' name='TVG2' unit='°C'/><CHANNEL id='52' name='AIN17' unit='V'/><CHANNEL id='53' name='Taus' unit='°C'/><CHANNEL id='54' name='TA Gem.' unit='°C'/><CHANNEL id='55' name='Ext.HK Soll' unit='°C' dop='0'/><CHANNEL id='56' name='TVL_A' unit='°C'/><CHANNEL id='57' name='TVLs_A' unit='°C' dop='0'/><CHANNEL id='58' name='TRA_A' unit='°C'/><CHANNEL id='59' name='TRs_A' unit='°C'/><CHANNEL id='60' name='HKZustand_A' dop='0'/><CHANNEL id='61' name='FRA Zustand' dop='0'/><CHANNEL id='62' name='TVL_1' unit='°C'/><CHANNEL id='63' name='TVLs_1' unit='°C' dop='0'/><CHANNEL id='64' name='TRA_1' unit='°C'/><CHANNEL id='65' name='TRs_1' unit='°C'/><CHANNEL id='66' name='HKZustand_1' dop='0'/><CHANNEL id='67' name='FR1 Zustand' dop='0'/><CHANNEL id='68' name='TVL_2' unit='°C'/><CHANNEL id='69' name='TVLs_2' unit='°C' dop='0'/><CHANNEL id='70' name='TRA_2' unit='°C'/><CHANNEL id='71' name='TRs_2' unit='°C'/><CHANNEL id='72' name='HKZustand_2' dop='0'/><CHANNEL id='73' name='FR2 Zustand' dop='0'/><CHANNEL id='74' name='TVL_B' unit='°C'/><CHANNEL id='75' name='TVLs_B' unit='°C' dop='0'/><CHANNEL id='76' name='TRA_B' unit='°C'/><CHANNEL id='77' name='TRs_B' unit='°C'/><CHANNEL id='78' name='HKZustand_B' dop='0'/><CHANNEL id='79' name='FRB Zustand' dop='0'/><CHANNEL id='80' name='TBA' unit='°C'/><CHANNEL id='81' name='TBs_A' unit='°C' dop='0'/><CHANNEL id='82' name='TB1' unit='°C'/><CHANNEL id='83' name='TBs_1' unit='°C' dop='0'/><CHANNEL id='84' name='BoiZustand_1' dop='0'/><CHANNEL id='85' name='TBB' unit='°C'/><CHANNEL id='86' name='TBs_B' unit='°C' dop='0'/><CHANNEL id='87' name='HKR Anf' unit='°C'/><CHANNEL id='88' name='Anf. HKR0' unit='°C' dop='0'/><CHANNEL id='89' name='Anf. HKR1' unit='°C' dop='0'/><CHANNEL id='90' name='Anf. HKR2' unit='°C' dop='0'/><CHANNEL id='91' name='Anf. HKR3' unit='°C' dop='0'/><CHANNEL id='92' name='Anf. HKR4' unit='°C' dop='0'/><CHANNEL id='93' name='Anf. HKR5' unit='°C' dop='0'/><CHANNEL id='94' name='Anf. HKR6' unit='°C' dop='0'/><CHANNEL id='95' name='Anf. HKR7' unit='°C' dop='0'/><CHANNEL id='96' name='Anf. HKR8' unit='°C' dop='0'/><CHANNEL id='97' name='Anf. HKR9' unit='°C' dop='0'/><CHANNEL id='98' name='Anf. HKR10' unit='°C' dop='0'/><CHANNEL id='99' name='Anf. HKR11' unit='°C' dop='0'/><CHANNEL id='100' name='Anf. HKR12' unit='°C' dop='0'/><CHANNEL id='101' name='Anf. HKR13' unit='°C' dop='0'/><CHANNEL id='102' name='Anf. HKR14' unit='°C' dop='0'/><CHANNEL id='103' name='Anf. HKR15' unit='°C' dop='0'/></ANALOG><DIGITAL><CHANNEL id='0' bit='0' name='Störung'/><CHANNEL id='0' bit='1' name='Stb'/><CHANNEL id='0' bit='2' name='Fuellstand'/><CHANNEL id='0' bit='3' name='RLP/PuffP'/><CHANNEL id='0' bit='4' name='RLm_auf'/><CHANNEL id='0' bit='5' name='RLm_zu'/><CHANNEL id='0' bit='10' name='WS freig.'/><CHANNEL id='0' bit='11' name='Akt. Code'/><CHANNEL id='0' bit='14' name='FW Freig.'/><CHANNEL id='0' bit='15' name='gFlP'/><CHANNEL id='0' bit='16' name='gFlM auf'/><CHANNEL id='0' bit='17' name='gFlM zu'/><CHANNEL id='0' bit='18' name='gFl2P'/><CHANNEL id='0' bit='19' name='gFl2M auf'/><CHANNEL id='0' bit='20' name='gFl2M zu'/><CHANNEL id='1' bit='0' name='L Heiz.'/><CHANNEL id='1' bit='1' name='Z Heiz.'/><CHANNEL id='1' bit='2' name='Z Geb.'/><CHANNEL id='1' bit='3' name='AA Run'/><CHANNEL id='1' bit='4' name='AA Dir'/><CHANNEL id='1' bit='5' name='ES Run'/><CHANNEL id='1' bit='6' name='ES Dir'/><CHANNEL id='1' bit='7' name='AS Saug'/><CHANNEL id='1' bit='8' name='AS RA Run'/><CHANNEL id='1' bit='9' name='AS RA Dir'/><CHANNEL id='1' bit='10' name='Rein En'/><CHANNEL id='1' bit='11' name='Rein Run'/><CHANNEL id='1' bit='12' name='Es Rein Endl'/><CHANNEL id='1' bit='13' name='sAS Anf Füll'/><CHANNEL id='2' bit='0' name='HKPA'/><CHANNEL id='2' bit='1' name='MAA'/><CHANNEL id='2' bit='2' name='MAZ'/><CHANNEL id='2' bit='3' name='HKP1'/><CHANNEL id='2' bit='4' name='M1A'/><CHANNEL id='2' bit='5' name='M1Z'/><CHANNEL id='2' bit='6' name='HKP2'/><CHANNEL id='2' bit='7' name='M2A'/><CHANNEL id='2' bit='8' name='M2Z'/><CHANNEL id='2' bit='9' name='HKP3'/><CHANNEL id='2' bit='10' name='M3A'/><CHANNEL id='2' bit='11' name='M3Z'/><CHANNEL id='2' bit='12' name='HKP4'/><CHANNEL id='2' bit='13' name='M4A'/><CHANNEL id='2' bit='14' name='M4Z'/><CHANNEL id='2' bit='15' name='HKP5'/><CHANNEL id='2' bit='16' name='M5A'/><CHANNEL id='2' bit='17' name='M5Z'/><CHANNEL id='2' bit='18' name='HKP6'/><CHANNEL id='2' bit='19' name='M6A'/><CHANNEL id='2' bit='20' name='M6Z'/><CHANNEL id='2' bit='21' name='HKPB'/><CHANNEL id='2' bit='22' name='MBA'/><CHANNEL id='2' bit='23' name='MBZ'/><CHANNEL id='3' bit='0' name='BPA'/><CHANNEL id='3' bit='1' name='BP1'/><CHANNEL id='3' bit='2' name='BP2'/><CHANNEL id='3' bit='3' name='BP3'/><CHANNEL id='3' bit='4' name='BPB'/><CHANNEL id='3' bit='5' name='BZPA'/><CHANNEL id='3' bit='6' name='BZP1'/><CHANNEL id='3' bit='7' name='BZP2'/><CHANNEL id='3' bit='8' name='BZP3'/><CHANNEL id='3' bit='9' name='BZPB'/><CHANNEL id='4' bit='0' name='Aschebox'/><CHANNEL id='4' bit='1' name='Netztrafo'/><CHANNEL id='4' bit='2' name='Netzrelais'/><CHANNEL id='4' bit='4' name='Lagerraum'/><CHANNEL id='4' bit='6' name='FLP'/><CHANNEL id='4' bit='8' name='ATW'/><CHANNEL id='4' bit='9' name='Entasch gesp.'/><CHANNEL id='4' bit='13' name='HKV'/><CHANNEL id='4' bit='14' name='Spülung Aktiv'/><CHANNEL id='6' bit='0' name='EHK Anf'/><CHANNEL id='6' bit='2' name='EHK Anf2'/><CHANNEL id='6' bit='3' name='EHK Anf3'/><CHANNEL id='6' bit='4' name='EHKP'/><CHANNEL id='6' bit='6' name='EHKP2'/><CHANNEL id='6' bit='7' name='EHKP3'/><CHANNEL id='6' bit='8' name='KASK1 MinLeist'/><CHANNEL id='6' bit='9' name='KASK2 MinLeist'/><CHANNEL id='6' bit='10' name='KASK3 MinLeist'/><CHANNEL id='6' bit='11' name='KASK4 MinLeist'/><CHANNEL id='6' bit='12' name='KASK1 MaxLeist'/><CHANNEL id='6' bit='13' name='KASK2 MaxLeist'/><CHANNEL id='6' bit='14' name='KASK3 MaxLeist'/><CHANNEL id='6' bit='15' name='KASK4 MaxLeist'/><CHANNEL id='6' bit='16' name='KASK1 Run'/><CHANNEL id='6' bit='17' name='KASK2 Run'/><CHANNEL id='6' bit='18' name='KASK3 Run'/><CHANNEL id='6' bit='19' name='KASK4 Run'/><CHANNEL id='6' bit='20' name='KASK1 OK'/><CHANNEL id='6' bit='21' name='KASK2 OK'/><CHANNEL id='6' bit='22' name='KASK3 OK'/><CHANNEL id='6' bit='23' name='KASK4 OK'/><CHANNEL id='6' bit='24' name='Kask KWK Out'/><CHANNEL id='6' bit='25' name='Kask FW Out'/><CHANNEL id='6' bit='26' name='KASK KWK OK'/><CHANNEL id='6' bit='27' name='KASK FW OK'/><CHANNEL id='7' bit='0' name='DReg P2'/><CHANNEL id='7' bit='1' name='DReg P3'/><CHANNEL id='7' bit='2' name='DReg Mi auf'/><CHANNEL id='7' bit='3' name='DReg Mi zu'/><CHANNEL id='7' bit='5' name='DReg2 P2'/><CHANNEL id='7' bit='6' name='DReg2 Mi auf'/><CHANNEL id='7' bit='7' name='DReg2 Mi zu'/><CHANNEL id='7' bit='9' name='DReg3 P2'/><CHANNEL id='7' bit='10' name='DReg3 P3'/><CHANNEL id='7' bit='11' name='DReg3 Mi auf'/><CHANNEL id='7' bit='12' name='DReg3 Mi zu'/></DIGITAL></DAQPRJ>",
-        NANO_V14N2: "<DAQPRJ><ANALOG><CHANNEL id='0' name='ZK' dop='0'/><CHANNEL id='1' name='O2' unit='%'/><CHANNEL id='2' name='O2soll' unit='%'/><CHANNEL id='3' name='TK' unit='°C'/><CHANNEL id='4' name='TKsoll' unit='°C' dop='0'/><CHANNEL id='5' name='TRL' unit='°C'/><CHANNEL id='6' name='TRLsoll' unit='°C' dop='0'/><CHANNEL id='7' name='Spreizung' unit='°C'/><CHANNEL id='8' name='TRG' unit='°C'/><CHANNEL id='9' name='SZist' unit='%' dop='0'/><CHANNEL id='10' name='SZsoll' unit='%'/><CHANNEL id='11' name='TPo' unit='°C'/><CHANNEL id='12' name='TPm' unit='°C'/><CHANNEL id='13' name='TPu' unit='°C'/><CHANNEL id='14' name='Puff Füllgrad' unit='%' dop='0'/><CHANNEL id='15' name='Puffer_soll oben' unit='°C' dop='0'/><CHANNEL id='16' name='Puffer_soll unten' unit='°C' dop='0'/><CHANNEL id='17' name='PuffZustand' dop='0'/><CHANNEL id='18' name='Höchste Anf' dop='0'/><CHANNEL id='19' name='TFW' unit='°C' dop='0'/><CHANNEL id='20' name='Leistung' unit='%' dop='0'/><CHANNEL id='21' name='ESsoll' unit='%'/><CHANNEL id='22' name='min.Leist.TRG' unit='%'/><CHANNEL id='23' name='max.Leist.TRG' unit='%'/><CHANNEL id='24' name='max.Leist.Fuell' unit='%'/><CHANNEL id='25' name='max.Leist.TPO' unit='%'/><CHANNEL id='26' name='ESRegler' unit='%' dop='0'/><CHANNEL id='27' name='Regler K'/><CHANNEL id='28' name='KeBrstScale' unit='%' dop='0'/><CHANNEL id='29' name='Programm' dop='0'/><CHANNEL id='30' name='Störungs Nr' dop='0'/><CHANNEL id='31' name='I Es' unit='mA' dop='0'/><CHANNEL id='32' name='I Ra' unit='mA' dop='0'/><CHANNEL id='33' name='I Aa' unit='mA' dop='0'/><CHANNEL id='34' name='I Sr' unit='mA' dop='0'/><CHANNEL id='35' name='I Rein' unit='mA' dop='0'/><CHANNEL id='36' name='BLDC_ES ist' unit='rpm' dop='0'/><CHANNEL id='37' name='BLDC_ES soll' unit='rpm' dop='0'/><CHANNEL id='38' name='LZ ES seit Füll.' unit='Min' dop='0'/><CHANNEL id='39' name='LZ ES seit Ent.' unit='Min' dop='0'/><CHANNEL id='40' name='Anzahl Entasch.' dop='0'/><CHANNEL id='41' name='Anzahl SR Beweg.' dop='0'/><CHANNEL id='42' name='Lagerstand' unit='kg' dop='0'/><CHANNEL id='43' name='Verbrauchszähler' unit='kg' dop='0'/><CHANNEL id='44' name='Heiz P Lambda' unit='W' dop='2'/><CHANNEL id='45' name='Heiz U Lambda' unit='V' dop='2'/><CHANNEL id='46' name='Heiz I Lambda' unit='mA' dop='0'/><CHANNEL id='47' name='U_Lambda' unit='mV'/><CHANNEL id='48' name='U Netzteil' unit='mV' dop='0'/><CHANNEL id='49' name='T Spülung' unit='°C'/><CHANNEL id='50' name='BRT' unit='°C'/><CHANNEL id='51' name='Tplat' unit='°C' dop='0'/><CHANNEL id='52' name='TVG' unit='°C'/><CHANNEL id='53' name='TVG2' unit='°C'/><CHANNEL id='54' name='AIN17' unit='V'/><CHANNEL id='55' name='Taus' unit='°C'/><CHANNEL id='56' name='TA Gem.' unit='°C'/><CHANNEL id='57' name='Programm HKM1' dop='0'/><CHANNEL id='58' name='Ext.HK Soll' unit='°C' dop='0'/><CHANNEL id='59' name='Ext.HK Soll_2' unit='°C' dop='0'/><CHANNEL id='60' name='TVL_A' unit='°C'/><CHANNEL id='61' name='TVLs_A' unit='°C' dop='0'/><CHANNEL id='62' name='TRA_A' unit='°C'/><CHANNEL id='63' name='TRs_A' unit='°C'/><CHANNEL id='64' name='HKZustand_A' dop='0'/><CHANNEL id='65' name='FRA Zustand' dop='0'/><CHANNEL id='66' name='TVL_1' unit='°C'/><CHANNEL id='67' name='TVLs_1' unit='°C' dop='0'/><CHANNEL id='68' name='TRA_1' unit='°C'/><CHANNEL id='69' name='TRs_1' unit='°C'/><CHANNEL id='70' name='HKZustand_1' dop='0'/><CHANNEL id='71' name='FR1 Zustand' dop='0'/><CHANNEL id='72' name='TVL_2' unit='°C'/><CHANNEL id='73' name='TVLs_2' unit='°C' dop='0'/><CHANNEL id='74' name='TRA_2' unit='°C'/><CHANNEL id='75' name='TRs_2' unit='°C'/><CHANNEL id='76' name='HKZustand_2' dop='0'/><CHANNEL id='77' name='FR2 Zustand' dop='0'/><CHANNEL id='78' name='TVL_3' unit='°C'/><CHANNEL id='79' name='TVLs_3' unit='°C' dop='0'/><CHANNEL id='80' name='TRA_3' unit='°C'/><CHANNEL id='81' name='TRs_3' unit='°C'/><CHANNEL id='82' name='HKZustand_3' dop='0'/><CHANNEL id='83' name='FR3 Zustand' dop='0'/><CHANNEL id='84' name='TVL_4' unit='°C'/><CHANNEL id='85' name='TVLs_4' unit='°C' dop='0'/><CHANNEL id='86' name='TRA_4' unit='°C'/><CHANNEL id='87' name='TRs_4' unit='°C'/><CHANNEL id='88' name='HKZustand_4' dop='0'/><CHANNEL id='89' name='FR4 Zustand' dop='0'/><CHANNEL id='90' name='TVL_B' unit='°C'/><CHANNEL id='91' name='TVLs_B' unit='°C' dop='0'/><CHANNEL id='92' name='TRA_B' unit='°C'/><CHANNEL id='93' name='TRs_B' unit='°C'/><CHANNEL id='94' name='HKZustand_B' dop='0'/><CHANNEL id='95' name='FRB Zustand' dop='0'/><CHANNEL id='96' name='TBA' unit='°C'/><CHANNEL id='97' name='TBs_A' unit='°C' dop='0'/><CHANNEL id='98' name='TB1' unit='°C'/><CHANNEL id='99' name='TBs_1' unit='°C' dop='0'/><CHANNEL id='100' name='BoiZustand_1' dop='0'/><CHANNEL id='101' name='TB2' unit='°C'/><CHANNEL id='102' name='TBs_2' unit='°C' dop='0'/><CHANNEL id='103' name='BoiZustand_2' dop='0'/><CHANNEL id='104' name='TBB' unit='°C'/><CHANNEL id='105' name='TBs_B' unit='°C' dop='0'/><CHANNEL id='106' name='HKR Anf' unit='°C'/><CHANNEL id='107' name='Anf. HKR0' unit='°C' dop='0'/><CHANNEL id='108' name='Anf. HKR1' unit='°C' dop='0'/><CHANNEL id='109' name='Anf. HKR2' unit='°C' dop='0'/><CHANNEL id='110' name='Anf. HKR3' unit='°C' dop='0'/><CHANNEL id='111' name='Anf. HKR4' unit='°C' dop='0'/><CHANNEL id='112' name='Anf. HKR5' unit='°C' dop='0'/><CHANNEL id='113' name='Anf. HKR6' unit='°C' dop='0'/><CHANNEL id='114' name='Anf. HKR7' unit='°C' dop='0'/><CHANNEL id='115' name='Anf. HKR8' unit='°C' dop='0'/><CHANNEL id='116' name='Anf. HKR9' unit='°C' dop='0'/><CHANNEL id='117' name='Anf. HKR10' unit='°C' dop='0'/><CHANNEL id='118' name='Anf. HKR11' unit='°C' dop='0'/><CHANNEL id='119' name='Anf. HKR12' unit='°C' dop='0'/><CHANNEL id='120' name='Anf. HKR13' unit='°C' dop='0'/><CHANNEL id='121' name='Anf. HKR14' unit='°C' dop='0'/><CHANNEL id='122' name='Anf. HKR15' unit='°C' dop='0'/><CHANNEL id='123' name='UsePos' dop='0'/><CHANNEL id='124' name='AUPSoll' unit='mm'/><CHANNEL id='125' name='AUPIst' unit='mm'/><CHANNEL id='126' name='AUPStrom' unit='mA'/></ANALOG><DIGITAL><CHANNEL id='0' bit='0' name='Störung'/><CHANNEL id='0' bit='1' name='Stb'/><CHANNEL id='0' bit='2' name='Fuellstand'/><CHANNEL id='0' bit='3' name='RLP/PuffP'/><CHANNEL id='0' bit='4' name='RLm_auf'/><CHANNEL id='0' bit='5' name='RLm_zu'/><CHANNEL id='0' bit='10' name='WS freig.'/><CHANNEL id='0' bit='11' name='Akt. Code'/><CHANNEL id='0' bit='14' name='FW Freig.'/><CHANNEL id='0' bit='15' name='gFlP'/><CHANNEL id='0' bit='16' name='gFlM auf'/><CHANNEL id='0' bit='17' name='gFlM zu'/><CHANNEL id='0' bit='18' name='gFl2P'/><CHANNEL id='0' bit='19' name='gFl2M auf'/><CHANNEL id='0' bit='20' name='gFl2M zu'/><CHANNEL id='1' bit='0' name='L Heiz.'/><CHANNEL id='1' bit='1' name='Z Heiz.'/><CHANNEL id='1' bit='2' name='Z Geb.'/><CHANNEL id='1' bit='3' name='AA Run'/><CHANNEL id='1' bit='4' name='AA Dir'/><CHANNEL id='1' bit='5' name='ES Run'/><CHANNEL id='1' bit='6' name='ES Dir'/><CHANNEL id='1' bit='7' name='AS Saug'/><CHANNEL id='1' bit='8' name='AS RA Run'/><CHANNEL id='1' bit='9' name='AS RA Dir'/><CHANNEL id='1' bit='10' name='Rein En'/><CHANNEL id='1' bit='11' name='Rein Run'/><CHANNEL id='1' bit='12' name='Es Rein Endl'/><CHANNEL id='1' bit='13' name='sAS Anf Füll'/><CHANNEL id='2' bit='0' name='HKPA'/><CHANNEL id='2' bit='1' name='MAA'/><CHANNEL id='2' bit='2' name='MAZ'/><CHANNEL id='2' bit='3' name='HKP1'/><CHANNEL id='2' bit='4' name='M1A'/><CHANNEL id='2' bit='5' name='M1Z'/><CHANNEL id='2' bit='6' name='HKP2'/><CHANNEL id='2' bit='7' name='M2A'/><CHANNEL id='2' bit='8' name='M2Z'/><CHANNEL id='2' bit='9' name='HKP3'/><CHANNEL id='2' bit='10' name='M3A'/><CHANNEL id='2' bit='11' name='M3Z'/><CHANNEL id='2' bit='12' name='HKP4'/><CHANNEL id='2' bit='13' name='M4A'/><CHANNEL id='2' bit='14' name='M4Z'/><CHANNEL id='2' bit='15' name='HKP5'/><CHANNEL id='2' bit='16' name='M5A'/><CHANNEL id='2' bit='17' name='M5Z'/><CHANNEL id='2' bit='18' name='HKP6'/><CHANNEL id='2' bit='19' name='M6A'/><CHANNEL id='2' bit='20' name='M6Z'/><CHANNEL id='2' bit='21' name='HKPB'/><CHANNEL id='2' bit='22' name='MBA'/><CHANNEL id='2' bit='23' name='MBZ'/><CHANNEL id='3' bit='0' name='BPA'/><CHANNEL id='3' bit='1' name='BP1'/><CHANNEL id='3' bit='2' name='BP2'/><CHANNEL id='3' bit='3' name='BP3'/><CHANNEL id='3' bit='4' name='BPB'/><CHANNEL id='3' bit='5' name='BZPA'/><CHANNEL id='3' bit='6' name='BZP1'/><CHANNEL id='3' bit='7' name='BZP2'/><CHANNEL id='3' bit='8' name='BZP3'/><CHANNEL id='3' bit='9' name='BZPB'/><CHANNEL id='4' bit='0' name='Aschebox'/><CHANNEL id='4' bit='1' name='Netztrafo'/><CHANNEL id='4' bit='2' name='Netzrelais'/><CHANNEL id='4' bit='4' name='Lagerraum'/><CHANNEL id='4' bit='6' name='FLP'/><CHANNEL id='4' bit='8' name='ATW'/><CHANNEL id='4' bit='9' name='Entasch gesp.'/><CHANNEL id='4' bit='13' name='HKV'/><CHANNEL id='4' bit='14' name='Spülung Aktiv'/><CHANNEL id='6' bit='0' name='EHK Anf'/><CHANNEL id='6' bit='2' name='EHK Anf2'/><CHANNEL id='6' bit='3' name='EHK Anf3'/><CHANNEL id='6' bit='4' name='EHKP'/><CHANNEL id='6' bit='6' name='EHKP2'/><CHANNEL id='6' bit='7' name='EHKP3'/><CHANNEL id='6' bit='8' name='KASK1 MinLeist'/><CHANNEL id='6' bit='9' name='KASK2 MinLeist'/><CHANNEL id='6' bit='10' name='KASK3 MinLeist'/><CHANNEL id='6' bit='11' name='KASK4 MinLeist'/><CHANNEL id='6' bit='12' name='KASK1 MaxLeist'/><CHANNEL id='6' bit='13' name='KASK2 MaxLeist'/><CHANNEL id='6' bit='14' name='KASK3 MaxLeist'/><CHANNEL id='6' bit='15' name='KASK4 MaxLeist'/><CHANNEL id='6' bit='16' name='KASK1 Run'/><CHANNEL id='6' bit='17' name='KASK2 Run'/><CHANNEL id='6' bit='18' name='KASK3 Run'/><CHANNEL id='6' bit='19' name='KASK4 Run'/><CHANNEL id='6' bit='20' name='KASK1 OK'/><CHANNEL id='6' bit='21' name='KASK2 OK'/><CHANNEL id='6' bit='22' name='KASK3 OK'/><CHANNEL id='6' bit='23' name='KASK4 OK'/><CHANNEL id='6' bit='24' name='Kask KWK Out'/><CHANNEL id='6' bit='25' name='Kask FW Out'/><CHANNEL id='6' bit='26' name='KASK KWK OK'/><CHANNEL id='6' bit='27' name='KASK FW OK'/><CHANNEL id='7' bit='0' name='DReg P2'/><CHANNEL id='7' bit='1' name='DReg P3'/><CHANNEL id='7' bit='2' name='DReg Mi auf'/><CHANNEL id='7' bit='3' name='DReg Mi zu'/><CHANNEL id='7' bit='5' name='DReg2 P2'/><CHANNEL id='7' bit='6' name='DReg2 Mi auf'/><CHANNEL id='7' bit='7' name='DReg2 Mi zu'/><CHANNEL id='7' bit='9' name='DReg3 P2'/><CHANNEL id='7' bit='10' name='DReg3 P3'/><CHANNEL id='7' bit='11' name='DReg3 Mi auf'/><CHANNEL id='7' bit='12' name='DReg3 Mi zu'/></DIGITAL></DAQPRJ>",
-        NANO_V14O3: "<DAQPRJ><ANALOG><CHANNEL id='0' name='ZK' dop='0'/><CHANNEL id='1' name='O2' unit='%'/><CHANNEL id='2' name='O2soll' unit='%'/><CHANNEL id='3' name='TK' unit='°C'/><CHANNEL id='4' name='TKsoll' unit='°C' dop='0'/><CHANNEL id='5' name='TRL' unit='°C'/><CHANNEL id='6' name='TRLsoll' unit='°C' dop='0'/><CHANNEL id='7' name='Spreizung' unit='°C'/><CHANNEL id='8' name='TRG' unit='°C'/><CHANNEL id='9' name='SZist' unit='%' dop='0'/><CHANNEL id='10' name='SZsoll' unit='%'/><CHANNEL id='11' name='TPo' unit='°C'/><CHANNEL id='12' name='TPm' unit='°C'/><CHANNEL id='13' name='TPu' unit='°C'/><CHANNEL id='14' name='Puff Füllgrad' unit='%' dop='0'/><CHANNEL id='15' name='Puffer_soll oben' unit='°C' dop='0'/><CHANNEL id='16' name='Puffer_soll unten' unit='°C' dop='0'/><CHANNEL id='17' name='PuffZustand' dop='0'/><CHANNEL id='18' name='Max Anf Kessel' dop='0'/><CHANNEL id='19' name='TFW' unit='°C' dop='0'/><CHANNEL id='20' name='Leistung' unit='%' dop='0'/><CHANNEL id='21' name='ESsoll' unit='%'/><CHANNEL id='22' name='min.Leist.TRG' unit='%'/><CHANNEL id='23' name='max.Leist.TRG' unit='%'/><CHANNEL id='24' name='max.Leist.Fuell' unit='%'/><CHANNEL id='25' name='max.Leist.TPO' unit='%'/><CHANNEL id='26' name='ESRegler' unit='%' dop='0'/><CHANNEL id='27' name='Regler K'/><CHANNEL id='28' name='KeBrstScale' unit='%' dop='0'/><CHANNEL id='29' name='Programm' dop='0'/><CHANNEL id='30' name='Störungs Nr' dop='0'/><CHANNEL id='31' name='Max Anf ZenPuf' unit='°C' dop='0'/><CHANNEL id='32' name='I Es' unit='mA' dop='0'/><CHANNEL id='33' name='I Ra' unit='mA' dop='0'/><CHANNEL id='34' name='I Aa' unit='mA' dop='0'/><CHANNEL id='35' name='I Sr' unit='mA' dop='0'/><CHANNEL id='36' name='I Rein' unit='mA' dop='0'/><CHANNEL id='37' name='LZ ES seit Füll.' unit='Min' dop='0'/><CHANNEL id='38' name='LZ ES seit Ent.' unit='Min' dop='0'/><CHANNEL id='39' name='Anzahl Entasch.' dop='0'/><CHANNEL id='40' name='Anzahl SR Beweg.' dop='0'/><CHANNEL id='41' name='Lagerstand' unit='kg' dop='0'/><CHANNEL id='42' name='Verbrauchszähler' unit='kg' dop='0'/><CHANNEL id='43' name='Heiz P Lambda' unit='W' dop='2'/><CHANNEL id='44' name='Heiz U Lambda' unit='V' dop='2'/><CHANNEL id='45' name='Heiz I Lambda' unit='mA' dop='0'/><CHANNEL id='46' name='U_Lambda' unit='mV'/><CHANNEL id='47' name='U Netzteil' unit='mV' dop='0'/><CHANNEL id='48' name='T Spülung' unit='°C'/><CHANNEL id='49' name='BRT' unit='°C'/><CHANNEL id='50' name='Tplat' unit='°C' dop='0'/><CHANNEL id='51' name='TVG' unit='°C'/><CHANNEL id='52' name='TVG2' unit='°C'/><CHANNEL id='53' name='AIN17' unit='V'/><CHANNEL id='54' name='Taus' unit='°C'/><CHANNEL id='55' name='TA Gem.' unit='°C'/><CHANNEL id='56' name='Ext.HK Soll' unit='°C' dop='0'/><CHANNEL id='57' name='TVL_A' unit='°C'/><CHANNEL id='58' name='TVLs_A' unit='°C' dop='0'/><CHANNEL id='59' name='TRA_A' unit='°C'/><CHANNEL id='60' name='TRs_A' unit='°C'/><CHANNEL id='61' name='HKZustand_A' dop='0'/><CHANNEL id='62' name='FRA Zustand' dop='0'/><CHANNEL id='63' name='TVL_1' unit='°C'/><CHANNEL id='64' name='TVLs_1' unit='°C' dop='0'/><CHANNEL id='65' name='TRA_1' unit='°C'/><CHANNEL id='66' name='TRs_1' unit='°C'/><CHANNEL id='67' name='HKZustand_1' dop='0'/><CHANNEL id='68' name='FR1 Zustand' dop='0'/><CHANNEL id='69' name='TVL_2' unit='°C'/><CHANNEL id='70' name='TVLs_2' unit='°C' dop='0'/><CHANNEL id='71' name='TRA_2' unit='°C'/><CHANNEL id='72' name='TRs_2' unit='°C'/><CHANNEL id='73' name='HKZustand_2' dop='0'/><CHANNEL id='74' name='FR2 Zustand' dop='0'/><CHANNEL id='75' name='TVL_B' unit='°C'/><CHANNEL id='76' name='TVLs_B' unit='°C' dop='0'/><CHANNEL id='77' name='TRA_B' unit='°C'/><CHANNEL id='78' name='TRs_B' unit='°C'/><CHANNEL id='79' name='HKZustand_B' dop='0'/><CHANNEL id='80' name='FRB Zustand' dop='0'/><CHANNEL id='81' name='TBA' unit='°C'/><CHANNEL id='82' name='TBs_A' unit='°C' dop='0'/><CHANNEL id='83' name='TB1' unit='°C'/><CHANNEL id='84' name='TBs_1' unit='°C' dop='0'/><CHANNEL id='85' name='BoiZustand_1' dop='0'/><CHANNEL id='86' name='TBB' unit='°C'/><CHANNEL id='87' name='TBs_B' unit='°C' dop='0'/><CHANNEL id='88' name='HKR Anf' unit='°C'/><CHANNEL id='89' name='Anf. HKR0' unit='°C' dop='0'/><CHANNEL id='90' name='Anf. HKR1' unit='°C' dop='0'/><CHANNEL id='91' name='Anf. HKR2' unit='°C' dop='0'/><CHANNEL id='92' name='Anf. HKR3' unit='°C' dop='0'/><CHANNEL id='93' name='Anf. HKR4' unit='°C' dop='0'/><CHANNEL id='94' name='Anf. HKR5' unit='°C' dop='0'/><CHANNEL id='95' name='Anf. HKR6' unit='°C' dop='0'/><CHANNEL id='96' name='Anf. HKR7' unit='°C' dop='0'/><CHANNEL id='97' name='Anf. HKR8' unit='°C' dop='0'/><CHANNEL id='98' name='Anf. HKR9' unit='°C' dop='0'/><CHANNEL id='99' name='Anf. HKR10' unit='°C' dop='0'/><CHANNEL id='100' name='Anf. HKR11' unit='°C' dop='0'/><CHANNEL id='101' name='Anf. HKR12' unit='°C' dop='0'/><CHANNEL id='102' name='Anf. HKR13' unit='°C' dop='0'/><CHANNEL id='103' name='Anf. HKR14' unit='°C' dop='0'/><CHANNEL id='104' name='Anf. HKR15' unit='°C' dop='0'/></ANALOG><DIGITAL><CHANNEL id='0' bit='0' name='Störung'/><CHANNEL id='0' bit='1' name='Stb'/><CHANNEL id='0' bit='2' name='Fuellstand'/><CHANNEL id='0' bit='3' name='RLP/PuffP'/><CHANNEL id='0' bit='4' name='RLm_auf'/><CHANNEL id='0' bit='5' name='RLm_zu'/><CHANNEL id='0' bit='10' name='WS freig.'/><CHANNEL id='0' bit='11' name='Akt. Code'/><CHANNEL id='0' bit='14' name='FW Freig.'/><CHANNEL id='0' bit='15' name='gFlP'/><CHANNEL id='0' bit='16' name='gFlM auf'/><CHANNEL id='0' bit='17' name='gFlM zu'/><CHANNEL id='0' bit='18' name='gFl2P'/><CHANNEL id='0' bit='19' name='gFl2M auf'/><CHANNEL id='0' bit='20' name='gFl2M zu'/><CHANNEL id='1' bit='0' name='L Heiz.'/><CHANNEL id='1' bit='1' name='Z Heiz.'/><CHANNEL id='1' bit='2' name='Z Geb.'/><CHANNEL id='1' bit='3' name='AA Run'/><CHANNEL id='1' bit='4' name='AA Dir'/><CHANNEL id='1' bit='5' name='ES Run'/><CHANNEL id='1' bit='6' name='ES Dir'/><CHANNEL id='1' bit='7' name='AS Saug'/><CHANNEL id='1' bit='8' name='AS RA Run'/><CHANNEL id='1' bit='9' name='AS RA Dir'/><CHANNEL id='1' bit='10' name='Rein En'/><CHANNEL id='1' bit='11' name='Rein Run'/><CHANNEL id='1' bit='12' name='Es Rein Endl'/><CHANNEL id='1' bit='13' name='sAS Anf Füll'/><CHANNEL id='2' bit='0' name='HKPA'/><CHANNEL id='2' bit='1' name='MAA'/><CHANNEL id='2' bit='2' name='MAZ'/><CHANNEL id='2' bit='3' name='HKP1'/><CHANNEL id='2' bit='4' name='M1A'/><CHANNEL id='2' bit='5' name='M1Z'/><CHANNEL id='2' bit='6' name='HKP2'/><CHANNEL id='2' bit='7' name='M2A'/><CHANNEL id='2' bit='8' name='M2Z'/><CHANNEL id='2' bit='9' name='HKP3'/><CHANNEL id='2' bit='10' name='M3A'/><CHANNEL id='2' bit='11' name='M3Z'/><CHANNEL id='2' bit='12' name='HKP4'/><CHANNEL id='2' bit='13' name='M4A'/><CHANNEL id='2' bit='14' name='M4Z'/><CHANNEL id='2' bit='15' name='HKP5'/><CHANNEL id='2' bit='16' name='M5A'/><CHANNEL id='2' bit='17' name='M5Z'/><CHANNEL id='2' bit='18' name='HKP6'/><CHANNEL id='2' bit='19' name='M6A'/><CHANNEL id='2' bit='20' name='M6Z'/><CHANNEL id='2' bit='21' name='HKPB'/><CHANNEL id='2' bit='22' name='MBA'/><CHANNEL id='2' bit='23' name='MBZ'/><CHANNEL id='3' bit='0' name='BPA'/><CHANNEL id='3' bit='1' name='BP1'/><CHANNEL id='3' bit='2' name='BP2'/><CHANNEL id='3' bit='3' name='BP3'/><CHANNEL id='3' bit='4' name='BPB'/><CHANNEL id='3' bit='5' name='BZPA'/><CHANNEL id='3' bit='6' name='BZP1'/><CHANNEL id='3' bit='7' name='BZP2'/><CHANNEL id='3' bit='8' name='BZP3'/><CHANNEL id='3' bit='9' name='BZPB'/><CHANNEL id='4' bit='0' name='Aschebox'/><CHANNEL id='4' bit='1' name='Netztrafo'/><CHANNEL id='4' bit='2' name='Netzrelais'/><CHANNEL id='4' bit='4' name='Lagerraum'/><CHANNEL id='4' bit='6' name='FLP'/><CHANNEL id='4' bit='8' name='ATW'/><CHANNEL id='4' bit='9' name='Entasch gesp.'/><CHANNEL id='4' bit='13' name='HKV'/><CHANNEL id='4' bit='14' name='Spülung Aktiv'/><CHANNEL id='6' bit='0' name='EHK Anf'/><CHANNEL id='6' bit='2' name='EHK Anf2'/><CHANNEL id='6' bit='3' name='EHK Anf3'/><CHANNEL id='6' bit='4' name='EHKP'/><CHANNEL id='6' bit='6' name='EHKP2'/><CHANNEL id='6' bit='7' name='EHKP3'/><CHANNEL id='6' bit='8' name='KASK1 MinLeist'/><CHANNEL id='6' bit='9' name='KASK2 MinLeist'/><CHANNEL id='6' bit='10' name='KASK3 MinLeist'/><CHANNEL id='6' bit='11' name='KASK4 MinLeist'/><CHANNEL id='6' bit='12' name='KASK1 MaxLeist'/><CHANNEL id='6' bit='13' name='KASK2 MaxLeist'/><CHANNEL id='6' bit='14' name='KASK3 MaxLeist'/><CHANNEL id='6' bit='15' name='KASK4 MaxLeist'/><CHANNEL id='6' bit='16' name='KASK1 Run'/><CHANNEL id='6' bit='17' name='KASK2 Run'/><CHANNEL id='6' bit='18' name='KASK3 Run'/><CHANNEL id='6' bit='19' name='KASK4 Run'/><CHANNEL id='6' bit='20' name='KASK1 OK'/><CHANNEL id='6' bit='21' name='KASK2 OK'/><CHANNEL id='6' bit='22' name='KASK3 OK'/><CHANNEL id='6' bit='23' name='KASK4 OK'/><CHANNEL id='6' bit='24' name='Kask KWK Out'/><CHANNEL id='6' bit='25' name='Kask FW Out'/><CHANNEL id='6' bit='26' name='KASK KWK OK'/><CHANNEL id='6' bit='27' name='KASK FW OK'/><CHANNEL id='7' bit='0' name='DReg P2'/><CHANNEL id='7' bit='1' name='DReg P3'/><CHANNEL id='7' bit='2' name='DReg Mi auf'/><CHANNEL id='7' bit='3' name='DReg Mi zu'/><CHANNEL id='7' bit='5' name='DReg2 P2'/><CHANNEL id='7' bit='6' name='DReg2 Mi auf'/><CHANNEL id='7' bit='7' name='DReg2 Mi zu'/><CHANNEL id='7' bit='9' name='DReg3 P2'/><CHANNEL id='7' bit='10' name='DReg3 P3'/><CHANNEL id='7' bit='11' name='DReg3 Mi auf'/><CHANNEL id='7' bit='12' name='DReg3 Mi zu'/></DIGITAL></DAQPRJ>"
-    }
+    NAMES = (NANO_V14K, NANO_V14L, NANO_V14M, NANO_V14N, NANO_V14N2, NANO_V14O3)
+
+    DIRECTORY = Path(__file__).parent / "msgformats"
+
+    @classmethod
+    def path(cls, name):
+        """Return the file of a built-in template."""
+        return cls.DIRECTORY / (name + ".xml")
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def load(cls, name):
+        """Read a built-in template (blocking I/O, cached)."""
+        return cls.path(name).read_text("utf-8")
 
 
 
@@ -54,7 +76,6 @@ class HargassnerParameter:
     def __init__(self, key, index, unit):
         self._key = key
         self._index = index
-        self._value = None
         self._unit = unit
         if key in ["LZ ES seit Füll.", "LZ ES seit Ent.", "Anzahl Entasch.", "Anzahl SR Beweg.", "Verbrauchszähler"]:
             self._stateClass = "total_increasing"
@@ -63,18 +84,11 @@ class HargassnerParameter:
         else:
             self._stateClass = "measurement"
     
-    def __str__(self):
-        if self.value(): return self.description() + " : " + self.value() + " " + self.unit()
-        else: return self.description() + " : unknown"
-    
     def key(self):
         return self._key
     
     def index(self):
         return self._index
-            
-    def value(self):
-        return self._value
     
     def unit(self):
         return self._unit
@@ -88,11 +102,12 @@ class HargassnerParameter:
 
 class HargassnerAnalogueParameter(HargassnerParameter):
     
-    def __init__(self, key, index, unit):
+    def __init__(self, key, index, unit, dop=None):
         super().__init__(key, index, unit)
-        
-    def initializeFromMessage(self, msg):
-        self._value = msg[self._index]
+        self._dop = dop
+
+    def dop(self):
+        return self._dop
 
 
 class HargassnerDigitalParameter(HargassnerParameter):
@@ -100,261 +115,314 @@ class HargassnerDigitalParameter(HargassnerParameter):
     def __init__(self, key, index, bitmask):
         super().__init__(key, index, None)
         self._bitmask = bitmask
-    
-    def initializeFromMessage(self, msg):
-        raw = msg[self._index]
-        try:
-            value = int(raw, 16)
-        except Exception:
-            try:
-                value = int(float(raw))
-            except Exception:
-                self._value = None
-                return
-        self._value = str((value & self._bitmask) > 0)
 
+    def bitmask(self):
+        return self._bitmask
 
-SCAN_INTERVAL = timedelta(seconds=5)
 
 class HargassnerBridge(Entity):
-    """Bridge entity for Hargassner boiler communication."""
+    """Bridge entity for Hargassner boiler communication.
 
-    # Exponential backoff constants
-    _RECONNECT_DELAY_MIN = 1.0  # Start with 1 second
-    _RECONNECT_DELAY_MAX = 30.0  # Max 30 seconds
-    _RECONNECT_BACKOFF_FACTOR = 2.0  # Double each time
+    The bridge subscribes to the shared session of its boiler, which
+    hands over every pm line as it arrives; each decoded frame is pushed to
+    the registered listeners, so entities do not need to poll.
+    """
 
-    def __init__(self, hostIP, name, uniqueId, updateInterval=1.0, msgFormat=HargassnerMessageTemplates.NANO_V14L):
+    # Minimum interval between state writes of the bridge entity itself
+    _STATE_WRITE_INTERVAL = timedelta(seconds=5)
+
+    def __init__(self, hostIP, name, uniqueId, updateInterval=1.0, msgFormat=HargassnerMessageTemplates.NANO_V14L, layout=None):
         super().__init__()
-        self._hostIP = hostIP
+        self._hostIP = hostIP  # boiler address, see transport.py
         self._connectionOK = False
-        self._reader = None
-        self._writer = None
+        self._connection = None
         self._latestUpdate = None
         self._paramData = {}
+        self._values = {}
+        self._digitalWords = None
+        self._decodePlan = HargassnerDecodePlan((), ())
         self._expectedMsgLength = 0
         self._missedMsgs = 0
         self._actualMsgLength = None
         self._errorLog = ""
         self._infoLog = ""
+        self._deviceName = name
         self._name = name + " connection"
         self._unique_id = uniqueId
 
-        # Connection statistics and retry logic
-        self._reconnect_delay = self._RECONNECT_DELAY_MIN
-        self._connection_attempts = 0
-        self._total_reconnects = 0
-        self._last_connection_error = None
-        self._last_connection_attempt = None
+        # Push-based ingestion
+        self._coordinator = HargassnerCoordinator()
+        self._last_state_write = None
+
+        # Deadband per unit class (temperature, percent, other) and per channel
+        self._deadbandSettings = (0.0, 0.0, 0.0, {})
+        self._heartbeat = DEFAULT_HEARTBEAT
+        self._deadband = HargassnerDeadbandFilter({}, self._heartbeat)
+        self._heartbeatKeys = frozenset()
+
+        # Hourly statistics of statistics-only channels
+        self._statistics = None
 
-        self.setMessageFormat(msgFormat)
+        # Optional archive of the raw pm frames
+        self._archive = None
+
+        # Per-stage timing of the frames, see timing.py
+        self._timing = HargassnerFrameTiming()
+
+        if layout is not None: self.setLayout(layout)
+        else: self.setMessageFormat(msgFormat)
         
         
     def setMessageFormat(self, msgFormat):
-        if msgFormat in HargassnerMessageTemplates.DICT:
-            msgFormat = HargassnerMessageTemplates.DICT[msgFormat] # if one of the constants has been passed, expand to full format string
-        if not msgFormat.startswith("<DAQPRJ>"):
-            self._errorLog += "HargassnerBridge.setMessageFormat(): Message template does not start with '<DAQPRJ>'.\n"
+        """Parse a DAQPRJ descriptor (or built-in template name) and apply it.
+
+        This parses synchronously; setup code should get the layout from the
+        layout cache instead and pass it to setLayout().
+        """
+        if msgFormat in HargassnerMessageTemplates.NAMES:
+            msgFormat = HargassnerMessageTemplates.load(msgFormat) # if one of the constants has been passed, expand to full format string
+        try:
+            layout = parse_layout(msgFormat)
+        except ValueError as err:
+            self._errorLog += "HargassnerBridge.setMessageFormat(): " + str(err) + ".\n"
             return False
+        return self.setLayout(layout)
+
+    def setLayout(self, layout):
+        """Apply a compiled layout as returned by parse_layout()."""
         self._paramData = {}
-        root = xml.fromstring(msgFormat)
-        analog = root.find("ANALOG")
-        for channel in analog.findall("CHANNEL"):
-            uniqueName = (str)(channel.get("name"))
-            nameCount = 1
-            while uniqueName in self._paramData: # in case parameter name is duplicate, add a counter to make it unique
-                nameCount += 1
-                uniqueName = (str)(channel.get("name")) + "_" + str(nameCount)
-            chUnit = channel.get("unit")
-            if chUnit is not None: strUnit = (str)(chUnit)
-            else: strUnit = None # in case parameter has no unit, do not use string conversion but set explicitly to None
-            self._paramData[uniqueName] = HargassnerAnalogueParameter(uniqueName, (int)(channel.get("id")), strUnit)
-        ofsDigital = len(self._paramData) # assuming that channel ids/indices are listed consecutively without any misses!
-        lenDigital = 0
-        digital = root.find("DIGITAL")
-        for channel in digital.findall("CHANNEL"):
-            self._paramData[(str)(channel.get("name"))] = HargassnerDigitalParameter( (str)(channel.get("name")), ofsDigital + (int)(channel.get("id")),  1 << (int)(channel.get("bit")))
-            lenDigital = (int)(channel.get("id")) + 1 # assuming that channel ids are increasing
-        self._expectedMsgLength = ofsDigital + lenDigital
-        self._infoLog += "HargassnerBridge.setMessageFormat(): successfully parsed " + (str)(self._expectedMsgLength) + " elements.\n"
+        for key, index, unit, dop in layout["analog"]:
+            self._paramData[key] = HargassnerAnalogueParameter(key, index, unit, dop)
+        for key, index, bitmask in layout["digital"]:
+            self._paramData[key] = HargassnerDigitalParameter(key, index, bitmask)
+        self._expectedMsgLength = layout["length"]
+        # frames are decoded through the compiled plan, the parameter objects only carry the metadata
+        self._decodePlan = HargassnerDecodePlan(
+            [(p.key(), p.index(), p.dop()) for p in self._paramData.values() if isinstance(p, HargassnerAnalogueParameter)],
+            [(p.key(), p.index(), p.bitmask()) for p in self._paramData.values() if isinstance(p, HargassnerDigitalParameter)],
+        )
+        self._values = {}
+        self._digitalWords = None
+        self._applyDeadband()
+        self._infoLog += "HargassnerBridge.setLayout(): successfully applied " + (str)(self._expectedMsgLength) + " elements.\n"
         return True
-        
+
+    def setDeadband(self, temperature=0.0, percent=0.0, default=0.0, channels=None, heartbeat=DEFAULT_HEARTBEAT):
+        """Configure when analogue channels count as changed.
+
+        A value is only pushed to the entities when it leaves the band around
+        the last pushed value. Bands apply per unit class (°C, %, other units)
+        and can be overridden per channel; channels without unit and counters
+        always use exact match. `heartbeat` is the max age in seconds after
+        which a value is pushed anyway (0 disables it).
+        """
+        self._deadbandSettings = (temperature, percent, default, dict(channels or {}))
+        self._heartbeat = heartbeat
+        self._applyDeadband()
+
+    def setArchive(self, archive):
+        """Archive every pm line of the session to `archive` (a HargassnerArchiveWriter, or None).
+
+        The session feeds the archive itself, before a backlog is cut down to
+        its newest frame, so frames the bridge never parses are kept as well.
+        Takes effect when the bridge is added to hass.
+        """
+        self._archive = archive
+
+    def setStatisticsChannels(self, keys):
+        """Aggregate the given analogue channels into hourly statistics.
+
+        Returns the set of accepted keys; unknown and digital channels are
+        reported in the error log and ignored.
+        """
+        channels = {}
+        for key in keys:
+            param = self._paramData.get(key)
+            if not isinstance(param, HargassnerAnalogueParameter):
+                self._errorLog += "HargassnerBridge.setStatisticsChannels(): Parameter key " + key + " not known or not analogue.\n"
+                continue
+            channels[key] = (param.description(), param.unit())
+        self._statistics = HargassnerStatistics(self._unique_id, self._deviceName, channels) if channels else None
+        return set(channels)
+
+    def _applyDeadband(self):
+        temperature, percent, default, channels = self._deadbandSettings
+        bands = {}
+        for key, param in self._paramData.items():
+            if not isinstance(param, HargassnerAnalogueParameter):
+                continue
+            if key in channels:
+                band = channels[key]
+            elif not param.unit() or param.stateClass() != "measurement":
+                band = 0.0 # exact match for enums, states and counters
+            elif param.unit() == "°C":
+                band = temperature
+            elif param.unit() == "%":
+                band = percent
+            else:
+                band = default
+            if band:
+                bands[key] = band
+        for key in channels:
+            if key not in self._paramData:
+                self._errorLog += "HargassnerBridge.setDeadband(): Parameter key " + key + " not known.\n"
+        self._deadband = HargassnerDeadbandFilter(bands, self._heartbeat)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the shared session of the boiler."""
+        await super().async_added_to_hass()
+        if self._archive is not None:
+            self._archive.start()
+        manager = async_get_connection_manager(self.hass)
+        self.async_on_remove(manager.async_register_bridge(self))
+        try:
+            self._connection = manager.async_subscribe(
+                self._hostIP, self._handle_line, self._async_set_connection_state
+            )
+            if self._archive is not None:
+                self.async_on_remove(self._connection.async_add_archive(self._archive))
+        except ValueError as err:
+            _LOGGER.error("Hargassner %s: %s", self._hostIP, err)
+            self._errorLog += "HargassnerBridge.async_added_to_hass(): " + str(err) + "\n"
+
     async def async_will_remove_from_hass(self) -> None:
-        """Close connection."""
+        """Unsubscribe, the last bridge of a boiler closes the session."""
         await super().async_will_remove_from_hass()
-        if self._writer:
-            try:
-                self._writer.close()
-                await self._writer.wait_closed()
-            except Exception:
-                pass
-        
-    def _should_attempt_reconnect(self) -> bool:
-        """Check if we should attempt a reconnection based on backoff delay."""
-        if self._last_connection_attempt is None:
-            return True
-
-        time_since_last_attempt = (datetime.now() - self._last_connection_attempt).total_seconds()
-        return time_since_last_attempt >= self._reconnect_delay
-
-    def _reset_reconnect_delay(self):
-        """Reset reconnect delay after successful connection."""
-        self._reconnect_delay = self._RECONNECT_DELAY_MIN
-        self._connection_attempts = 0
-
-    def _increase_reconnect_delay(self):
-        """Increase reconnect delay using exponential backoff."""
-        self._reconnect_delay = min(
-            self._reconnect_delay * self._RECONNECT_BACKOFF_FACTOR,
-            self._RECONNECT_DELAY_MAX
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await async_get_connection_manager(self.hass).async_unsubscribe(connection, self._handle_line)
+        self._connectionOK = False
+        if self._archive is not None:
+            # flushes and compresses the open segment
+            await self.hass.async_add_executor_job(self._archive.close)
+
+    @callback
+    def async_add_listener(self, update_callback, keys=None):
+        """Register `update_callback(frame_time)` with the bridge coordinator.
+
+        With `keys` given, the callback only fires for frames in which one of
+        these parameters changed; digital channels count as changed only when
+        their bit flipped. Listeners are also called when the connection state
+        changes so that entities can refresh their availability. Returns a
+        function that removes the listener again.
+        """
+        return self._coordinator.async_add_listener(update_callback, keys)
+
+    @callback
+    def _async_notify_listeners(self, changed=None) -> None:
+        """Push the latest frame (or connection change) to the listeners.
+
+        `changed` holds the parameter keys that changed in this frame, None
+        notifies every listener.
+        """
+        self._coordinator.async_dispatch(changed, self._latestUpdate)
+
+    @callback
+    def _async_set_connection_state(self, connected: bool) -> None:
+        """Update the connection flag and publish the change."""
+        if self._connectionOK == connected:
+            return
+        self._connectionOK = connected
+        if connected:
+            self._missedMsgs = 0
+        self._heartbeatKeys = frozenset()
+        self._async_write_bridge_state(force=True)
+        self._async_notify_listeners()
+
+    @callback
+    def _async_write_bridge_state(self, force=False) -> None:
+        """Write the bridge state, throttled unless forced."""
+        if self.hass is None:
+            return
+        now = datetime.now()
+        if not force and self._last_state_write is not None and now - self._last_state_write < self._STATE_WRITE_INTERVAL:
+            return
+        self._last_state_write = now
+        started = time.perf_counter()
+        self.async_write_ha_state()
+        self._timing.add_state_write(time.perf_counter() - started)
+
+    @callback
+    def _handle_line(self, line: bytes) -> None:
+        """Process one complete pm line and publish it, or count a miss."""
+        started = time.perf_counter()
+        changed = self._process_line(line)
+        if changed is not None:
+            self._latestUpdate = datetime.now()
+            self._missedMsgs = 0
+            timing = self._timing
+            timing.frame_writes = 0.0
+            dispatched = time.perf_counter()
+            self._async_notify_listeners(changed)
+            self._async_write_bridge_state()
+            finished = time.perf_counter()
+            timing.dispatch.add(finished - dispatched - timing.frame_writes)
+            timing.state_write.add(timing.frame_writes)
+            timing.loop.add(finished - started)
+            return
+
+        self._missedMsgs += 1
+        _LOGGER.warning(
+            "Hargassner %s: No valid message received (%d consecutive misses)",
+            self._name, self._missedMsgs
         )
-        self._connection_attempts += 1
-
-    async def async_update(self):
-        if self._connectionOK:
-            try:
-                msgReceived = False
-                data = await asyncio.wait_for(self._reader.read(64*1024), timeout=BRIDGE_TIMEOUT)   # read up to 64k
-
-                if not data:
-                    _LOGGER.warning(
-                        "Hargassner %s: Empty data received, connection might be closed",
-                        self._name
-                    )
-                    self._connectionOK = False
-                    return
-
-                lines = data.decode().strip().split("\n")
-                for l in reversed(lines):
-                    # Split and validate line format
-                    parts = l.split()
-                    if len(parts) < 2:  # Need at least "pm" + 1 data field
-                        continue
-
-                    msg = parts[1:]  # remove first field "pm"
-                    if len(msg) < self._expectedMsgLength:
-                        _LOGGER.debug(
-                            "Hargassner %s: Message too short (%d < %d), skipping",
-                            self._name, len(msg), self._expectedMsgLength
-                        )
-                        continue
-
-                    if self._actualMsgLength != len(msg):
-                        self._actualMsgLength = len(msg)
-                        if len(msg) != self._expectedMsgLength:
-                            _LOGGER.info(
-                                "Hargassner %s: Adjusting message length to %d (expected %d)",
-                                self._name, len(msg), self._expectedMsgLength
-                            )
-                            self._expectedMsgLength = len(msg)
-
-                    for param in self._paramData.values():
-                        param.initializeFromMessage(msg)
-
-                    self._latestUpdate = datetime.now()
-                    msgReceived = True
-                    self._missedMsgs = 0
-                    break
-
-                if not msgReceived:
-                    self._missedMsgs += 1
-                    _LOGGER.warning(
-                        "Hargassner %s: No valid message received (%d consecutive misses)",
-                        self._name, self._missedMsgs
-                    )
-                    if self._missedMsgs > 10:
-                        _LOGGER.error(
-                            "Hargassner %s: Too many consecutive message failures, forcing reconnect",
-                            self._name
-                        )
-                        self._connectionOK = False
-
-            except asyncio.TimeoutError:
-                _LOGGER.warning(
-                    "Hargassner %s: Timeout reading data (%.1fs)",
-                    self._name, BRIDGE_TIMEOUT
-                )
-                self._connectionOK = False
-            except UnicodeDecodeError as e:
-                _LOGGER.error(
-                    "Hargassner %s: Failed to decode message data: %s",
-                    self._name, e
-                )
-                self._missedMsgs += 1
-                if self._missedMsgs > 10:
-                    self._connectionOK = False
-            except Exception as e:
-                _LOGGER.error(
-                    "Hargassner %s: Connection error: %s",
-                    self._name, e, exc_info=True
-                )
-                self._connectionOK = False
-                self._last_connection_error = str(e)
-        else:
-            # Reconnection logic with exponential backoff
-            if not self._should_attempt_reconnect():
-                _LOGGER.debug(
-                    "Hargassner %s: Waiting %.1fs before next reconnect attempt",
-                    self._name, self._reconnect_delay
-                )
-                return
-
-            self._last_connection_attempt = datetime.now()
-            _LOGGER.info(
-                "Hargassner %s: Attempting connection to %s:23 (attempt #%d, delay: %.1fs)",
-                self._name, self._hostIP, self._connection_attempts + 1, self._reconnect_delay
+        if self._missedMsgs > 10:
+            _LOGGER.error(
+                "Hargassner %s: Too many consecutive message failures, forcing reconnect",
+                self._name
             )
+            self._missedMsgs = 0
+            if self._connection is not None:
+                self._connection.async_reconnect()
+
+    def _process_line(self, line: bytes):
+        """Decode one pm line (bytes) into the parameters.
+
+        Returns the set of parameter keys that changed, or None if the line
+        is not a valid frame.
+        """
+        started = time.perf_counter()
+        # Split only the fields the layout needs, the rest is just counted
+        needed = self._decodePlan.min_length
+        msg, msgLength = split_pm_fields(line, None if needed is None else max(self._expectedMsgLength, needed))
+        if msgLength < 1:  # Need at least "pm" + 1 data field
+            return None
+
+        if msgLength < self._expectedMsgLength:
+            _LOGGER.debug(
+                "Hargassner %s: Message too short (%d < %d), skipping",
+                self._name, msgLength, self._expectedMsgLength
+            )
+            return None
 
-            try:
-                if self._writer:
-                    try:
-                        self._writer.close()
-                        await self._writer.wait_closed()
-                    except Exception as e:
-                        _LOGGER.debug(
-                            "Hargassner %s: Error closing old connection: %s",
-                            self._name, e
-                        )
-
-                self._reader, self._writer = await asyncio.wait_for(
-                    asyncio.open_connection(self._hostIP, 23),
-                    timeout=BRIDGE_TIMEOUT
-                )
-
-                self._connectionOK = True
-                self._total_reconnects += 1
-                self._reset_reconnect_delay()
-
+        if self._actualMsgLength != msgLength:
+            self._actualMsgLength = msgLength
+            if msgLength != self._expectedMsgLength:
                 _LOGGER.info(
-                    "Hargassner %s: Successfully connected to %s:23 (total reconnects: %d)",
-                    self._name, self._hostIP, self._total_reconnects
+                    "Hargassner %s: Adjusting message length to %d (expected %d)",
+                    self._name, msgLength, self._expectedMsgLength
                 )
+                self._expectedMsgLength = msgLength
+
+        parsed = time.perf_counter()
+        self._values, words = self._decodePlan.decode(msg)
+        if self._statistics is not None:
+            completed = self._statistics.fold(self._values, dt_util.utcnow())
+            if completed and self.hass is not None:
+                async_write_statistics(self.hass, completed)
+        changed = set(self._deadband.changed(self._values, time.monotonic()))
+        self._heartbeatKeys = frozenset(self._deadband.heartbeat())
+        changed.update(self._decodePlan.changed_bits(self._digitalWords, words))
+        self._digitalWords = words
+        self._timing.parse.add(parsed - started)
+        self._timing.decode.add(time.perf_counter() - parsed)
+        return changed
+
+    @property
+    def should_poll(self) -> bool:
+        """Frames are pushed by the reader task, no polling needed."""
+        return False
 
-            except asyncio.TimeoutError:
-                error_msg = f"Connection timeout after {BRIDGE_TIMEOUT}s"
-                _LOGGER.warning(
-                    "Hargassner %s: %s",
-                    self._name, error_msg
-                )
-                self._last_connection_error = error_msg
-                self._increase_reconnect_delay()
-            except OSError as e:
-                error_msg = f"Network error: {e}"
-                _LOGGER.warning(
-                    "Hargassner %s: %s",
-                    self._name, error_msg
-                )
-                self._last_connection_error = error_msg
-                self._increase_reconnect_delay()
-            except Exception as e:
-                error_msg = f"Unexpected error: {e}"
-                _LOGGER.error(
-                    "Hargassner %s: %s",
-                    self._name, error_msg, exc_info=True
-                )
-                self._last_connection_error = error_msg
-                self._increase_reconnect_delay()
-    
     @property
     def name(self) -> str:
         """Return the name of the entity."""
@@ -380,20 +448,21 @@ class HargassnerBridge(Entity):
     @property
     def extra_state_attributes(self):
         """Return additional state attributes."""
+        connection = self._connection
         attrs = {
             "host": self._hostIP,
-            "total_reconnects": self._total_reconnects,
-            "connection_attempts": self._connection_attempts,
+            "total_reconnects": connection.total_reconnects if connection else 0,
+            "connection_attempts": connection.connection_attempts if connection else 0,
         }
 
         if self._latestUpdate:
             attrs["last_update"] = self._latestUpdate.isoformat()
 
-        if self._last_connection_error:
-            attrs["last_error"] = self._last_connection_error
+        if connection and connection.last_error:
+            attrs["last_error"] = connection.last_error
 
-        if not self._connectionOK:
-            attrs["next_retry_delay_seconds"] = round(self._reconnect_delay, 1)
+        if connection and not self._connectionOK:
+            attrs["next_retry_delay_seconds"] = round(connection.reconnect_delay, 1)
 
         return attrs
 
@@ -413,7 +482,20 @@ class HargassnerBridge(Entity):
         if param==None: 
             self._errorLog += "HargassnerBridge.getValue(): Parameter key " + paramName + " not known.\n"
             return None 
-        return param.value()
+        if paramName in self._decodePlan.bits:
+            # digital channels are returned natively as bool (None if not received yet)
+            if self._digitalWords is None:
+                return None
+            return self._decodePlan.bit(self._digitalWords, paramName)
+        return self._values.get(paramName)
+
+    def isHeartbeat(self, paramName):
+        """Return True if the current frame emitted `paramName` only because of the heartbeat.
+
+        Its value did not leave the deadband, but the state has to be written
+        anyway so that last_reported stays fresh.
+        """
+        return paramName in self._heartbeatKeys
     
     def getUnit(self, paramName):
         param = self._paramData.get(paramName)
@@ -431,7 +513,27 @@ class HargassnerBridge(Entity):
     
     def data(self):
         return self._paramData
+
+    def coordinator(self):
+        """Return the coordinator fanning frames out to the entities."""
+        return self._coordinator
+
+    def hasRecentData(self, maxAge=60):
+        """Return True if a valid frame arrived within the last `maxAge` seconds."""
+        return self._latestUpdate is not None and (datetime.now() - self._latestUpdate).total_seconds() < maxAge
+
+    def decodePlan(self):
+        """Return the compiled decode plan of the current message format."""
+        return self._decodePlan
+
+    def digitalWords(self):
+        """Return the digital words of the latest frame as integer bitsets."""
+        return self._digitalWords
     
+    def timing(self):
+        """Return the per-stage timing of the frames (see timing.py)."""
+        return self._timing
+
     def latestUpdateTime(self):
         return self._latestUpdate
     
@@ -447,6 +549,8 @@ class HargassnerBridge(Entity):
 
     def get_diagnostics_data(self) -> dict:
         """Return diagnostics data for this bridge."""
+        connection = self._connection
+        framer = connection.framer if connection else None
         return {
             "bridge_info": {
                 "name": self._name,
@@ -454,18 +558,19 @@ class HargassnerBridge(Entity):
                 "unique_id": self._unique_id,
             },
             "connection": {
-                "status": "connected" if self._connectionOK else "disconnected",
-                "total_reconnects": self._total_reconnects,
-                "current_connection_attempts": self._connection_attempts,
-                "reconnect_delay_seconds": round(self._reconnect_delay, 2),
-                "last_connection_error": self._last_connection_error,
-                "last_connection_attempt": self._last_connection_attempt.isoformat() if self._last_connection_attempt else None,
+                **(connection.diagnostics() if connection else {"status": "not_subscribed"}),
+                "session": connection.key if connection else None,
                 "last_successful_update": self._latestUpdate.isoformat() if self._latestUpdate else None,
             },
             "message_parsing": {
                 "expected_message_length": self._expectedMsgLength,
                 "actual_message_length": self._actualMsgLength,
                 "consecutive_missed_messages": self._missedMsgs,
+                "framed_lines": framer.lines if framer is not None else 0,
+                "discarded_lines": framer.discarded if framer is not None else 0,
+                "buffer_overflows": framer.overflows if framer is not None else 0,
+                "lines_with_telnet_noise": framer.cleaned if framer is not None else 0,
+                "skipped_backlog_frames": framer.skipped if framer is not None else 0,
                 "total_parameters": len(self._paramData),
             },
             "parameters": {
@@ -475,8 +580,14 @@ class HargassnerBridge(Entity):
                     "digital": sum(1 for p in self._paramData.values() if isinstance(p, HargassnerDigitalParameter)),
                 },
             },
+            "archive": self._archive.diagnostics() if self._archive else None,
+            # milliseconds per stage, read and framing are per read of the shared session
+            "timing": {
+                **(connection.timing.diagnostics() if connection else {}),
+                **self._timing.diagnostics(),
+            },
             "health": {
-                "has_recent_data": self._latestUpdate is not None and (datetime.now() - self._latestUpdate).total_seconds() < 60,
+                "has_recent_data": self.hasRecentData(),
                 "connection_stable": self._connectionOK and self._missedMsgs == 0,
             },
         }
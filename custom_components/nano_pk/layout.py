@@ -0,0 +1,81 @@
+"""Compiled channel layouts of DAQPRJ descriptors.
+
+Parsing a DAQPRJ descriptor yields nothing but the channel specs the bridge
+needs: key, frame index, unit and decimal places of every analogue channel,
+key, frame index and bitmask of every digital channel, and the expected
+frame length. The compiled layout is plain JSON so it can be cached by the
+hash of the XML and persisted, which lets reloads skip XML parsing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import xml.etree.ElementTree as xml
+
+# Bump whenever the structure of compiled layouts changes, so that persisted
+# layouts of an older version are parsed again instead of being reused
+LAYOUT_VERSION = 1
+
+
+def layout_hash(msgFormat: str) -> str:
+    """Return the cache key of a DAQPRJ descriptor."""
+    return hashlib.sha256(msgFormat.encode("utf-8")).hexdigest()
+
+
+def parse_layout(msgFormat: str) -> dict:
+    """Parse a DAQPRJ descriptor into its compiled layout.
+
+    Returns a dict with
+    - "analog": [key, index, unit, dop] per channel (unit and dop may be None,
+      dop None means the values are not rounded),
+    - "digital": [key, index, bitmask] per channel bit,
+    - "length": the number of data fields of a frame.
+
+    Raises ValueError if the descriptor is not valid DAQPRJ XML.
+    """
+    if not msgFormat.startswith("<DAQPRJ>"):
+        raise ValueError("Message template does not start with '<DAQPRJ>'")
+    try:
+        root = xml.fromstring(msgFormat)
+    except xml.ParseError as err:
+        raise ValueError(f"Invalid DAQPRJ XML: {err}") from err
+
+    try:
+        return _compile(root)
+    except TypeError as err:  # missing id/bit attribute
+        raise ValueError(f"Incomplete DAQPRJ channel: {err}") from err
+
+
+def _compile(root) -> dict:
+    analog = []
+    keys = set()
+    section = root.find("ANALOG")
+    for channel in section.findall("CHANNEL") if section is not None else ():
+        uniqueName = str(channel.get("name"))
+        nameCount = 1
+        while uniqueName in keys:  # in case parameter name is duplicate, add a counter to make it unique
+            nameCount += 1
+            uniqueName = str(channel.get("name")) + "_" + str(nameCount)
+        keys.add(uniqueName)
+        chUnit = channel.get("unit")
+        chDop = channel.get("dop")
+        analog.append([
+            uniqueName,
+            int(channel.get("id")),
+            str(chUnit) if chUnit is not None else None,  # channels without unit keep None, not "None"
+            int(chDop) if chDop is not None else None,
+        ])
+
+    ofsDigital = len(analog)  # assuming that channel ids/indices are listed consecutively without any misses!
+    lenDigital = 0
+    digital = []
+    section = root.find("DIGITAL")
+    for channel in section.findall("CHANNEL") if section is not None else ():
+        digital.append([
+            str(channel.get("name")),
+            ofsDigital + int(channel.get("id")),
+            1 << int(channel.get("bit")),
+        ])
+        lenDigital = int(channel.get("id")) + 1  # assuming that channel ids are increasing
+
+    return {"analog": analog, "digital": digital, "length": ofsDigital + lenDigital}
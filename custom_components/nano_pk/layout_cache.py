@@ -0,0 +1,93 @@
+"""Process-wide cache of compiled DAQPRJ layouts.
+
+Layouts are keyed by the hash of the XML content, so byte-identical
+descriptors (reloads, reconfigure, several entries on the same firmware) are
+parsed once. Misses are parsed in the executor and the compiled layouts are
+persisted to `.storage`, so a restart does not parse XML at all.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, DATA_LAYOUTS
+from .layout import LAYOUT_VERSION, layout_hash, parse_layout
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.layouts"
+
+# Delay before a changed cache is written to disk, coalescing bursts of misses
+_SAVE_DELAY = 10
+# Number of layouts kept; the least recently used ones are dropped
+_MAX_LAYOUTS = 16
+
+
+class HargassnerLayoutCache:
+    """Compiled layouts by content hash, backed by a `Store`."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._layouts: dict[str, dict] | None = None  # loaded lazily, oldest first
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def async_get(self, msgFormat: str) -> dict:
+        """Return the compiled layout of `msgFormat`.
+
+        Raises ValueError if the descriptor is not valid DAQPRJ XML.
+        """
+        digest = layout_hash(msgFormat)
+        async with self._lock:
+            if self._layouts is None:
+                self._layouts = await self._async_load()
+            layout = self._layouts.pop(digest, None)
+            if layout is None:
+                self.misses += 1
+                layout = await self._hass.async_add_executor_job(parse_layout, msgFormat)
+                self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+            else:
+                self.hits += 1
+            self._layouts[digest] = layout  # most recently used last
+            while len(self._layouts) > _MAX_LAYOUTS:
+                del self._layouts[next(iter(self._layouts))]
+        return layout
+
+    async def _async_load(self) -> dict[str, dict]:
+        try:
+            data = await self._store.async_load()
+        except (HomeAssistantError, ValueError) as err:
+            _LOGGER.warning("Hargassner: discarding unreadable layout cache: %s", err)
+            return {}
+        if not data or data.get("layout_version") != LAYOUT_VERSION:
+            return {}
+        return dict(data.get("layouts", {}))
+
+    @callback
+    def _data_to_save(self) -> dict:
+        return {"layout_version": LAYOUT_VERSION, "layouts": self._layouts or {}}
+
+    def diagnostics(self) -> dict:
+        """Return cache counters for the diagnostics service."""
+        return {
+            "layouts": len(self._layouts or {}),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+@callback
+def async_get_layout_cache(hass: HomeAssistant) -> HargassnerLayoutCache:
+    """Return the layout cache shared by all entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get(DATA_LAYOUTS)
+    if cache is None:
+        cache = domain_data[DATA_LAYOUTS] = HargassnerLayoutCache(hass)
+    return cache
@@ -0,0 +1,115 @@
+"""Hourly long-term statistics aggregated inside the bridge.
+
+Channels marked statistics-only get no sensor entity and therefore no state
+history. Instead every frame is folded into per-channel hourly accumulators,
+and each completed hour is written as mean/min/max directly to the long-term
+statistics of the recorder.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_channel_list(text: str | None) -> list[str]:
+    """Parse channel keys separated by ';' or newlines."""
+    if not text:
+        return []
+    keys = (key.strip() for key in text.replace("\n", ";").split(";"))
+    return [key for key in keys if key]
+
+
+class _Accumulator:
+    """Running count/sum/min/max of one channel within the current hour."""
+
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value) -> None:
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+
+class HargassnerStatistics:
+    """Fold frames into hourly mean/min/max per channel."""
+
+    def __init__(self, uniqueId: str, deviceName: str, channels: dict[str, tuple[str, str | None]]) -> None:
+        """`channels` maps parameter keys to (description, unit)."""
+        self._metadata = {
+            key: {
+                "has_mean": True,
+                "has_sum": False,
+                "name": f"{deviceName} {description}",
+                "source": DOMAIN,
+                "statistic_id": f"{DOMAIN}:{slugify(uniqueId + '_' + key)}",
+                "unit_of_measurement": unit or None,
+            }
+            for key, (description, unit) in channels.items()
+        }
+        self._hour: datetime | None = None
+        self._acc = {key: _Accumulator() for key in channels}
+
+    def keys(self):
+        """Return the channel keys aggregated here."""
+        return self._metadata.keys()
+
+    def statistic_id(self, key: str) -> str:
+        """Return the external statistic id used for `key`."""
+        return self._metadata[key]["statistic_id"]
+
+    def fold(self, values, now: datetime) -> list[tuple[dict, dict]]:
+        """Add one frame taken at `now` (UTC).
+
+        Returns (metadata, statistic) pairs for the previous hour once a new
+        hour starts, otherwise an empty list.
+        """
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        completed = []
+        if hour != self._hour:
+            if self._hour is not None:
+                completed = self._drain(self._hour)
+            self._hour = hour
+        for key, acc in self._acc.items():
+            value = values.get(key)
+            if value is not None:
+                acc.add(value)
+        return completed
+
+    def _drain(self, start: datetime) -> list[tuple[dict, dict]]:
+        completed = []
+        for key, acc in self._acc.items():
+            if acc.count:
+                completed.append((
+                    self._metadata[key],
+                    {"start": start, "mean": acc.total / acc.count, "min": acc.min, "max": acc.max},
+                ))
+            self._acc[key] = _Accumulator()
+        return completed
+
+
+@callback
+def async_write_statistics(hass: HomeAssistant, completed: list[tuple[dict, dict]]) -> None:
+    """Queue completed hourly statistics for import by the recorder."""
+    if "recorder" not in hass.config.components:
+        _LOGGER.debug("Recorder not loaded; dropping %d hourly statistics", len(completed))
+        return
+    from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+    for metadata, statistic in completed:
+        async_add_external_statistics(hass, metadata, [statistic])
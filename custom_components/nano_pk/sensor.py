@@ -7,12 +7,12 @@ import csv
 import io
 import logging
 import re
+import time
 from pathlib import Path
-from datetime import timedelta
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
-from homeassistant.core import HomeAssistant
-from homeassistant.util import file as file_util
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import file as file_util, slugify
 from .const import (
     DOMAIN,
     CONF_HOST,
@@ -26,15 +26,36 @@ from .const import (
     CONF_LANG_EN,
     CONF_LANG_DE,
     CONF_UNIQUE_ID,
+    CONF_DEADBAND_TEMPERATURE,
+    CONF_DEADBAND_PERCENT,
+    CONF_DEADBAND_DEFAULT,
+    CONF_DEADBAND_CHANNELS,
+    CONF_HEARTBEAT,
+    CONF_STATISTICS_CHANNELS,
+    CONF_ARCHIVE,
+    CONF_ARCHIVE_COMPRESSION,
+    CONF_ARCHIVE_MAX_SIZE,
+    CONF_ARCHIVE_MAX_AGE,
+    DEFAULT_DEADBAND_TEMPERATURE,
+    DEFAULT_DEADBAND_PERCENT,
+    DEFAULT_DEADBAND_DEFAULT,
+    DEFAULT_HEARTBEAT,
+    DEFAULT_ARCHIVE_COMPRESSION,
+    DEFAULT_ARCHIVE_MAX_SIZE,
+    DEFAULT_ARCHIVE_MAX_AGE,
+    ARCHIVE_DIRECTORY,
     BRIDGE_STATE_OK,
+    DATA_BRIDGES,
 )
-from .hargassner import HargassnerBridge
+from .archive import HargassnerArchiveWriter
+from .deadband import parse_deadband_overrides
+from .hargassner import HargassnerBridge, HargassnerMessageTemplates
+from .layout_cache import async_get_layout_cache
+from .long_term_statistics import parse_channel_list
 
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=5)
-
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> None:
     """Set up sensors from a config entry (UI setup)."""
@@ -47,11 +68,17 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> N
     paramSet = entry.data[CONF_PARAMS]
     lang = entry.data[CONF_LANG]
     uniqueId = entry.data[CONF_UNIQUE_ID]
+    statisticsOnly = parse_channel_list(entry.options.get(CONF_STATISTICS_CHANNELS))
 
     # Create bridge and sensors using shared logic
-    await _setup_sensors(
-        hass, async_add_entities, host, format_file, name, paramSet, lang, uniqueId
+    bridge = await _setup_sensors(
+        hass, async_add_entities, host, format_file, name, paramSet, lang, uniqueId, statisticsOnly
     )
+    if bridge is not None:
+        _apply_deadband_options(bridge, entry.options)
+        _apply_archive_options(hass, bridge, entry.options)
+        # Share the bridge with the other platforms of this entry
+        hass.data[DOMAIN].setdefault(DATA_BRIDGES, {})[entry.entry_id] = bridge
 
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None) -> None:
@@ -72,6 +99,38 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     )
 
 
+def _apply_deadband_options(bridge, options) -> None:
+    """Configure the bridge deadband from the config entry options."""
+    try:
+        channels = parse_deadband_overrides(options.get(CONF_DEADBAND_CHANNELS))
+    except ValueError as err:
+        _LOGGER.warning("Ignoring invalid per-channel deadbands: %s", err)
+        channels = {}
+    bridge.setDeadband(
+        temperature=options.get(CONF_DEADBAND_TEMPERATURE, DEFAULT_DEADBAND_TEMPERATURE),
+        percent=options.get(CONF_DEADBAND_PERCENT, DEFAULT_DEADBAND_PERCENT),
+        default=options.get(CONF_DEADBAND_DEFAULT, DEFAULT_DEADBAND_DEFAULT),
+        channels=channels,
+        heartbeat=options.get(CONF_HEARTBEAT, DEFAULT_HEARTBEAT),
+    )
+    errorLog = bridge.getErrorLog()
+    if errorLog != "": _LOGGER.warning(errorLog)
+
+
+def _apply_archive_options(hass, bridge, options) -> None:
+    """Attach a raw frame archive to the bridge if enabled in the options."""
+    if not options.get(CONF_ARCHIVE, False):
+        return
+    directory = hass.config.path(ARCHIVE_DIRECTORY, slugify(bridge.getUniqueIdBase()))
+    bridge.setArchive(HargassnerArchiveWriter(
+        directory,
+        compression=options.get(CONF_ARCHIVE_COMPRESSION, DEFAULT_ARCHIVE_COMPRESSION),
+        max_bytes=options.get(CONF_ARCHIVE_MAX_SIZE, DEFAULT_ARCHIVE_MAX_SIZE) * 1024 * 1024,
+        max_age=options.get(CONF_ARCHIVE_MAX_AGE, DEFAULT_ARCHIVE_MAX_AGE) * 3600,
+    ))
+    _LOGGER.info("Archiving raw pm frames of %s to %s", bridge.name, directory)
+
+
 async def _resolve_msg_format(hass, format_source: str | None) -> str | None:
     """Resolve msgformat source into XML content."""
     if not format_source:
@@ -82,6 +141,14 @@ async def _resolve_msg_format(hass, format_source: str | None) -> str | None:
     if source_str.startswith("<DAQPRJ"):
         return source_str
 
+    if source_str in HargassnerMessageTemplates.NAMES:
+        # built-in template name: read it here so the bridge never blocks the loop
+        try:
+            return await hass.async_add_executor_job(HargassnerMessageTemplates.load, source_str)
+        except OSError as err:
+            _LOGGER.error("Failed to read built-in message format %s: %s", source_str, err)
+            return None
+
     needs_file = source_str.endswith(".xml") or "/" in source_str or "\\" in source_str
 
     if needs_file:
@@ -101,22 +168,43 @@ async def _resolve_msg_format(hass, format_source: str | None) -> str | None:
 
 
 async def _setup_sensors(
-    hass, async_add_entities, host, format_source, name, paramSet, lang, uniqueId
-) -> None:
-    """Shared sensor setup logic for both YAML and Config Entry."""
+    hass, async_add_entities, host, format_source, name, paramSet, lang, uniqueId, statisticsOnly=()
+) -> HargassnerBridge | None:
+    """Shared sensor setup logic for both YAML and Config Entry.
+
+    Channels in `statisticsOnly` get no entity; the bridge writes their
+    hourly statistics directly to the recorder instead.
+    """
     msg_format = await _resolve_msg_format(hass, format_source)
     if msg_format is None:
-        return
+        return None
 
-    bridge = HargassnerBridge(host, name, uniqueId, msgFormat=msg_format)
+    # parsed in the executor and cached by content, reloads skip the XML
+    try:
+        layout = await async_get_layout_cache(hass).async_get(msg_format)
+    except ValueError as err:
+        _LOGGER.error("Invalid message format for %s: %s", name, err)
+        return None
+
+    bridge = HargassnerBridge(host, name, uniqueId, msgFormat=msg_format, layout=layout)
+    statistics_keys = bridge.setStatisticsChannels(statisticsOnly)
     errorLog = bridge.getErrorLog()
     if errorLog != "": _LOGGER.error(errorLog)
-    param_keys = set(bridge.data().keys())
+    async_add_entities(_build_entities(bridge, name, paramSet, lang, statistics_keys))
+    return bridge
+
+
+def _build_entities(bridge, name, paramSet, lang, statistics_keys=frozenset()) -> list:
+    """Return the bridge and the sensor entities of a parameter set (STANDARD or FULL)."""
+    param_keys = set(bridge.data().keys()) - statistics_keys
 
     def _has_param(param_name: str) -> bool:
         return param_name in param_keys
 
     def _warn_missing(param_name: str, context: str) -> None:
+        if param_name in statistics_keys:
+            _LOGGER.debug("Parameter '%s' is statistics-only; skipping %s.", param_name, context)
+            return
         _LOGGER.warning(
             "Parameter '%s' not provided by configured msgformat; skipping %s.",
             param_name,
@@ -126,7 +214,9 @@ async def _setup_sensors(
     if paramSet == CONF_PARAMS_FULL:
         entities = [bridge]
         for p in bridge.data().values(): 
-            if p.key()=="Störung": 
+            if p.key() in statistics_keys:
+                continue
+            elif p.key()=="Störung": 
                 entities.append(HargassnerErrorSensor(bridge, name))
             elif p.key()=="ZK": 
                 entities.append(HargassnerStateSensor(bridge, name, lang))
@@ -136,7 +226,6 @@ async def _setup_sensors(
             entities.append(HargassnerEnergySensor(bridge, name))
         else:
             _warn_missing("Verbrauchszähler", "energy sensor")
-        async_add_entities(entities)
     else:
         entities = [bridge]
 
@@ -167,7 +256,7 @@ async def _setup_sensors(
         else:
             _warn_missing("Verbrauchszähler", "pellet consumption and energy sensors")
 
-        async_add_entities(entities)
+    return entities
 
 
 class HargassnerSensor(SensorEntity):
@@ -179,6 +268,8 @@ class HargassnerSensor(SensorEntity):
         self._bridge = bridge
         self._description = description
         self._paramName = paramName
+        self._listenKeys = (paramName,)
+        self._written = None
         self._icon = icon
         self._unique_id = bridge.getUniqueIdBase()
         self._unit = bridge.getUnit(paramName)
@@ -229,10 +320,41 @@ class HargassnerSensor(SensorEntity):
         if self._bridge.state == BRIDGE_STATE_OK: return True
         else: return False
 
-    async def async_update(self):
-        """Fetch new state data for the sensor.
-        This is the only method that should fetch new data for Home Assistant.
+    @property
+    def should_poll(self):
+        """Values are pushed by the bridge reader task."""
+        return False
+
+    async def async_added_to_hass(self):
+        """Subscribe to frames pushed by the bridge."""
+        await super().async_added_to_hass()
+        self._update_from_bridge()
+        self.async_on_remove(
+            self._bridge.async_add_listener(self._handle_bridge_update, self._listenKeys)
+        )
+
+    @callback
+    def _handle_bridge_update(self, frame_time):
+        """Take over the latest frame, write the state only if it changed.
+
+        A heartbeat of the deadband is written even if nothing changed, it
+        refreshes last_reported.
         """
+        self._update_from_bridge()
+        snapshot = (self._value, self._icon, self.available)
+        if snapshot == self._written and not any(map(self._bridge.isHeartbeat, self._listenKeys)):
+            return
+        self._written = snapshot
+        started = time.perf_counter()
+        self.async_write_ha_state()
+        self._bridge.timing().add_state_write(time.perf_counter() - started)
+
+    async def async_update(self):
+        """Refresh from the bridge on an explicit update request."""
+        self._update_from_bridge()
+
+    def _update_from_bridge(self):
+        """Read the current value of the parameter from the bridge."""
         self._value = self._bridge.getValue(self._paramName)
 
     @property
@@ -248,9 +370,9 @@ class HargassnerEnergySensor(HargassnerSensor):
         self._deviceClass = SensorDeviceClass.ENERGY
         self._unit = "kWh"
 
-    async def async_update(self):
+    def _update_from_bridge(self):
         try:
-            self._value = 4.8 * float(self._bridge.getValue(self._paramName))
+            self._value = 4.8 * self._bridge.getValue(self._paramName)
         except Exception:
             _LOGGER.warning("HargassnerEnergySensor.update(): Invalid value.\n")
             self._value = None
@@ -283,6 +405,7 @@ class HargassnerErrorSensor(HargassnerSensor):
 
     def __init__(self, bridge, deviceName):
         super().__init__(bridge, deviceName+" operation", "Störung", "mdi:alert")
+        self._listenKeys = ("Störung", "Störungs Nr")
         self._stateClass = None
         self._deviceClass = SensorDeviceClass.ENUM
         # Extended errors are loaded asynchronously in async_setup_platform
@@ -290,10 +413,10 @@ class HargassnerErrorSensor(HargassnerSensor):
         option_values.update(self.ERRORS.values())
         self._options = sorted(option_values)
 
-    async def async_update(self):
+    def _update_from_bridge(self):
         rawState = self._bridge.getValue(self._paramName)
         if rawState==None: self._value = "Unknown"
-        elif rawState=="False":
+        elif rawState is False:
             self._value = "OK"
             self._icon = "mdi:check"
         else:
@@ -304,7 +427,7 @@ class HargassnerErrorSensor(HargassnerSensor):
                 if errorDescr is None and errorID is not None:
                     errorDescr = self.ERRORS.get(str(errorID))
                 if errorDescr is None:
-                    shown_id = errorID if errorID is not None else "Unknown"
+                    shown_id = normalized_id if errorID is not None else "Unknown"
                     self._value = "Error " + str(shown_id)
                 else:
                     self._value = errorDescr
@@ -364,6 +487,8 @@ class HargassnerErrorSensor(HargassnerSensor):
     def _normalize_error_id(error_id):
         if error_id is None:
             return ""
+        if isinstance(error_id, float) and error_id.is_integer():
+            error_id = int(error_id)  # templates without dop='0' deliver the code as float
         if not isinstance(error_id, str):
             error_id = str(error_id)
         normalized = error_id.strip().upper()
@@ -451,10 +576,10 @@ class HargassnerStateSensor(HargassnerSensor):
         self._options_set = set(self._labels.values())
         self._options = sorted(self._options_set)
 
-    async def async_update(self):
+    def _update_from_bridge(self):
         rawState = self._bridge.getValue(self._paramName)
         try:
-            idxState = int(round(float(rawState)))
+            idxState = int(round(rawState))
             if idxState not in self._labels:
                 _LOGGER.debug(
                     "HargassnerStateSensor: unmapped state code %s (raw=%s).",
@@ -0,0 +1,110 @@
+"""Per-stage timing of the frame hot path.
+
+Every stage a frame passes is timed with the monotonic `time.perf_counter`
+and folded into a streaming histogram, so percentiles are available at any
+time without keeping the samples. Buckets are logarithmic (16 per power of
+two), which bounds the error of a reported percentile to about 3% and the
+memory to a few hundred buckets however long the boiler runs.
+
+Stages, in the order a frame passes them:
+
+    read         waiting for data from the transport (boiler and network)
+    framing      cutting a read into pm lines (per read)
+    parse        splitting a line into its fields and checking its length
+    decode       decode plan, statistics, deadband and flipped bits
+    dispatch     calling the entity listeners, without their state writes
+    state_write  async_write_ha_state of the entities and the bridge
+    loop         event loop time of one frame in the bridge, all of the
+                 above from parse on
+"""
+
+from __future__ import annotations
+
+from math import frexp, ldexp
+
+# Sub-buckets per power of two
+_SUB_BUCKETS = 16
+# Bucket of zero (and negative) durations
+_ZERO = -(1 << 30)
+
+STAGES = ("read", "framing", "parse", "decode", "dispatch", "state_write", "loop")
+
+
+class StreamingPercentiles:
+    """Count, mean, max and approximate percentiles of a stream of durations."""
+
+    __slots__ = ("count", "total", "max", "_buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._buckets: dict[int, int] = {}
+
+    def add(self, seconds: float) -> None:
+        """Fold one duration into the histogram."""
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        if seconds > 0.0:
+            mantissa, exponent = frexp(seconds)  # mantissa in [0.5, 1)
+            index = exponent * _SUB_BUCKETS + int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+        else:
+            index = _ZERO
+        buckets = self._buckets
+        buckets[index] = buckets.get(index, 0) + 1
+
+    def percentile(self, fraction: float) -> float:
+        """Return the duration below which `fraction` of the samples fall."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(_bucket_middle(index), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """Return count and mean/p50/p95/p99/max in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.50) * 1000, 3),
+            "p95_ms": round(self.percentile(0.95) * 1000, 3),
+            "p99_ms": round(self.percentile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+def _bucket_middle(index: int) -> float:
+    """Return the middle of the durations folded into bucket `index`."""
+    if index == _ZERO:
+        return 0.0
+    exponent, sub = divmod(index, _SUB_BUCKETS)
+    return ldexp(0.5 + (sub + 0.5) / (2 * _SUB_BUCKETS), exponent)
+
+
+class HargassnerFrameTiming:
+    """Streaming percentiles of every stage, plus the state writes of the current frame."""
+
+    __slots__ = STAGES + ("frame_writes",)
+
+    def __init__(self) -> None:
+        for stage in STAGES:
+            setattr(self, stage, StreamingPercentiles())
+        self.frame_writes = 0.0  # seconds of state writes since the frame started
+
+    def add_state_write(self, seconds: float) -> None:
+        """Account one state write to the frame being dispatched."""
+        self.frame_writes += seconds
+
+    def diagnostics(self) -> dict:
+        """Return the summary of every stage that was timed at least once."""
+        return {
+            stage: getattr(self, stage).summary()
+            for stage in STAGES
+            if getattr(self, stage).count
+        }
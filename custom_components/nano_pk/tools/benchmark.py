@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks of the frame hot path.
+
+Covered stages, each fed with synthetic frames for NANO_PK_FULL (see
+pm_generator):
+
+    framing            PmLineFramer.feed on 1 KiB reads cutting frames apart
+    parse              split_pm_fields + HargassnerDecodePlan.decode
+    digital            digital words parsed and compared for flipped bits
+    deadband           HargassnerDeadbandFilter.changed on the decoded values
+    layout:<name>      parse_layout of every built-in template
+    set_format:<name>  HargassnerBridge.setMessageFormat (needs Home Assistant)
+    bridge             HargassnerBridge._handle_line without entities
+    fanout:<set>       _handle_line with the STANDARD / FULL entity set of
+                       sensor.py subscribed; state writes are counted, not
+                       performed (there is no hass)
+
+Each run lasts at least `--min-time` seconds; the best of `--repeat` runs
+is reported as operations per second, plus the peak bytes allocated per operation and the memory
+blocks still held per operation afterwards (both from tracemalloc and
+sys.getallocatedblocks, measured in a separate run).
+
+Baselines are plain JSON: `--save` writes one, `--compare` prints the change
+against one and exits with 1 if a benchmark got slower than `--threshold`.
+Benchmarks needing Home Assistant are skipped when it is not installed.
+
+Example:
+    python3 tools/benchmark.py --save baseline.json
+    python3 tools/benchmark.py --compare baseline.json --threshold 10
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from package import HOMEASSISTANT, TEMPLATE_DIR
+from nano_pk.decoder import HargassnerDecodePlan, parse_word
+from nano_pk.deadband import HargassnerDeadbandFilter
+from nano_pk.framing import PmLineFramer, split_pm_fields
+from nano_pk.layout import parse_layout
+from pm_generator import PmFrameGenerator
+
+DEFAULT_TEMPLATE = "NANO_PK_FULL"
+
+# Frames are handed to the framer in reads of this size, like the socket would
+_READ_SIZE = 1024
+
+# Operations measured per tracemalloc run (tracing is slow)
+_ALLOC_OPS = 200
+
+
+def load_templates() -> dict[str, str]:
+    """Return the DAQPRJ XML of every built-in template by name."""
+    return {
+        path.stem: path.read_text(encoding="utf-8").strip()
+        for path in sorted(TEMPLATE_DIR.glob("*.xml"))
+    }
+
+
+def _plan(layout: dict) -> HargassnerDecodePlan:
+    return HargassnerDecodePlan(
+        [(key, index, dop) for key, index, _, dop in layout["analog"]],
+        layout["digital"],
+    )
+
+
+class Benchmark:
+    """One benchmark: `setup()` returns the callable run once per operation."""
+
+    def __init__(self, name: str, unit: str, setup: Callable[[], Callable[[int], None]], ops: int) -> None:
+        self.name = name
+        self.unit = unit
+        self.setup = setup
+        self.ops = ops
+
+    def _time(self, ops: int) -> float:
+        step = self.setup()
+        gc.collect()
+        start = time.perf_counter()
+        for number in range(ops):
+            step(number)
+        return time.perf_counter() - start
+
+    def run(self, repeat: int, min_time: float) -> dict:
+        """Time the benchmark and measure its allocations."""
+        # double the operations until one run takes at least min_time
+        ops = self.ops
+        best = self._time(ops)
+        while best < min_time:
+            ops *= 2
+            best = self._time(ops)
+        for _ in range(repeat - 1):
+            best = min(best, self._time(ops))
+
+        step = self.setup()
+        traced = min(self.ops, _ALLOC_OPS)
+        step(0)  # warm up caches before counting
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        tracemalloc.start()
+        peak = 0
+        for number in range(1, traced + 1):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            step(number)
+            peak += tracemalloc.get_traced_memory()[1] - before
+        tracemalloc.stop()
+        gc.collect()
+        retained = sys.getallocatedblocks() - blocks
+
+        return {
+            "unit": self.unit,
+            "ops": ops,
+            "ops_per_second": round(ops / best, 1),
+            "seconds_per_op": best / ops,
+            "peak_bytes_per_op": round(peak / traced, 1),
+            "retained_blocks_per_op": round(retained / traced, 3),
+        }
+
+
+def hot_path_benchmarks(frames: list[bytes], layout: dict, templates: dict[str, str]) -> list[Benchmark]:
+    """Benchmarks of the modules without Home Assistant dependencies."""
+    count = len(frames)
+    plan = _plan(layout)
+    stream = b"".join(line + b"\r\n" for line in frames)
+    reads = [stream[i:i + _READ_SIZE] for i in range(0, len(stream), _READ_SIZE)]
+    fields = [split_pm_fields(line, plan.min_length)[0] for line in frames]
+    decoded = [plan.decode(msg) for msg in fields]
+    word_indices = [index for index, _ in plan.digital_words]
+    bands = {key: 0.5 for key, _, unit, _ in layout["analog"] if unit}
+
+    def framing():
+        framer = PmLineFramer()
+        feed = framer.feed
+
+        def step(number):
+            feed(reads[number % len(reads)])
+        return step
+
+    def parse():
+        def step(number):
+            plan.decode(split_pm_fields(frames[number % count], plan.min_length)[0])
+        return step
+
+    def digital():
+        state = {"previous": None}
+
+        def step(number):
+            msg = fields[number % count]
+            words = tuple(parse_word(msg[index]) for index in word_indices)
+            plan.changed_bits(state["previous"], words)
+            state["previous"] = words
+        return step
+
+    def deadband():
+        flt = HargassnerDeadbandFilter(bands, 60.0)
+
+        def step(number):
+            flt.changed(decoded[number % count][0], number)
+        return step
+
+    def layout_bench(xml):
+        def setup():
+            return lambda number: parse_layout(xml)
+        return setup
+
+    # framing is measured per read, scale the op count so it covers all frames
+    benchmarks = [
+        Benchmark("framing", "reads", framing, len(reads) * 5),
+        Benchmark("parse", "frames", parse, count * 5),
+        Benchmark("digital", "frames", digital, count * 5),
+        Benchmark("deadband", "frames", deadband, count * 5),
+    ]
+    benchmarks += [
+        Benchmark(f"layout:{name}", "layouts", layout_bench(xml), 200)
+        for name, xml in templates.items()
+    ]
+    return benchmarks
+
+
+def bridge_benchmarks(frames: list[bytes], templates: dict[str, str], template: str) -> list[Benchmark]:
+    """Benchmarks of hargassner.py and sensor.py, empty without Home Assistant."""
+    if not HOMEASSISTANT:
+        print("Skipping bridge benchmarks, Home Assistant not installed", file=sys.stderr)
+        return []
+    from nano_pk.const import CONF_PARAMS_FULL, CONF_PARAMS_STANDARD, CONF_LANG_EN
+    from nano_pk.hargassner import HargassnerBridge
+    from nano_pk.sensor import _build_entities
+
+    count = len(frames)
+    xml = templates[template]
+
+    def new_bridge():
+        return HargassnerBridge("127.0.0.1", "Benchmark", "benchmark", msgFormat=xml)
+
+    def set_format(source):
+        def setup():
+            bridge = new_bridge()
+            return lambda number: bridge.setMessageFormat(source)
+        return setup
+
+    def bridge():
+        instance = new_bridge()
+
+        def step(number):
+            instance._handle_line(frames[number % count])
+        return step
+
+    writes = {}
+
+    def fanout(param_set):
+        def setup():
+            instance = new_bridge()
+            writes[param_set] = 0
+
+            def write_state():
+                writes[param_set] += 1
+
+            for entity in _build_entities(instance, "Benchmark", param_set, CONF_LANG_EN)[1:]:
+                entity.async_write_ha_state = write_state
+                instance.async_add_listener(entity._handle_bridge_update, entity._listenKeys)
+
+            def step(number):
+                instance._handle_line(frames[number % count])
+            return step
+        return setup
+
+    benchmarks = [
+        Benchmark(f"set_format:{name}", "layouts", set_format(source), 200)
+        for name, source in templates.items()
+    ]
+    benchmarks.append(Benchmark("bridge", "frames", bridge, count * 5))
+    benchmarks += [
+        Benchmark(f"fanout:{param_set}", "frames", fanout(param_set), count * 5)
+        for param_set in (CONF_PARAMS_STANDARD, CONF_PARAMS_FULL)
+    ]
+    return benchmarks
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print the change per benchmark, return the names that regressed."""
+    regressions = []
+    old = baseline.get("results", {})
+    for name, result in results.items():
+        if name not in old:
+            print(f"{name:32} {result['ops_per_second']:>14,.0f} {result['unit']}/s   (new)")
+            continue
+        change = (result["ops_per_second"] / old[name]["ops_per_second"] - 1.0) * 100.0
+        flag = ""
+        if change < -threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:32} {result['ops_per_second']:>14,.0f} {result['unit']}/s {change:+7.1f}%{flag}")
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the pm frame hot path")
+    parser.add_argument("--frames", type=int, default=1000, help="Distinct synthetic frames (default: 1000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark, the best counts (default: 5)")
+    parser.add_argument(
+        "--template", default=DEFAULT_TEMPLATE, help=f"Layout of the frames (default: {DEFAULT_TEMPLATE})"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.5, help="Minimum seconds per run (default: 0.5)"
+    )
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the synthetic frames (default: 1)")
+    parser.add_argument("--save", help="Write the results as JSON baseline to this file")
+    parser.add_argument("--compare", help="Compare against this JSON baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, help="Slowdown in %% that counts as regression (default: 10)"
+    )
+
+    args = parser.parse_args(argv)
+
+    templates = load_templates()
+    if args.template not in templates:
+        print(f"Unknown template {args.template}", file=sys.stderr)
+        return 1
+    layout = parse_layout(templates[args.template])
+    generator = PmFrameGenerator(layout, seed=args.seed, toggle=0.05)
+    frames = [generator.frame() for _ in range(args.frames)]
+
+    benchmarks = hot_path_benchmarks(frames, layout, templates)
+    benchmarks += bridge_benchmarks(frames, templates, args.template)
+    if args.filter:
+        benchmarks = [b for b in benchmarks if args.filter in b.name]
+
+    results = {}
+    for benchmark in benchmarks:
+        result = results[benchmark.name] = benchmark.run(args.repeat, args.min_time)
+        if not args.compare:
+            print(
+                f"{benchmark.name:32} {result['ops_per_second']:>14,.0f} {result['unit']}/s"
+                f" {result['peak_bytes_per_op']:>10,.0f} B peak/op"
+                f" {result['retained_blocks_per_op']:>8.2f} blocks kept/op"
+            )
+
+    status = 0
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) slower than {args.threshold}%: {', '.join(regressions)}")
+            status = 1
+
+    if args.save:
+        document = {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "template": args.template,
+            "frames": args.frames,
+            "seed": args.seed,
+            "min_time": args.min_time,
+            "results": results,
+        }
+        Path(args.save).write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved baseline to {args.save}", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
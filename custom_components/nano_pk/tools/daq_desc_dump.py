@@ -6,11 +6,12 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-if str(REPO_ROOT) not in sys.path:
-    sys.path.insert(0, str(REPO_ROOT))
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
 
-from daq_fetcher import DEFAULT_COMMAND, DaqFetchError, fetch_daq_template
+import package  # noqa: F401 - makes nano_pk importable
+from nano_pk.daq_fetcher import DEFAULT_COMMAND, DaqFetchError, fetch_daq_template
 
 
 def main(argv: Optional[list[str]] = None) -> int:
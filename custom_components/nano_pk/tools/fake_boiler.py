@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""Local fake boiler: a telnet server that replays captured pm streams.
+
+The server answers `$DAQ DESC` with a DAQPRJ descriptor and streams `pm`
+frames to every client, replayed from a raw frame archive (see archive.py)
+or a plain text capture with one pm line per line. Replay runs in real time,
+N times faster or as fast as the client reads. Faults (split lines, garbage
+bytes, stalls, disconnects) can be injected to exercise the bridge's framing
+and reconnect logic without a boiler.
+
+A new client gets its first frame after a command window in which a command
+is answered before any pm output, so the reply is the first thing a
+descriptor client (descriptor_client.py, daq_fetcher.py) reads. The pm
+stream pauses while a reply is written and never interleaves with it.
+
+Example:
+    python3 tools/fake_boiler.py --replay /config/nano_pk_archive/1 --speed 10
+and point the integration (or daq_desc_dump.py --port 2323) at 127.0.0.1:2323.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from package import TEMPLATE_DIR
+from nano_pk.archive import read_capture
+from nano_pk.daq_fetcher import DEFAULT_COMMAND
+from nano_pk.layout import parse_layout
+from pm_generator import PmFrameGenerator
+
+DEFAULT_DESCRIPTOR = TEMPLATE_DIR / "NANO_PK_FULL.xml"
+
+# Frames written before draining the socket when replaying at max speed
+_MAX_SPEED_BATCH = 64
+
+_GARBAGE = (
+    b"\xff\xfb\x01",  # telnet WILL ECHO
+    b"\xff\xfd\x03",  # telnet DO SUPPRESS-GO-AHEAD
+    b"$<<<",
+    b">>>",
+)
+
+
+@dataclass
+class Faults:
+    """Per-frame probabilities of the injected faults."""
+
+    split: float = 0.0  # frame written in two parts with a pause in between
+    garbage: float = 0.0  # telnet noise or a junk line written before the frame
+    stall: float = 0.0  # stream pauses for stall_seconds
+    stall_seconds: float = 5.0
+    disconnect: float = 0.0  # server drops the client
+
+
+def load_descriptor(source: str) -> str:
+    """Load the DAQPRJ XML from a file or a built-in template name."""
+    path = Path(source)
+    if not path.exists():
+        path = TEMPLATE_DIR / f"{source}.xml"
+    return path.read_text(encoding="utf-8").strip()
+
+
+def load_frames(
+    source: Optional[str], descriptor: str, generate: int = 0, seed: Optional[int] = None
+) -> list[tuple[Optional[float], bytes]]:
+    """Load (timestamp or None, line) pairs to replay.
+
+    Archives (segments or their directory) keep their timestamps, text
+    captures are replayed at a fixed interval. Without a source, `generate`
+    synthetic frames for the descriptor's layout are used (see pm_generator),
+    or a single frame of zeros.
+    """
+    if source is None:
+        layout = parse_layout(descriptor)
+        if generate:
+            generator = PmFrameGenerator(layout, seed=seed)
+            return [(None, generator.frame()) for _ in range(generate)]
+        return [(None, b"pm " + b" ".join([b"0"] * layout["length"]))]
+    return read_capture(source)
+
+
+def schedule(
+    frames: list[tuple[Optional[float], bytes]], speed: float, interval: float, repeat: bool
+) -> Iterator[tuple[float, bytes]]:
+    """Yield (delay before the frame, line), delays scaled by `speed` (0 = no delay)."""
+    first = True
+    while True:
+        previous = None
+        for timestamp, line in frames:
+            if speed <= 0 or first:
+                delay = 0.0
+            elif timestamp is not None and previous is not None:
+                delay = max(timestamp - previous, 0.0) / speed
+            else:
+                delay = interval / speed
+            first = False
+            previous = timestamp
+            yield delay, line
+        if not repeat:
+            return
+
+
+class FakeBoiler:
+    """Serve the descriptor and replay the frames to each client."""
+
+    def __init__(
+        self,
+        descriptor: str,
+        frames: list[tuple[Optional[float], bytes]],
+        speed: float = 1.0,
+        interval: float = 1.0,
+        repeat: bool = True,
+        faults: Optional[Faults] = None,
+        seed: Optional[int] = None,
+        command_window: float = 0.5,
+    ) -> None:
+        """`command_window` is how long a new client may send a command before the first frame."""
+        self._descriptor = descriptor.encode("latin-1", errors="replace")  # the boiler does not speak UTF-8
+        self._frames = frames
+        self._speed = speed
+        self._interval = interval
+        self._repeat = repeat
+        self._faults = faults or Faults()
+        self._command_window = command_window
+        self._random = random.Random(seed)
+        self.frame_count = len(frames)
+        self.clients = 0
+        self.frames_sent = 0
+        self.faults_injected = 0
+        self._handlers: set[asyncio.Task] = set()
+
+    async def async_close(self) -> None:
+        """Stop streaming to the connected clients.
+
+        Server.close() leaves the client connections open, and a handler
+        cancelled later by asyncio.run would be logged as an error.
+        """
+        for task in self._handlers:
+            task.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Stream frames to one client and answer its commands."""
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        self.clients += 1
+        quiet = asyncio.Lock()  # held while a reply is written, pauses the pm stream
+        answered = asyncio.Event()
+        commands = asyncio.create_task(self._answer_commands(reader, writer, quiet, answered))
+        try:
+            if self._command_window > 0:
+                try:
+                    await asyncio.wait_for(answered.wait(), self._command_window)
+                except asyncio.TimeoutError:
+                    pass
+            await self._stream(writer, quiet, schedule(self._frames, self._speed, self._interval, self._repeat))
+        except (ConnectionError, OSError, asyncio.CancelledError):
+            pass
+        finally:
+            commands.cancel()
+            writer.close()
+            self._handlers.discard(task)
+
+    async def _answer_commands(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, quiet: asyncio.Lock, answered: asyncio.Event
+    ) -> None:
+        command = DEFAULT_COMMAND.encode("ascii")
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            if line.strip() == command:
+                async with quiet:
+                    writer.write(self._descriptor + b"\r\n")
+                    await writer.drain()
+                answered.set()
+
+    async def _stream(
+        self, writer: asyncio.StreamWriter, quiet: asyncio.Lock, frames: Iterable[tuple[float, bytes]]
+    ) -> None:
+        faults = self._faults
+        rnd = self._random.random
+        batch = 0
+        for delay, line in frames:
+            if delay:
+                await asyncio.sleep(delay)
+            if faults.disconnect and rnd() < faults.disconnect:
+                self.faults_injected += 1
+                return
+            if faults.stall and rnd() < faults.stall:
+                self.faults_injected += 1
+                await asyncio.sleep(faults.stall_seconds)
+            async with quiet:
+                if faults.garbage and rnd() < faults.garbage:
+                    self.faults_injected += 1
+                    writer.write(self._garbage())
+                frame = line + b"\r\n"
+                if faults.split and rnd() < faults.split:
+                    self.faults_injected += 1
+                    cut = self._random.randrange(1, len(frame))
+                    writer.write(frame[:cut])
+                    await writer.drain()
+                    await asyncio.sleep(0.05)
+                    frame = frame[cut:]
+                writer.write(frame)
+            self.frames_sent += 1
+            batch += 1
+            if delay or batch >= _MAX_SPEED_BATCH:
+                batch = 0
+                await writer.drain()
+
+    def _garbage(self) -> bytes:
+        if self._random.random() < 0.5:
+            return self._random.choice(_GARBAGE)
+        junk = bytes(self._random.randrange(256) for _ in range(self._random.randrange(1, 32)))
+        return junk.replace(b"\n", b"") + b"\r\n"
+
+
+async def serve(boiler: FakeBoiler, host: str, port: int) -> None:
+    server = await asyncio.start_server(boiler.handle_client, host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Fake boiler serving {boiler.frame_count} frames on {addresses}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Telnet server replaying captured pm streams")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=2323, help="Port to listen on (default: 2323)")
+    parser.add_argument(
+        "--descriptor",
+        default=str(DEFAULT_DESCRIPTOR),
+        help="DAQPRJ XML file or built-in template name answered to '$DAQ DESC'",
+    )
+    parser.add_argument(
+        "--replay",
+        help="Archive segment/directory or text capture of pm lines (default: frames of zeros)",
+    )
+    parser.add_argument(
+        "--generate",
+        type=int,
+        default=0,
+        help="Without --replay: serve this many synthetic frames for the descriptor's layout",
+    )
+    parser.add_argument(
+        "--speed",
+        default="1",
+        help="Replay speed factor, 1 = real time, 'max' = as fast as possible",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="Seconds between frames without timestamps"
+    )
+    parser.add_argument(
+        "--command-window",
+        type=float,
+        default=0.5,
+        help="Seconds a new client may send a command before the first frame (default: 0.5)",
+    )
+    parser.add_argument("--once", action="store_true", help="Stop streaming after one pass")
+    parser.add_argument("--split", type=float, default=0.0, help="Probability of splitting a frame")
+    parser.add_argument("--garbage", type=float, default=0.0, help="Probability of garbage before a frame")
+    parser.add_argument("--stall", type=float, default=0.0, help="Probability of a stall before a frame")
+    parser.add_argument("--stall-seconds", type=float, default=5.0, help="Length of a stall")
+    parser.add_argument("--disconnect", type=float, default=0.0, help="Probability of dropping the client")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible faults")
+
+    args = parser.parse_args(argv)
+
+    speed = 0.0 if args.speed == "max" else float(args.speed)
+    descriptor = load_descriptor(args.descriptor)
+    frames = load_frames(args.replay, descriptor, args.generate, args.seed)
+    if not frames:
+        print("No pm frames to replay", file=sys.stderr)
+        return 1
+
+    boiler = FakeBoiler(
+        descriptor,
+        frames,
+        speed=speed,
+        interval=args.interval,
+        repeat=not args.once,
+        faults=Faults(args.split, args.garbage, args.stall, args.stall_seconds, args.disconnect),
+        seed=args.seed,
+        command_window=args.command_window,
+    )
+    try:
+        asyncio.run(serve(boiler, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    print(
+        f"Clients: {boiler.clients}, frames sent: {boiler.frames_sent}, faults injected: {boiler.faults_injected}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""Differential fuzzing of the fast frame decoders against the reference parser.
+
+The reference is the bridge as it was before the compiled decode plan: the
+DAQPRJ descriptor is parsed channel by channel into HargassnerAnalogueParameter
+and HargassnerDigitalParameter objects (duplicate analogue names get a `_2`,
+`_3`, ... suffix, digital channels overwrite same-named parameters), each
+frame is `line.split()` on the decoded str, frames shorter than the expected
+length are skipped, a different length adjusts the expected one, and every
+parameter reads its field with `initializeFromMessage` (analogue: the raw
+field, digital: hex, then float, else None).
+
+Random layouts and frame sequences, malformed ones included (duplicate and
+colliding names, missing attributes and sections, id gaps, short, long and
+empty frames, non-numeric, hex, nan/inf and overflowing fields), are run
+through the reference and through the fast path:
+
+    plan     parse_layout + HargassnerDecodePlan + split_pm_fields, wired up
+             like HargassnerBridge.setLayout / _process_line
+    bridge   HargassnerBridge.setMessageFormat / _process_line / getValue
+             (needs Home Assistant, use --target plan without it)
+
+After every frame both must agree on whether it was accepted, on the
+expected message length and on every parameter: analogue values equal the
+reference field converted with float() and rounded to the channel's dop,
+unrounded without one (same type, None where not numeric), the raw field bytes equal the
+reference field (plan only), digital values equal the reference's
+"True"/"False"/None. A frame the reference fails on (e.g. an index past the
+frame) must fail the fast path as well. Descriptors the reference crashes
+on have no semantics to match and are only counted.
+
+The reference works on text, the fast path on bytes (see framing.py), so
+frames with non-ASCII or control characters other than \\t\\n\\v\\f\\r are
+outside the protocol: str.split() treats e.g. \\x1c and \\xa0 as whitespace
+and int()/float() accept non-ASCII digits on str only. Differences on such
+frames are reported as known and end the comparison of that sequence;
+`--strict` counts them as failures.
+
+Failing sequences are shrunk to the fewest frames that still fail. The
+reference parameter classes below are copies of the ones in hargassner.py
+before the decode plan, which no longer decode frames themselves.
+
+Example:
+    python3 tools/fuzz_decoder.py --cases 5000 --seed 7
+"""
+
+import argparse
+import math
+import random
+import re
+import sys
+import xml.etree.ElementTree as xml
+from pathlib import Path
+from typing import Optional
+from xml.sax.saxutils import quoteattr
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from package import missing_homeassistant
+from nano_pk.decoder import HargassnerDecodePlan
+from nano_pk.framing import split_pm_fields
+from nano_pk.layout import parse_layout
+
+try:
+    from nano_pk.hargassner import HargassnerBridge, HargassnerDigitalParameter as BridgeDigitalParameter
+    BRIDGE_ERROR = None
+except ImportError as err:
+    if not missing_homeassistant(err):
+        raise
+    HargassnerBridge, BRIDGE_ERROR = None, err
+
+
+# Reference parameter classes, as in hargassner.py before the decode plan
+class HargassnerAnalogueParameter:
+    def __init__(self, key, index, unit, dop=None):
+        self._key, self._index, self._unit, self._dop = key, index, unit, dop
+        self._value = None
+
+    def key(self):
+        return self._key
+
+    def index(self):
+        return self._index
+
+    def unit(self):
+        return self._unit
+
+    def dop(self):
+        return self._dop
+
+    def value(self):
+        return self._value
+
+    def initializeFromMessage(self, msg):
+        self._value = msg[self._index]
+
+
+class HargassnerDigitalParameter:
+    def __init__(self, key, index, bitmask):
+        self._key, self._index, self._unit, self._bitmask = key, index, None, bitmask
+        self._value = None
+
+    def key(self):
+        return self._key
+
+    def index(self):
+        return self._index
+
+    def unit(self):
+        return self._unit
+
+    def bitmask(self):
+        return self._bitmask
+
+    def value(self):
+        return self._value
+
+    def initializeFromMessage(self, msg):
+        raw = msg[self._index]
+        try:
+            value = int(raw, 16)
+        except Exception:
+            try:
+                value = int(float(raw))
+            except Exception:
+                self._value = None
+                return
+        self._value = str((value & self._bitmask) > 0)
+
+
+# Frames with anything but printable ASCII and \t\n\v\f\r are outside the protocol
+_OUTSIDE_PROTOCOL_RE = re.compile(rb"[^\t\n\x0b\x0c\r\x20-\x7e]")
+
+# Outcomes of one frame
+ACCEPTED = "accepted"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+class ReferenceParser:
+    """The pre-decode-plan bridge: setMessageFormat and the per-line part of async_update."""
+
+    def __init__(self) -> None:
+        self.params: dict = {}
+        self.expected = 0
+        self.actual = None
+
+    def set_message_format(self, msgFormat: str) -> bool:
+        if not msgFormat.startswith("<DAQPRJ>"):
+            return False
+        self.params = {}
+        root = xml.fromstring(msgFormat)
+        analog = root.find("ANALOG")
+        for channel in analog.findall("CHANNEL"):
+            uniqueName = str(channel.get("name"))
+            nameCount = 1
+            while uniqueName in self.params:
+                nameCount += 1
+                uniqueName = str(channel.get("name")) + "_" + str(nameCount)
+            chUnit = channel.get("unit")
+            chDop = channel.get("dop")
+            self.params[uniqueName] = HargassnerAnalogueParameter(
+                uniqueName, int(channel.get("id")), str(chUnit) if chUnit is not None else None,
+                int(chDop) if chDop is not None else None,
+            )
+        ofsDigital = len(self.params)
+        lenDigital = 0
+        digital = root.find("DIGITAL")
+        for channel in digital.findall("CHANNEL"):
+            self.params[str(channel.get("name"))] = HargassnerDigitalParameter(
+                str(channel.get("name")), ofsDigital + int(channel.get("id")), 1 << int(channel.get("bit"))
+            )
+            lenDigital = int(channel.get("id")) + 1
+        self.expected = ofsDigital + lenDigital
+        return True
+
+    def process_line(self, line: bytes) -> str:
+        """Return ACCEPTED, SKIPPED or FAILED; raises UnicodeDecodeError like data.decode()."""
+        parts = line.decode().split()
+        if len(parts) < 2:
+            return SKIPPED
+        msg = parts[1:]
+        if len(msg) < self.expected:
+            return SKIPPED
+        if self.actual != len(msg):
+            self.actual = len(msg)
+            if len(msg) != self.expected:
+                self.expected = len(msg)
+        try:
+            for param in self.params.values():
+                param.initializeFromMessage(msg)
+        except IndexError:
+            return FAILED
+        return ACCEPTED
+
+    def fields(self, line: bytes) -> list[str]:
+        return line.decode().split()[1:]
+
+
+def typed(raw: Optional[str], dop: Optional[int]):
+    """Reference field converted like the decode plan promises."""
+    if raw is None:
+        return None
+    try:
+        number = float(raw)
+        if dop is None:
+            return number
+        return round(number, dop) if dop else round(number)
+    except (ValueError, OverflowError):
+        return None
+
+
+def same(a, b) -> bool:
+    """Equal values of the same type, NaN equal to NaN."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return a == b
+
+
+class PlanTarget:
+    """parse_layout + decode plan, wired up like HargassnerBridge.setLayout / _process_line."""
+
+    name = "plan"
+
+    def set_message_format(self, msgFormat: str) -> bool:
+        try:
+            layout = parse_layout(msgFormat)
+        except ValueError:
+            return False
+        self.params = {}
+        for key, index, unit, dop in layout["analog"]:
+            self.params[key] = ("analog", index, unit, dop)
+        for key, index, bitmask in layout["digital"]:
+            self.params[key] = ("digital", index, None, bitmask)
+        self.expected = layout["length"]
+        self.actual = None
+        self.plan = HargassnerDecodePlan(
+            [(k, p[1], p[3]) for k, p in self.params.items() if p[0] == "analog"],
+            [(k, p[1], p[3]) for k, p in self.params.items() if p[0] == "digital"],
+        )
+        self.values = {}
+        self.words = None
+        self.msg = None
+        return True
+
+    def describe(self) -> dict:
+        return dict(self.params)
+
+    def process_line(self, line: bytes) -> str:
+        needed = self.plan.min_length
+        msg, length = split_pm_fields(line, None if needed is None else max(self.expected, needed))
+        if length < 1 or length < self.expected:
+            return SKIPPED
+        if self.actual != length:
+            self.actual = length
+            if length != self.expected:
+                self.expected = length
+        try:
+            self.values, self.words = self.plan.decode(msg)
+        except IndexError:
+            return FAILED
+        self.msg = msg
+        return ACCEPTED
+
+    def value(self, key: str):
+        if key in self.plan.bits:
+            return None if self.words is None else self.plan.bit(self.words, key)
+        return self.values.get(key)
+
+    def raw(self, index: int) -> Optional[bytes]:
+        return None if self.msg is None else self.msg[index]
+
+
+class BridgeTarget:
+    """The bridge itself (needs Home Assistant)."""
+
+    name = "bridge"
+
+    def set_message_format(self, msgFormat: str) -> bool:
+        self.bridge = HargassnerBridge("127.0.0.1", "Fuzz", "fuzz", layout={"analog": [], "digital": [], "length": 0})
+        return self.bridge.setMessageFormat(msgFormat)
+
+    @property
+    def expected(self) -> int:
+        return self.bridge._expectedMsgLength
+
+    def describe(self) -> dict:
+        described = {}
+        for key, param in self.bridge._paramData.items():
+            if isinstance(param, BridgeDigitalParameter):
+                described[key] = ("digital", param.index(), None, param.bitmask())
+            else:
+                described[key] = ("analog", param.index(), param.unit(), param.dop())
+        return described
+
+    def process_line(self, line: bytes) -> str:
+        try:
+            changed = self.bridge._process_line(line)
+        except IndexError:
+            return FAILED
+        return SKIPPED if changed is None else ACCEPTED
+
+    def value(self, key: str):
+        return self.bridge.getValue(key)
+
+    def raw(self, index: int) -> Optional[bytes]:
+        return None
+
+
+def describe_reference(reference: ReferenceParser) -> dict:
+    described = {}
+    for key, param in reference.params.items():
+        if isinstance(param, HargassnerDigitalParameter):
+            described[key] = ("digital", param.index(), None, param.bitmask())
+        else:
+            described[key] = ("analog", param.index(), param.unit(), param.dop())
+    return described
+
+
+class CaseGenerator:
+    """Random DAQPRJ descriptors and pm frame sequences."""
+
+    _NAMES = ("TK", "TKsoll", "O2", "ZK", "TK_2", "Taus", "Störung", "Pumpe", "X", "X_2", "X_3", "Ventil")
+    _UNITS = (None, "", "°C", "%", "kg", "mA")
+    _GARBAGE = (
+        "abc", "-", ".", "1.2.3", "nan", "NaN", "inf", "-inf", "Infinity", "1e999", "-1e999", "1e-999",
+        "1_000", "0x1f", "0b1", "+5", ".5", "5.", "-0", "1e3", "00012", "ff", "FFFFFFFF", "1f.5", "--1",
+        "1,5", " ",
+    )
+    # Fields outside the protocol (see module docstring), picked rarely
+    _OUTSIDE = ("\u0663", "\x1c", "\xa0", "\xe9", "12\x00")
+    _SEPARATORS = (" ", " ", " ", "  ", "\t", " \t ", "\x0b", "\x0c")
+
+    def __init__(self, seed: int, malformed: float) -> None:
+        self.rnd = random.Random(seed)
+        self.malformed = malformed
+
+    def _bad(self) -> bool:
+        return self.rnd.random() < self.malformed
+
+    def descriptor(self) -> str:
+        rnd = self.rnd
+        parts = ["<DAQPRJ>"]
+        if not (self._bad() and rnd.random() < 0.1):
+            parts.append("<ANALOG>")
+            count = rnd.randint(0, 12)
+            ids = list(range(count))
+            if self._bad():
+                ids = [i + rnd.choice((0, 0, 1, 3, -1)) for i in ids]
+            for channel_id in ids:
+                attrs = {"id": str(channel_id), "name": rnd.choice(self._NAMES)}
+                unit = rnd.choice(self._UNITS)
+                if unit is not None:
+                    attrs["unit"] = unit
+                if rnd.random() < 0.4:
+                    attrs["dop"] = str(rnd.randint(0, 3))
+                if self._bad() and rnd.random() < 0.1:
+                    del attrs[rnd.choice(("id", "name"))]
+                parts.append(self._channel(attrs))
+            parts.append("</ANALOG>")
+        if not (self._bad() and rnd.random() < 0.1):
+            parts.append("<DIGITAL>")
+            channel_id = 0
+            for _ in range(rnd.randint(0, 10)):
+                channel_id += rnd.choice((0, 0, 1)) if not self._bad() else rnd.choice((-1, 0, 1, 2))
+                attrs = {"id": str(channel_id), "name": rnd.choice(self._NAMES), "bit": str(rnd.randint(0, 31))}
+                if self._bad() and rnd.random() < 0.1:
+                    del attrs[rnd.choice(("id", "bit"))]
+                parts.append(self._channel(attrs))
+            parts.append("</DIGITAL>")
+        parts.append("</DAQPRJ>")
+        text = "".join(parts)
+        if self._bad() and rnd.random() < 0.05:
+            text = text[: rnd.randint(0, len(text))]  # truncated XML
+        return text
+
+    @staticmethod
+    def _channel(attrs: dict) -> str:
+        return "<CHANNEL " + " ".join(f"{name}={quoteattr(value)}" for name, value in attrs.items()) + "/>"
+
+    def _field(self, digital: bool) -> str:
+        rnd = self.rnd
+        if self._bad() and rnd.random() < 0.3:
+            return rnd.choice(self._OUTSIDE if rnd.random() < 0.02 else self._GARBAGE)
+        if digital:
+            return format(rnd.getrandbits(rnd.choice((4, 8, 16, 32))), rnd.choice(("x", "X")))
+        if rnd.random() < 0.5:
+            return str(rnd.randint(-50, 5000))
+        return f"{rnd.uniform(-50.0, 500.0):.{rnd.randint(0, 4)}f}"
+
+    def frames(self, expected: int, digital_from: int, count: int) -> list[bytes]:
+        rnd = self.rnd
+        frames = []
+        length = expected
+        for _ in range(count):
+            if self._bad():
+                length = max(0, expected + rnd.choice((-3, -1, 0, 1, 2, 5)))
+            fields = [self._field(index >= digital_from) for index in range(length)]
+            sep = rnd.choice(self._SEPARATORS) if self._bad() else " "
+            line = "pm" + "".join(sep + field for field in fields)
+            if self._bad() and rnd.random() < 0.2:
+                line = rnd.choice((" ", "\t", "")) + line + rnd.choice((" ", "\r", " \r", ""))
+            data = line.encode("utf-8")
+            if self._bad() and rnd.random() < 0.005:
+                data += b"\xff"  # not UTF-8
+            frames.append(data)
+        return frames
+
+
+class Failure(Exception):
+    """A difference between the reference and a fast target."""
+
+    def __init__(self, message: str, known: bool = False) -> None:
+        super().__init__(message)
+        self.known = known
+
+
+def run_case(target, descriptor: str, frames: list[bytes]) -> Optional[str]:
+    """Compare one case, return None when layouts have no reference semantics.
+
+    Raises Failure at the first difference.
+    """
+    reference = ReferenceParser()
+    try:
+        ok = reference.set_message_format(descriptor)
+    except Exception:
+        return "reference crashed"
+    if target.set_message_format(descriptor) != ok:
+        raise Failure(f"descriptor {'accepted' if ok else 'rejected'} by the reference only")
+    if not ok:
+        return "rejected"
+    if target.describe() != describe_reference(reference):
+        raise Failure(f"parameters differ: {describe_reference(reference)} != {target.describe()}")
+    if target.expected != reference.expected:
+        raise Failure(f"expected length {target.expected} != {reference.expected}")
+
+    for number, line in enumerate(frames):
+        outside = bool(_OUTSIDE_PROTOCOL_RE.search(line))
+        try:
+            try:
+                wanted = reference.process_line(line)
+            except UnicodeDecodeError:
+                raise Failure(f"frame {number} is not UTF-8, the reference skips it", known=True)
+            got = target.process_line(line)
+            if got != wanted:
+                raise Failure(f"frame {number} {got} by {target.name}, {wanted} by the reference")
+            if wanted == FAILED:
+                # the reference stops half way through the parameters, its state is no reference
+                return "frame failed"
+            if target.expected != reference.expected:
+                raise Failure(f"frame {number}: expected length {target.expected} != {reference.expected}")
+            fields = reference.fields(line) if wanted == ACCEPTED else None
+            for key, param in reference.params.items():
+                got_value = target.value(key)
+                if isinstance(param, HargassnerDigitalParameter):
+                    got_text = None if got_value is None else str(got_value)
+                    if got_text != param.value():
+                        raise Failure(f"frame {number} {key}: {got_value!r} != reference {param.value()!r}")
+                    continue
+                wanted_value = typed(param.value(), param.dop())
+                if not same(got_value, wanted_value):
+                    raise Failure(
+                        f"frame {number} {key}: {got_value!r} != reference {wanted_value!r} (raw {param.value()!r})"
+                    )
+                raw = target.raw(param.index()) if fields is not None else None
+                if raw is not None and raw != fields[param.index()].encode("utf-8"):
+                    raise Failure(f"frame {number} {key}: raw field {raw!r} != reference {fields[param.index()]!r}")
+        except Failure as failure:
+            if outside and not failure.known:
+                failure.known = True
+            raise
+    return "compared"
+
+
+def shrink(target, descriptor: str, frames: list[bytes]) -> list[bytes]:
+    """Drop frames as long as the case keeps failing."""
+    index = 0
+    while index < len(frames):
+        candidate = frames[:index] + frames[index + 1:]
+        try:
+            run_case(target, descriptor, candidate)
+        except Failure as failure:
+            if not failure.known:
+                frames = candidate
+                continue
+        index += 1
+    return frames
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fuzz the fast decoders against the reference parser")
+    parser.add_argument("--cases", type=int, default=2000, help="Random layouts to try (default: 2000)")
+    parser.add_argument("--frames", type=int, default=20, help="Frames per layout (default: 20)")
+    parser.add_argument("--malformed", type=float, default=0.2, help="Probability of each malformation (default: 0.2)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the first case (default: 1)")
+    parser.add_argument("--target", choices=("plan", "bridge", "all"), default="all", help="Fast path(s) to check")
+    parser.add_argument("--strict", action="store_true", help="Count differences outside the protocol as failures")
+    parser.add_argument("--show", type=int, default=3, help="Failing cases printed in full (default: 3)")
+
+    args = parser.parse_args(argv)
+
+    targets = []
+    if args.target in ("plan", "all"):
+        targets.append(PlanTarget)
+    if args.target in ("bridge", "all"):
+        if HargassnerBridge is None:
+            print(f"The bridge target needs Home Assistant ({BRIDGE_ERROR}), use --target plan without it", file=sys.stderr)
+            return 1
+        targets.append(BridgeTarget)
+
+    failures = 0
+    for target_class in targets:
+        outcomes: dict[str, int] = {}
+        known = 0
+        shown = 0
+        for case in range(args.cases):
+            generator = CaseGenerator(args.seed + case, args.malformed)
+            descriptor = generator.descriptor()
+            reference = ReferenceParser()
+            try:
+                reference.set_message_format(descriptor)
+            except Exception:
+                pass
+            digital_from = sum(isinstance(p, HargassnerAnalogueParameter) for p in reference.params.values())
+            frames = generator.frames(reference.expected, digital_from, args.frames)
+            target = target_class()
+            try:
+                outcome = run_case(target, descriptor, frames)
+            except Failure as failure:
+                if failure.known and not args.strict:
+                    known += 1
+                    continue
+                failures += 1
+                outcome = "failed"
+                if shown < args.show:
+                    shown += 1
+                    frames = shrink(target_class(), descriptor, frames)
+                    print(f"{target_class.name}: case seed {args.seed + case}: {failure}")
+                    print(f"  descriptor: {descriptor}")
+                    for line in frames:
+                        print(f"  frame: {line!r}")
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        summary = ", ".join(f"{count} {name}" for name, count in sorted(outcomes.items()))
+        print(f"{target_class.name}: {args.cases} cases: {summary}, {known} with known differences outside the protocol")
+
+    if failures:
+        print(f"{failures} case(s) differ from the reference")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""Run the integration's setup path outside a Home Assistant instance.
+
+Shared by the profiling, memory, soak and load tools. A bare Home Assistant
+core (no config, no other integrations, no recorder) stands in for a full
+instance; the sensor platform is set up from a config entry stand-in, and
+entities are added by a minimal entity platform that runs their
+`async_added_to_hass` and records their state writes instead of writing to
+the state machine. Frames come from in-process fake boilers (see
+fake_boiler.py) on local ports, so everything runs on one event loop.
+
+Needs Home Assistant installed; the harness does not replace any of its
+modules.
+"""
+
+import asyncio
+import itertools
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import package  # noqa: F401 - puts custom_components on sys.path
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+
+from nano_pk import sensor as sensor_platform
+from nano_pk.const import (
+    DOMAIN,
+    DATA_BRIDGES,
+    CONF_HOST,
+    CONF_FORMAT,
+    CONF_FORMAT_CONTENT,
+    CONF_NAME,
+    CONF_PARAMS,
+    CONF_LANG,
+    CONF_LANG_EN,
+    CONF_UNIQUE_ID,
+)
+from nano_pk.hargassner import HargassnerBridge, HargassnerMessageTemplates
+
+from fake_boiler import FakeBoiler, load_descriptor, load_frames
+
+_entry_ids = itertools.count(1)
+
+
+async def async_create_hass(config_dir: str | Path) -> HomeAssistant:
+    """Return a bare Home Assistant core using `config_dir` (must run in the loop)."""
+    try:
+        hass = HomeAssistant(str(config_dir))
+    except TypeError:  # releases before 2023.x take no config dir
+        hass = HomeAssistant()
+        hass.config.config_dir = str(config_dir)
+    hass.data.setdefault(DOMAIN, {})
+    return hass
+
+
+async def async_flush_storage(hass: HomeAssistant) -> None:
+    """Write delayed `Store` saves (e.g. the layout cache) to disk now."""
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+
+class FakeConfigEntry:
+    """The parts of a ConfigEntry the sensor platform reads."""
+
+    def __init__(self, data: dict, options: Optional[dict] = None) -> None:
+        self.entry_id = f"harness{next(_entry_ids)}"
+        self.data = data
+        self.options = options or {}
+        self.title = data.get(CONF_NAME, "")
+
+
+def entry_data(host: str, msg_format: str, params: str, name: str = "Hargassner", unique_id: str = "1") -> dict:
+    """Return the config entry data of one boiler.
+
+    `msg_format` is a built-in template name (NANO_PK_FULL included), an
+    XML file or DAQPRJ content, as the config flow would store it.
+    """
+    if msg_format not in HargassnerMessageTemplates.NAMES and not msg_format.lstrip().startswith("<"):
+        if not msg_format.endswith(".xml"):
+            msg_format += ".xml"  # msgformats/<name>.xml
+    return {
+        CONF_HOST: host,
+        CONF_NAME: name,
+        CONF_FORMAT: msg_format,
+        CONF_FORMAT_CONTENT: None,
+        CONF_PARAMS: params,
+        CONF_LANG: CONF_LANG_EN,
+        CONF_UNIQUE_ID: unique_id,
+    }
+
+
+class EntityPlatform:
+    """Minimal entity platform: adds entities and records their state writes.
+
+    `frames` counts the lines handed to the bridges, `writes` all state
+    writes; `first_available` is the monotonic time of the first write of a
+    sensor (not a bridge) that was available and carried a value after its
+    bridge received a frame, i.e. when a user would first see a value; with `record_latencies`, `write_latencies` holds the seconds
+    from a line reaching its bridge to each sensor state write.
+    """
+
+    def __init__(self, hass: HomeAssistant, record_latencies: bool = False) -> None:
+        self.hass = hass
+        self._record_latencies = record_latencies
+        self.entities: list = []
+        self.entry_ids: list[str] = []
+        self.writes = 0
+        self.frames = 0  # lines handed to the bridges
+        self.first_available: Optional[float] = None
+        self.write_latencies: list[float] = []  # frame received -> state written, seconds
+        self._pending: list = []
+        self._ids = itertools.count(1)
+
+    def __call__(self, entities, update_before_add: bool = False) -> None:
+        """The async_add_entities callback handed to the platform."""
+        self._pending.extend(entities)
+
+    async def async_add_pending(self) -> list:
+        """Add the entities handed over so far, return them."""
+        added, self._pending = self._pending, []
+        for entity in added:
+            entity.hass = self.hass
+            domain = DOMAIN if isinstance(entity, HargassnerBridge) else "sensor"
+            entity.entity_id = f"{domain}.harness_{next(self._ids)}"
+            entity.async_write_ha_state = self._writer(entity)
+            if isinstance(entity, HargassnerBridge):
+                entity.harness_frame_received = None
+            await entity.async_added_to_hass()
+            if isinstance(entity, HargassnerBridge) and entity._connection is not None:
+                self._stamp_frames(entity._connection)
+            self.entities.append(entity)
+        return added
+
+    def _stamp_frames(self, connection) -> None:
+        """Count lines and note when each reaches a bridge, once per session.
+
+        Wraps the session's dispatch, so the bridges' own line callbacks (and
+        how the session adds and removes them) stay those of production.
+        """
+        if getattr(connection, "harness_platform", None) is self:
+            return
+        connection.harness_platform = self
+        dispatch = connection._dispatch
+
+        def stamped(line: bytes) -> None:
+            received = time.monotonic()
+            for line_callback, _ in list(connection._subscribers):
+                bridge = getattr(line_callback, "__self__", None)
+                if isinstance(bridge, HargassnerBridge):
+                    self.frames += 1
+                    bridge.harness_frame_received = received
+            dispatch(line)
+
+        connection._dispatch = stamped
+
+    def _writer(self, entity):
+        bridge = entity if isinstance(entity, HargassnerBridge) else getattr(entity, "_bridge", None)
+
+        def write_state() -> None:
+            self.writes += 1
+            # compute what the state machine would store
+            if isinstance(entity, HargassnerBridge):
+                entity.state
+                entity.extra_state_attributes
+                return
+            available = entity.available
+            value = entity.native_value
+            received = getattr(bridge, "harness_frame_received", None)
+            if available and value is not None and received is not None and self.first_available is None:
+                self.first_available = time.monotonic()
+            if self._record_latencies and received is not None:
+                self.write_latencies.append(time.monotonic() - received)
+        return write_state
+
+    async def async_remove_all(self) -> None:
+        """Remove all entities and unload their entries, the bridges close their sessions."""
+        for entity in reversed(self.entities):
+            await entity.async_will_remove_from_hass()
+            # what Entity.async_remove does besides the registry cleanup
+            while getattr(entity, "_on_remove", None):
+                entity._on_remove.pop()()
+        self.entities.clear()
+        # what async_unload_entry does after unloading the platforms
+        bridges = self.hass.data[DOMAIN].get(DATA_BRIDGES, {})
+        for entry_id in self.entry_ids:
+            bridges.pop(entry_id, None)
+        self.entry_ids.clear()
+
+
+async def async_setup_boiler(hass: HomeAssistant, platform: EntityPlatform, entry: FakeConfigEntry) -> list:
+    """Run the sensor platform's async_setup_entry and add its entities."""
+    await sensor_platform.async_setup_entry(hass, entry, platform)
+    platform.entry_ids.append(entry.entry_id)
+    return await platform.async_add_pending()
+
+
+def percentiles(values: list[float], scale: float = 1000.0, digits: int = 2) -> dict:
+    """Return p50/p95/p99/max of `values` (seconds, in ms by default)."""
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+
+    def pick(fraction: float) -> float:
+        return round(ordered[min(last, int(len(ordered) * fraction))] * scale, digits)
+
+    return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": round(ordered[-1] * scale, digits)}
+
+
+class LoopLagMonitor:
+    """Measure how late a periodic timer fires, i.e. how long the loop was blocked."""
+
+    def __init__(self, interval: float = 0.02) -> None:
+        self._interval = interval
+        self._lags: list[float] = []
+        self._task = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            self._lags.append(max(loop.time() - due, 0.0))
+
+    def take(self) -> dict:
+        """Return the lag percentiles in ms since the last call."""
+        lags, self._lags = self._lags, []
+        return percentiles(lags)
+
+
+async def async_start_fake_boiler(
+    descriptor: str = "NANO_PK_FULL",
+    generate: int = 1000,
+    speed: float = 1.0,
+    interval: float = 1.0,
+    seed: Optional[int] = None,
+    replay: Optional[str] = None,
+) -> tuple[asyncio.AbstractServer, FakeBoiler, int]:
+    """Start a fake boiler on a free local port, return (server, boiler, port).
+
+    The bridges send no commands, so frames start without a command window.
+    """
+    xml = load_descriptor(descriptor)
+    boiler = FakeBoiler(
+        xml, load_frames(replay, xml, generate, seed), speed=speed, interval=interval, seed=seed, command_window=0.0
+    )
+    server = await asyncio.start_server(boiler.handle_client, "127.0.0.1", 0)
+    return server, boiler, server.sockets[0].getsockname()[1]
+
+
+async def async_stop_fake_boiler(server: asyncio.AbstractServer, boiler: FakeBoiler) -> None:
+    """Stop a fake boiler started by async_start_fake_boiler, its clients included."""
+    server.close()
+    await boiler.async_close()
+    await server.wait_closed()
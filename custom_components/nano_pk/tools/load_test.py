@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""Load test: many boilers through the real bridge path on one event loop.
+
+For each fleet size (default 10, 50, 100, 250 and 500 boilers) the sensor
+platform sets up one config entry per boiler against a bare Home Assistant
+core (see harness.py). Each boiler is a local TCP server that sends a
+synthetic frame every `--interval` seconds on a fixed schedule, with the
+boilers' phases spread evenly over the interval (`--aligned` sends all
+frames at the same time instead, like boilers started together).
+
+The boilers run on their own event loop in a second thread, so the numbers
+below belong to the integration's loop alone:
+
+    cpu per frame     CPU time of the loop thread / frames handled
+    loop load         CPU time of the loop thread / wall time
+    loop lag          how late a 20 ms timer fires, p50/p95/p99/max
+    frame to state    from the boiler writing a frame to the last state
+                      write it caused (socket, session, framing, decode,
+                      deadband, fan-out), p50/p95/p99/max
+    handling          the bridge's _handle_line alone, same percentiles
+    delivered         frames handled / frames sent; frames the session
+                      skipped as backlog are missing
+
+A fleet size counts as saturated when the loop load reaches `--max-load`,
+fewer than 95% of the frames are delivered or the p99 frame to state
+latency exceeds the interval. Measurement starts after every bridge
+decoded a frame and `--warmup` seconds passed.
+
+Needs Home Assistant installed.
+
+Example:
+    python3 tools/load_test.py --boilers 10 100 500 --params FULL --json load.json
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from package import missing_homeassistant
+from nano_pk.layout import parse_layout
+
+# Distinct frames per boiler, sent in a loop
+_FRAMES_PER_BOILER = 200
+# Frames sent but not (yet) handled that are remembered per boiler
+_PENDING_FRAMES = 1000
+# File descriptors per boiler: listening socket, server side, client side
+_FDS_PER_BOILER = 3
+
+
+class ScheduledBoilers:
+    """Boilers sending frames on a fixed schedule from their own thread.
+
+    `sent[port]` holds (line, monotonic send time) of the frames not yet
+    matched by `match`, in send order.
+    """
+
+    def __init__(self, count: int, template: str, interval: float, aligned: bool, seed: int) -> None:
+        from fake_boiler import load_descriptor
+        from pm_generator import PmFrameGenerator
+
+        layout = parse_layout(load_descriptor(template))
+        self._frames = []
+        for number in range(count):
+            generator = PmFrameGenerator(layout, seed=seed + number, toggle=0.02)
+            self._frames.append([generator.frame() for _ in range(_FRAMES_PER_BOILER)])
+        self._interval = interval
+        self._phases = [0.0 if aligned else interval * number / count for number in range(count)]
+        self.sent: dict[int, deque] = {}
+        self.ports: list[int] = []
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="boilers", daemon=True)
+
+    def start(self) -> list[int]:
+        """Start the servers, return their ports."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._async_start(), self._loop).result()
+        return self.ports
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._async_stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _async_start(self) -> None:
+        self._start = self._loop.time()
+        self._servers = []
+        self._handlers = set()
+        for number, frames in enumerate(self._frames):
+            server = await asyncio.start_server(self._handler(number, frames), "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            self._servers.append(server)
+            self.ports.append(port)
+            self.sent[port] = deque(maxlen=_PENDING_FRAMES)
+
+    async def _async_stop(self) -> None:
+        for server in self._servers:
+            server.close()
+        for task in self._handlers:
+            task.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        for server in self._servers:
+            await server.wait_closed()
+
+    def _handler(self, number: int, frames: list[bytes]):
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            task = asyncio.current_task()
+            self._handlers.add(task)
+            sent = self.sent[writer.get_extra_info("sockname")[1]]
+            loop = self._loop
+            # next slot of this boiler's schedule
+            slot = int((loop.time() - self._start - self._phases[number]) / self._interval) + 1
+            try:
+                while True:
+                    due = self._start + self._phases[number] + slot * self._interval
+                    await asyncio.sleep(max(due - loop.time(), 0.0))
+                    line = frames[slot % len(frames)]
+                    sent.append((line, time.monotonic()))
+                    writer.write(line + b"\r\n")
+                    await writer.drain()
+                    slot += 1
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+            finally:
+                writer.close()
+                self._handlers.discard(task)
+        return handle
+
+    def match(self, port: int, line: bytes) -> Optional[float]:
+        """Return the send time of `line`, dropping older frames that were skipped."""
+        sent = self.sent.get(port)
+        while sent:
+            candidate, when = sent.popleft()
+            if candidate == line:
+                return when
+        return None
+
+
+def raise_fd_limit(needed: int) -> None:
+    """Raise the soft open file limit to `needed` if the hard limit allows."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < needed:
+        target = needed if hard == resource.RLIM_INFINITY else min(needed, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        if target < needed:
+            print(f"Open file limit {hard} is below the {needed} needed", file=sys.stderr)
+
+
+async def async_load(boilers: ScheduledBoilers, ports: list[int], args) -> dict:
+    """Set up one entry per boiler, measure the loop while frames flow."""
+    import harness
+
+    bridge_class = harness.HargassnerBridge
+    handle_line = bridge_class._handle_line
+    end_to_end: list[float] = []
+    handling: list[float] = []
+    measuring = False
+
+    def timed_handle_line(bridge, line: bytes) -> None:
+        received = time.monotonic()
+        handle_line(bridge, line)
+        done = time.monotonic()
+        sent = boilers.match(getattr(bridge, "harness_port", None), line)
+        if measuring:
+            handling.append(done - received)
+            if sent is not None:
+                end_to_end.append(done - sent)
+
+    with tempfile.TemporaryDirectory(prefix="nano_pk_load_") as config_dir, \
+            mock.patch.object(bridge_class, "_handle_line", timed_handle_line):
+        hass = await harness.async_create_hass(config_dir)
+        platform = harness.EntityPlatform(hass)
+        for number, port in enumerate(ports):
+            entry = harness.FakeConfigEntry(
+                harness.entry_data(f"127.0.0.1:{port}", args.template, args.params, f"Boiler {number}", str(number))
+            )
+            for entity in await harness.async_setup_boiler(hass, platform, entry):
+                if isinstance(entity, bridge_class):
+                    entity.harness_port = port
+        bridges = [e for e in platform.entities if isinstance(e, bridge_class)]
+
+        deadline = time.monotonic() + args.timeout
+        while not all(bridge.hasRecentData() for bridge in bridges):
+            if time.monotonic() > deadline:
+                raise RuntimeError(
+                    f"{sum(not b.hasRecentData() for b in bridges)} of {len(bridges)} bridges got no frame in {args.timeout}s"
+                )
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(args.warmup)
+
+        lag = harness.LoopLagMonitor()
+        lag.start()
+        measuring = True
+        frames = platform.frames
+        cpu = time.thread_time()
+        start = time.monotonic()
+        await asyncio.sleep(args.duration)
+        elapsed = time.monotonic() - start
+        cpu = time.thread_time() - cpu
+        frames = platform.frames - frames
+        measuring = False
+        lags = lag.take()
+        lag.stop()
+
+        entities = len(platform.entities) - len(bridges)
+        await platform.async_remove_all()
+
+    expected = len(ports) * elapsed / args.interval
+    return {
+        "boilers": len(ports),
+        "entities": entities,
+        "seconds": round(elapsed, 2),
+        "frames": frames,
+        "frames_per_second": round(frames / elapsed, 1),
+        "delivered": round(min(frames / expected, 1.0), 4) if expected else 0.0,
+        "cpu_ms_per_frame": round(cpu / frames * 1000, 4) if frames else 0.0,
+        "loop_load": round(cpu / elapsed, 4),
+        "loop_lag_ms": lags,
+        "frame_to_state_ms": harness.percentiles(end_to_end, digits=3),
+        "handling_ms": harness.percentiles(handling, digits=3),
+    }
+
+
+def saturated(result: dict, interval: float, max_load: float) -> list[str]:
+    """Return why a fleet size is saturated, empty if it is not."""
+    reasons = []
+    if result["loop_load"] >= max_load:
+        reasons.append(f"loop load {result['loop_load']:.0%}")
+    if result["delivered"] < 0.95:
+        reasons.append(f"{result['delivered']:.0%} delivered")
+    if result["frame_to_state_ms"]["p99"] > interval * 1000:
+        reasons.append(f"p99 frame to state {result['frame_to_state_ms']['p99']:.0f} ms")
+    return reasons
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test many boilers on one event loop")
+    parser.add_argument(
+        "--boilers", type=int, nargs="+", default=[10, 50, 100, 250, 500], help="Fleet sizes (default: 10 50 100 250 500)"
+    )
+    parser.add_argument("--template", default="NANO_PK_FULL", help="Message format of the boilers (default: NANO_PK_FULL)")
+    parser.add_argument("--params", default="STANDARD", choices=("STANDARD", "FULL"), help="Entity set (default: STANDARD)")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between frames of a boiler (default: 1)")
+    parser.add_argument("--aligned", action="store_true", help="Send the frames of all boilers at the same time")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds measured per fleet size (default: 30)")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Seconds of frames before measuring (default: 5)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for all first frames")
+    parser.add_argument("--max-load", type=float, default=0.9, help="Loop load that counts as saturated (default: 0.9)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the synthetic frames (default: 1)")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+
+    args = parser.parse_args(argv)
+
+    try:
+        import harness  # noqa: F401 - needs Home Assistant
+    except ImportError as err:
+        if not missing_homeassistant(err):
+            raise
+        print(f"Load test needs Home Assistant: {err}", file=sys.stderr)
+        return 1
+
+    raise_fd_limit(max(args.boilers) * _FDS_PER_BOILER + 256)
+    print(f"{'boilers':>7} {'entities':>8} {'frames/s':>9} {'deliv.':>7} {'cpu/frame':>10} {'load':>6}"
+          f" {'lag p99/max':>15} {'frame->state p50/p99/max':>26}")
+    results = []
+    tops_out = None
+    for count in args.boilers:
+        boilers = ScheduledBoilers(count, args.template, args.interval, args.aligned, args.seed)
+        ports = boilers.start()
+        try:
+            result = asyncio.run(async_load(boilers, ports, args))
+        finally:
+            boilers.stop()
+        result["saturated"] = saturated(result, args.interval, args.max_load)
+        results.append(result)
+        lag, e2e = result["loop_lag_ms"], result["frame_to_state_ms"]
+        print(
+            f"{count:7} {result['entities']:8} {result['frames_per_second']:9.1f} {result['delivered']:7.1%}"
+            f" {result['cpu_ms_per_frame']:8.3f}ms {result['loop_load']:6.1%}"
+            f" {lag['p99']:6.1f}/{lag['max']:6.1f}ms {e2e['p50']:7.2f}/{e2e['p99']:7.2f}/{e2e['max']:7.2f}ms"
+            + (f"  saturated: {', '.join(result['saturated'])}" if result["saturated"] else "")
+        )
+        if result["saturated"] and tops_out is None:
+            tops_out = count
+
+    if tops_out is None:
+        print(f"Not saturated up to {max(args.boilers)} boilers")
+    else:
+        print(f"Saturated at {tops_out} boilers")
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps(
+                {
+                    "template": args.template,
+                    "params": args.params,
+                    "interval": args.interval,
+                    "aligned": args.aligned,
+                    "results": results,
+                    "saturated_at": tops_out,
+                },
+                indent=2,
+            ) + "\n",
+            encoding="utf-8",
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
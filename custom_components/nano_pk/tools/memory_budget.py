@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Memory budget of boilers, bridges and entities, measured with tracemalloc.
+
+For each fleet size (default 1, 10 and 100 boilers) a fresh event loop sets
+up that many config entries against their own fake boilers (see harness.py),
+waits until every bridge decoded frames and then attributes the memory that
+is still allocated:
+
+    bridge    allocations whose innermost nano_pk frame is not an entity
+              platform: bridge, parameters, decode plan, deadband,
+              coordinator, session and framer
+    entities  allocations made in sensor.py / binary_sensor.py
+    other     allocations without nano_pk frame (HA core, asyncio)
+
+The fake boilers and the harness itself are excluded. Shared, one-time costs
+are measured before the first boiler: the error codes merged into
+HargassnerErrorSensor.ERRORS from DE.CSV and the cached built-in templates.
+
+Budgets are given in bytes; the tool exits with 1 when one is exceeded, so
+it can gate changes in CI.
+
+Needs Home Assistant installed.
+
+Example:
+    python3 tools/memory_budget.py --params FULL --max-bytes-per-boiler 400000 --max-bytes-per-entity 4000
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from package import PACKAGE_DIR, missing_homeassistant
+
+_ENTITY_MODULES = ("sensor.py", "binary_sensor.py")
+
+# Traceback depth kept per allocation, deep enough to reach the nano_pk frame
+_TRACE_DEPTH = 25
+
+
+def _classify(traceback) -> str:
+    """Return the owner of an allocation from its traceback."""
+    for frame in reversed(traceback):  # innermost first
+        path = Path(frame.filename)
+        if path.parent == TOOLS_DIR:
+            return "harness"
+        if path.parent == PACKAGE_DIR:
+            return "entities" if path.name in _ENTITY_MODULES else "bridge"
+    return "other"
+
+
+def _grown(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> dict[str, int]:
+    """Return the bytes allocated between two snapshots by owner."""
+    owners = {"bridge": 0, "entities": 0, "other": 0, "harness": 0}
+    for stat in after.compare_to(before, "traceback"):
+        owners[_classify(stat.traceback)] += stat.size_diff
+    return owners
+
+
+async def _async_shared_costs(hass) -> dict[str, int]:
+    """Measure the one-time costs of DE.CSV error codes and templates."""
+    from nano_pk.hargassner import HargassnerMessageTemplates
+    from nano_pk.sensor import HargassnerErrorSensor
+
+    HargassnerErrorSensor._extended_errors_loaded = False
+    gc.collect()
+    start = tracemalloc.take_snapshot()
+    await HargassnerErrorSensor._async_ensure_extended_errors_loaded(hass)
+    gc.collect()
+    loaded = tracemalloc.take_snapshot()
+    for name in HargassnerMessageTemplates.NAMES:
+        await hass.async_add_executor_job(HargassnerMessageTemplates.load, name)
+    gc.collect()
+    templates = tracemalloc.take_snapshot()
+    return {
+        "error_codes": sum(_grown(start, loaded).values()),
+        "error_code_count": len(HargassnerErrorSensor.ERRORS),
+        "templates": sum(_grown(loaded, templates).values()),
+    }
+
+
+async def async_measure(boilers: int, template: str, params: str, settle: float, timeout: float) -> dict:
+    """Set up `boilers` boilers and return their memory by owner."""
+    import harness
+
+    with tempfile.TemporaryDirectory(prefix="nano_pk_memory_") as config_dir:
+        hass = await harness.async_create_hass(config_dir)
+        shared = await _async_shared_costs(hass)
+
+        servers = []
+        for _ in range(boilers):
+            server, boiler, port = await harness.async_start_fake_boiler(template, generate=100, interval=1.0)
+            servers.append((server, boiler, port))
+        platform = harness.EntityPlatform(hass)
+        try:
+            gc.collect()
+            before = tracemalloc.take_snapshot()
+            for number, (_server, _boiler, port) in enumerate(servers):
+                entry = harness.FakeConfigEntry(
+                    harness.entry_data(f"127.0.0.1:{port}", template, params, f"Boiler {number}", str(number))
+                )
+                await harness.async_setup_boiler(hass, platform, entry)
+            bridges = [e for e in platform.entities if isinstance(e, harness.HargassnerBridge)]
+
+            # the sessions queue for a few connection slots, so wait as long as bridges keep coming up
+            waiting = len(bridges)
+            deadline = time.monotonic() + timeout
+            while waiting:
+                missing = sum(not bridge.hasRecentData() for bridge in bridges)
+                if missing < waiting:
+                    waiting, deadline = missing, time.monotonic() + timeout
+                elif time.monotonic() > deadline:
+                    raise RuntimeError(f"{missing} of {boilers} bridges got no frame in {timeout}s")
+                await asyncio.sleep(0.05)
+            await asyncio.sleep(settle)  # let buffers and deadband state reach steady state
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+
+            owners = _grown(before, after)
+            entities = len(platform.entities) - len(bridges)
+        finally:
+            await platform.async_remove_all()
+            for server, boiler, _port in servers:
+                await harness.async_stop_fake_boiler(server, boiler)
+
+    per_boiler = owners["bridge"] + owners["entities"] + owners["other"]
+    return {
+        "boilers": boilers,
+        "entities": entities,
+        "shared": shared,
+        "bytes": owners,
+        "bytes_per_boiler": round(per_boiler / boilers),
+        "bytes_per_bridge": round(owners["bridge"] / boilers),
+        "bytes_per_entity": round(owners["entities"] / entities) if entities else 0,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the memory cost of boilers, bridges and entities")
+    parser.add_argument("--boilers", type=int, nargs="+", default=[1, 10, 100], help="Fleet sizes (default: 1 10 100)")
+    parser.add_argument("--template", default="NANO_PK_FULL", help="Message format of the boilers (default: NANO_PK_FULL)")
+    parser.add_argument("--params", default="FULL", choices=("STANDARD", "FULL"), help="Entity set (default: FULL)")
+    parser.add_argument("--settle", type=float, default=3.0, help="Seconds of frames before measuring (default: 3)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for the next bridge's first frame (default: 60)")
+    parser.add_argument("--max-bytes-per-boiler", type=int, help="Budget for everything one boiler costs")
+    parser.add_argument("--max-bytes-per-bridge", type=int, help="Budget for one bridge and its session")
+    parser.add_argument("--max-bytes-per-entity", type=int, help="Budget for one sensor entity")
+    parser.add_argument("--max-shared-bytes", type=int, help="Budget for the error codes and templates together")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+
+    args = parser.parse_args(argv)
+
+    try:
+        import harness  # noqa: F401 - needs Home Assistant
+    except ImportError as err:
+        if not missing_homeassistant(err):
+            raise
+        print(f"Memory budget needs Home Assistant: {err}", file=sys.stderr)
+        return 1
+
+    tracemalloc.start(_TRACE_DEPTH)
+    results = []
+    for boilers in args.boilers:
+        result = asyncio.run(async_measure(boilers, args.template, args.params, args.settle, args.timeout))
+        results.append(result)
+        print(
+            f"{boilers:4} boilers, {result['entities']:5} entities: "
+            f"{result['bytes_per_boiler']:>9,} B/boiler {result['bytes_per_bridge']:>9,} B/bridge "
+            f"{result['bytes_per_entity']:>7,} B/entity  (other {result['bytes']['other']:,} B)"
+        )
+    tracemalloc.stop()
+    shared = results[0]["shared"]
+    print(
+        f"Shared: {shared['error_codes']:,} B for {shared['error_code_count']} error codes, "
+        f"{shared['templates']:,} B for the built-in templates"
+    )
+
+    budgets = {
+        "bytes_per_boiler": args.max_bytes_per_boiler,
+        "bytes_per_bridge": args.max_bytes_per_bridge,
+        "bytes_per_entity": args.max_bytes_per_entity,
+    }
+    exceeded = [
+        f"{key} {result[key]:,} > {budget:,} with {result['boilers']} boilers"
+        for result in results
+        for key, budget in budgets.items()
+        if budget is not None and result[key] > budget
+    ]
+    shared_bytes = shared["error_codes"] + shared["templates"]
+    if args.max_shared_bytes is not None and shared_bytes > args.max_shared_bytes:
+        exceeded.append(f"shared {shared_bytes:,} > {args.max_shared_bytes:,}")
+
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps({"template": args.template, "params": args.params, "results": results}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+    if exceeded:
+        print("Budget exceeded: " + "; ".join(exceeded))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""Make the integration importable as `nano_pk` for the tools.
+
+Only custom_components goes on sys.path. With the package directory itself
+on the path its modules were importable top-level, where they shadowed
+standard library and installed modules and failed on their relative imports.
+
+nano_pk/__init__.py needs Home Assistant. Without it the package is
+registered without running __init__.py, so the modules that do not import
+Home Assistant (decoder, framing, layout, deadband, archive, timing,
+daq_fetcher, descriptor_client) still import as `nano_pk.*`. Importing any
+other module then raises ModuleNotFoundError for homeassistant, which
+`missing_homeassistant` tells apart from a real import error.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1]
+CUSTOM_COMPONENTS = PACKAGE_DIR.parent
+TEMPLATE_DIR = PACKAGE_DIR / "msgformats"
+
+if str(CUSTOM_COMPONENTS) not in sys.path:
+    sys.path.insert(0, str(CUSTOM_COMPONENTS))
+
+
+def missing_homeassistant(err: ImportError) -> bool:
+    """Return True if `err` means that Home Assistant is not installed."""
+    return isinstance(err, ModuleNotFoundError) and (err.name or "").split(".")[0] == "homeassistant"
+
+
+try:
+    import nano_pk  # noqa: F401
+    HOMEASSISTANT = True
+except ModuleNotFoundError as err:
+    if not missing_homeassistant(err):
+        raise
+    HOMEASSISTANT = False
+    _spec = importlib.util.spec_from_loader("nano_pk", None, is_package=True)
+    _spec.submodule_search_locations.append(str(PACKAGE_DIR))
+    sys.modules["nano_pk"] = importlib.util.module_from_spec(_spec)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Synthetic pm frame generator driven by any DAQPRJ layout.
+
+Every analogue channel follows a model picked from its name and unit:
+temperatures and percentages are bounded random walks, counters only
+increase, and ZK (boiler state) runs through a firing cycle state machine.
+Digital channels toggle randomly, except `Störung`, which follows the fault
+state of ZK. `--channels` builds a synthetic layout of any size, so that the
+parser and the entity fan-out can be stressed far beyond the 97 channels of
+NANO_PK_FULL.
+
+Examples:
+    python3 tools/pm_generator.py --descriptor NANO_V14L --count 10
+    python3 tools/pm_generator.py --channels 2000 --emit-descriptor big.xml --rate 0 --count 100000 -o big.txt
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+from xml.sax.saxutils import quoteattr
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from package import TEMPLATE_DIR
+from nano_pk.archive import HargassnerArchiveWriter
+from nano_pk.layout import parse_layout
+
+# Decimal places written for channels without `dop`, as the boilers send them
+_DEFAULT_DIGITS = 1
+
+# Channels that count up (same set the bridge reports as total_increasing)
+_COUNTER_KEYS = {"LZ ES seit Füll.", "LZ ES seit Ent.", "Anzahl Entasch.", "Anzahl SR Beweg.", "Verbrauchszähler"}
+
+# ZK firing cycle: state -> (min frames, max frames, next states)
+_ZK_CYCLE = {
+    1: (30, 300, (2,)),  # off
+    2: (5, 20, (3,)),  # preparing start
+    3: (10, 30, (4,)),  # boiler start
+    4: (10, 30, (5,)),  # monitoring ignition
+    5: (20, 60, (7,)),  # ignition
+    7: (10, 30, (6,)),  # transition to full firing
+    6: (300, 1800, (8, 9)),  # full firing
+    8: (60, 300, (6, 9)),  # ember preservation
+    9: (30, 120, (10, 1)),  # burn-out
+    10: (20, 60, (11,)),  # ash removal
+    11: (10, 40, (1,)),  # cleaning
+    13: (30, 120, (1,)),  # fault active
+}
+_ZK_FAULT_STATE = 13
+
+
+def synthetic_descriptor(analog: int, digital_words: int = 1) -> str:
+    """Build a DAQPRJ descriptor with `analog` channels and 32 bits per digital word."""
+    units = ("°C", "%", "°C", "", "mA", "°C", "%", "rpm")
+    channels = []
+    for index in range(analog):
+        if index == 0:
+            channels.append("<CHANNEL id='0' name='ZK' dop='0'/>")
+        elif index % 10 == 9:
+            channels.append(f"<CHANNEL id='{index}' name='Anzahl CH{index}' dop='0'/>")
+        else:
+            unit = units[index % len(units)]
+            channels.append(f"<CHANNEL id='{index}' name='CH{index}' unit={quoteattr(unit)}/>")
+    bits = [
+        f"<CHANNEL id='{word}' bit='{bit}' name='{'Störung' if word == bit == 0 else f'B{word}_{bit}'}'/>"
+        for word in range(digital_words)
+        for bit in range(32)
+    ]
+    return f"<DAQPRJ><ANALOG>{''.join(channels)}</ANALOG><DIGITAL>{''.join(bits)}</DIGITAL></DAQPRJ>"
+
+
+class _Walk:
+    """Bounded random walk."""
+
+    __slots__ = ("value", "low", "high", "step")
+
+    def __init__(self, rnd: random.Random, low: float, high: float, step: float) -> None:
+        self.value = rnd.uniform(low, high)
+        self.low = low
+        self.high = high
+        self.step = step
+
+    def next(self, rnd: random.Random) -> float:
+        value = self.value + rnd.gauss(0.0, self.step)
+        if value < self.low or value > self.high:
+            value = self.value - (value - self.value)  # reflect at the bounds
+        self.value = min(max(value, self.low), self.high)
+        return self.value
+
+
+class _Counter:
+    """Monotonic counter increasing now and then."""
+
+    __slots__ = ("value", "probability")
+
+    def __init__(self, rnd: random.Random) -> None:
+        self.value = rnd.randrange(0, 10000)
+        self.probability = rnd.uniform(0.001, 0.05)
+
+    def next(self, rnd: random.Random) -> float:
+        if rnd.random() < self.probability:
+            self.value += 1
+        return self.value
+
+
+class PmFrameGenerator:
+    """Produce pm lines for a compiled layout (see layout.parse_layout)."""
+
+    def __init__(self, layout: dict, seed: Optional[int] = None, toggle: float = 0.01) -> None:
+        self._rnd = random.Random(seed)
+        self._toggle = toggle
+        rnd = self._rnd
+        self._zk_index = None
+        self._fault_index = None
+        self._models = []
+        for key, index, unit, dop in layout["analog"]:
+            digits = _DEFAULT_DIGITS if dop is None else dop
+            if key == "ZK":
+                self._zk_index = index
+                model = None
+            elif key == "Störungs Nr":
+                self._fault_index = index
+                model = None
+            elif key in _COUNTER_KEYS or key.startswith("Anzahl") or "zähler" in key.lower():
+                model = _Counter(rnd)
+            elif unit == "°C":
+                if key.startswith(("Taus", "TA ")):
+                    model = _Walk(rnd, -15.0, 35.0, 0.05)
+                elif key.startswith("TRG"):
+                    model = _Walk(rnd, 40.0, 220.0, 1.0)
+                else:
+                    model = _Walk(rnd, 15.0, 85.0, 0.2)
+            elif unit == "%":
+                model = _Walk(rnd, 0.0, 100.0, 0.5)
+            else:
+                model = _Walk(rnd, 0.0, 1000.0, 2.0)
+            self._models.append((index, model, "%.{}f".format(max(digits, 0))))
+        self._length = layout["length"]
+        self._analog_length = len(layout["analog"])
+        self._bitmasks: dict[int, int] = {}
+        self._fault_bit = None
+        for key, index, bitmask in layout["digital"]:
+            self._bitmasks[index] = self._bitmasks.get(index, 0) | bitmask
+            if key == "Störung":
+                self._fault_bit = (index, bitmask)
+        self._words = {index: 0 for index in range(self._analog_length, self._length)}
+        self._zk = 1
+        self._fault_code = 0
+        self._zk_left = rnd.randrange(*_ZK_CYCLE[1][:2])
+        self.frames = 0
+
+    def _next_zk(self) -> int:
+        self._zk_left -= 1
+        if self._zk_left <= 0:
+            rnd = self._rnd
+            if self._zk != _ZK_FAULT_STATE and rnd.random() < 0.02:
+                self._zk = _ZK_FAULT_STATE
+                self._fault_code = rnd.choice((5, 7, 19, 27, 55))
+            else:
+                self._zk = rnd.choice(_ZK_CYCLE[self._zk][2])
+            low, high, _ = _ZK_CYCLE[self._zk]
+            self._zk_left = rnd.randrange(low, high)
+        return self._zk
+
+    def frame(self) -> bytes:
+        """Return the next pm line (without line terminator)."""
+        rnd = self._rnd
+        fields = ["0"] * self._length
+        zk = self._next_zk()
+        fault = zk == _ZK_FAULT_STATE
+        if self._zk_index is not None:
+            fields[self._zk_index] = str(zk)
+        if self._fault_index is not None:
+            fields[self._fault_index] = str(self._fault_code) if fault else "0"
+        for index, model, fmt in self._models:
+            if model is not None:
+                fields[index] = fmt % model.next(rnd)
+        toggle = self._toggle
+        for index, mask in self._bitmasks.items():
+            word = self._words[index]
+            if rnd.random() < toggle:
+                bit = 1 << rnd.randrange(mask.bit_length())
+                if bit & mask:
+                    word ^= bit
+            self._words[index] = word
+        if self._fault_bit is not None:
+            index, bit = self._fault_bit
+            self._words[index] = self._words[index] | bit if fault else self._words[index] & ~bit
+        for index, word in self._words.items():
+            fields[index] = "%x" % word
+        self.frames += 1
+        return ("pm " + " ".join(fields)).encode("latin-1")
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            yield self.frame()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate synthetic pm frames for a DAQPRJ layout")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--descriptor",
+        default="NANO_PK_FULL",
+        help="DAQPRJ XML file or built-in template name (default: NANO_PK_FULL)",
+    )
+    source.add_argument("--channels", type=int, help="Use a synthetic layout with this many analogue channels")
+    parser.add_argument("--digital-words", type=int, default=1, help="Digital words of a synthetic layout")
+    parser.add_argument("--emit-descriptor", help="Write the descriptor used to this file")
+    parser.add_argument("--count", type=int, default=0, help="Number of frames (default: endless)")
+    parser.add_argument("--rate", type=float, default=1.0, help="Frames per second, 0 = as fast as possible")
+    parser.add_argument("--toggle", type=float, default=0.01, help="Probability per word and frame of a bit flip")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible streams")
+    parser.add_argument("--output", "-o", help="Write pm lines to this file instead of stdout")
+    parser.add_argument(
+        "--archive",
+        help="Write a raw frame archive to this directory instead, timestamped 1/rate apart (no waiting)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.channels is not None and args.channels < 1:
+        parser.error("--channels must be at least 1")
+
+    if args.channels is not None:
+        descriptor = synthetic_descriptor(args.channels, args.digital_words)
+    else:
+        path = Path(args.descriptor)
+        if not path.exists():
+            path = TEMPLATE_DIR / f"{args.descriptor}.xml"
+        descriptor = path.read_text(encoding="utf-8").strip()
+    if args.emit_descriptor:
+        Path(args.emit_descriptor).write_text(descriptor + "\n", encoding="utf-8")
+
+    generator = PmFrameGenerator(parse_layout(descriptor), seed=args.seed, toggle=args.toggle)
+    frames = iter(generator) if not args.count else (generator.frame() for _ in range(args.count))
+
+    if args.archive:
+        if not args.count:
+            print("--archive needs --count", file=sys.stderr)
+            return 1
+        archive = HargassnerArchiveWriter(args.archive)
+        archive.start()
+        interval = 1.0 / args.rate if args.rate > 0 else 1.0
+        start = time.time()
+        for number, line in enumerate(frames):
+            archive.append(line, start + number * interval, block=True)
+        archive.close()
+        print(f"Wrote {generator.frames} frames to {args.archive}", file=sys.stderr)
+        return 0
+
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    interval = 1.0 / args.rate if args.rate > 0 else 0.0
+    try:
+        next_due = time.monotonic()
+        for line in frames:
+            out.write(line + b"\r\n")
+            if interval:
+                out.flush()
+                next_due += interval
+                time.sleep(max(next_due - time.monotonic(), 0.0))
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
+    finally:
+        if args.output:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Profile import time and setup of the integration up to the first value.
+
+Two parts, both repeated `--runs` times and reported as medians:
+
+imports   `python -X importtime` in a fresh interpreter per run, importing
+          the modules Home Assistant loads for a config entry (the package,
+          sensor, binary_sensor, config_flow, diagnostics). Reported per
+          nano_pk module and for the heavier dependencies they pull in.
+
+setup     the sensor platform's async_setup_entry against a bare Home
+          Assistant core (see harness.py) and a fake boiler on a local port,
+          until the first sensor is available. The time line is broken down
+          into the steps of the setup path:
+
+              csv_load        DE.CSV error codes
+              xml_resolve     message format name/file -> XML
+              layout          layout cache lookup, parse on a miss
+              entities        bridge entity selection (_build_entities)
+              connect         session connect, from the first attempt
+              first_frame     first pm line decoded by the bridge
+              first_available first state write of an available sensor
+                              with a value, after a frame was received
+
+          The steps from connect on must end in this order, a run where
+          they do not fails the profile.
+
+          Every run starts from an empty config directory (cold layout
+          cache) unless `--warm`, which keeps `.storage` between runs like a
+          restart would.
+
+Needs Home Assistant installed.
+
+Example:
+    python3 tools/profile_startup.py --runs 5 --params FULL --json startup.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from functools import wraps
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from package import CUSTOM_COMPONENTS, missing_homeassistant
+
+# Modules imported when a config entry is set up
+IMPORTS = (
+    "nano_pk",
+    "nano_pk.sensor",
+    "nano_pk.binary_sensor",
+    "nano_pk.config_flow",
+    "nano_pk.diagnostics",
+)
+# Dependencies worth watching besides the nano_pk modules
+WATCHED = ("telnetlib", "socket", "xml.etree.ElementTree", "csv", "lzma", "gzip")
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+STEPS = ("csv_load", "xml_resolve", "layout", "entities", "connect", "first_frame", "first_available")
+# Steps that follow each other, each must end after the previous one
+ORDERED_STEPS = ("connect", "first_frame", "first_available")
+
+
+def profile_imports(runs: int) -> dict:
+    """Return median self/cumulative import time in µs of the watched modules."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(CUSTOM_COMPONENTS), os.environ.get("PYTHONPATH")])))
+    samples: dict[str, list[tuple[int, int]]] = {}
+    totals = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(IMPORTS)],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        total = 0
+        for match in _IMPORTTIME_RE.finditer(result.stderr):
+            self_us, cumulative_us, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+            if len(indent) == 1 and name.startswith("nano_pk"):  # top-level, not interpreter startup
+                total += cumulative_us
+            if name.startswith("nano_pk") or name in WATCHED:
+                samples.setdefault(name, []).append((self_us, cumulative_us))
+        totals.append(total)
+    return {
+        "total_us": statistics.median(totals),
+        "modules": {
+            name: {
+                "self_us": statistics.median(s for s, _ in values),
+                "cumulative_us": statistics.median(c for _, c in values),
+            }
+            for name, values in sorted(samples.items(), key=lambda item: -statistics.median(c for _, c in item[1]))
+        },
+    }
+
+
+class Timeline:
+    """Start and end of the first call of each step, relative to `start`."""
+
+    def __init__(self) -> None:
+        self.start = time.monotonic()
+        self.steps: dict[str, tuple[float, float]] = {}
+
+    def record(self, name: str, begin: float, end: float) -> None:
+        if name not in self.steps:
+            self.steps[name] = (begin - self.start, end - self.start)
+
+    def wrap_async(self, name: str, func):
+        @wraps(func)
+        async def timed(*args, **kwargs):
+            begin = time.monotonic()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self.record(name, begin, time.monotonic())
+        return timed
+
+    def wrap(self, name: str, func):
+        @wraps(func)
+        def timed(*args, **kwargs):
+            begin = time.monotonic()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, begin, time.monotonic())
+        return timed
+
+
+async def profile_setup(template: str, params: str, config_dir: str, timeout: float) -> dict:
+    """Set up one boiler and return the time line of its steps in seconds."""
+    import harness
+    from nano_pk import sensor
+    from nano_pk.connection import HargassnerConnection
+    from nano_pk.hargassner import HargassnerBridge
+    from nano_pk.layout_cache import HargassnerLayoutCache
+
+    server, boiler, port = await harness.async_start_fake_boiler(template, generate=100)
+    hass = await harness.async_create_hass(config_dir)
+    platform = harness.EntityPlatform(hass)
+    entry = harness.FakeConfigEntry(harness.entry_data(f"127.0.0.1:{port}", template, params))
+    # a restart loads DE.CSV again
+    sensor.HargassnerErrorSensor._extended_errors_loaded = False
+
+    timeline = Timeline()
+    error_sensor = sensor.HargassnerErrorSensor
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(
+            error_sensor, "_async_ensure_extended_errors_loaded",
+            timeline.wrap_async("csv_load", error_sensor._async_ensure_extended_errors_loaded),
+        ))
+        stack.enter_context(mock.patch.object(
+            sensor, "_resolve_msg_format", timeline.wrap_async("xml_resolve", sensor._resolve_msg_format)
+        ))
+        stack.enter_context(mock.patch.object(
+            HargassnerLayoutCache, "async_get", timeline.wrap_async("layout", HargassnerLayoutCache.async_get)
+        ))
+        stack.enter_context(mock.patch.object(
+            sensor, "_build_entities", timeline.wrap("entities", sensor._build_entities)
+        ))
+        stack.enter_context(mock.patch.object(
+            HargassnerConnection, "_async_connect", timeline.wrap_async("connect", HargassnerConnection._async_connect)
+        ))
+        stack.enter_context(mock.patch.object(
+            HargassnerBridge, "_process_line", timeline.wrap("first_frame", HargassnerBridge._process_line)
+        ))
+
+        timeline.start = time.monotonic()
+        await harness.async_setup_boiler(hass, platform, entry)
+        setup_done = time.monotonic() - timeline.start
+        deadline = time.monotonic() + timeout
+        while platform.first_available is None and time.monotonic() < deadline:
+            await asyncio.sleep(0.001)
+        if platform.first_available is not None:
+            timeline.steps["first_available"] = (setup_done, platform.first_available - timeline.start)
+
+        entities = len(platform.entities)
+        await platform.async_remove_all()
+    await harness.async_flush_storage(hass)
+    await harness.async_stop_fake_boiler(server, boiler)
+    return {"setup_entry": setup_done, "entities": entities, "steps": timeline.steps}
+
+
+def check_order(steps: dict) -> Optional[str]:
+    """Return an error if the ordered steps of a run did not end in order."""
+    ends = [(step, steps[step][1]) for step in ORDERED_STEPS if step in steps]
+    for (previous, previous_end), (step, end) in zip(ends, ends[1:]):
+        if end < previous_end:
+            return f"{step} ended at {end * 1000:.2f} ms, before {previous} at {previous_end * 1000:.2f} ms"
+    return None
+
+
+def _median_steps(runs: list[dict]) -> dict:
+    result = {}
+    for step in STEPS:
+        samples = [run["steps"][step] for run in runs if step in run["steps"]]
+        if samples:
+            result[step] = {
+                "start_ms": round(statistics.median(s for s, _ in samples) * 1000, 2),
+                "duration_ms": round(statistics.median(e - s for s, e in samples) * 1000, 2),
+                "end_ms": round(statistics.median(e for _, e in samples) * 1000, 2),
+            }
+    return result
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Profile import time and setup of the integration")
+    parser.add_argument("--runs", type=int, default=5, help="Runs of each part, medians are reported (default: 5)")
+    parser.add_argument("--template", default="NANO_PK_FULL", help="Message format of the boiler (default: NANO_PK_FULL)")
+    parser.add_argument("--params", default="STANDARD", choices=("STANDARD", "FULL"), help="Entity set (default: STANDARD)")
+    parser.add_argument("--warm", action="store_true", help="Keep .storage between runs (warm layout cache)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds to wait for the first value")
+    parser.add_argument("--skip-imports", action="store_true", help="Only profile the setup")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+
+    args = parser.parse_args(argv)
+    report = {"runs": args.runs, "template": args.template, "params": args.params, "warm": args.warm}
+
+    if not args.skip_imports:
+        try:
+            imports = report["imports"] = profile_imports(args.runs)
+        except RuntimeError as err:
+            print(f"Import profiling failed: {err}", file=sys.stderr)
+            return 1
+        print(f"Imports: {imports['total_us'] / 1000:.1f} ms in total")
+        for name, times in imports["modules"].items():
+            print(f"  {name:36} {times['cumulative_us'] / 1000:8.2f} ms cumulative {times['self_us'] / 1000:8.2f} ms self")
+
+    try:
+        import harness  # noqa: F401 - needs Home Assistant
+    except ImportError as err:
+        if not missing_homeassistant(err):
+            raise
+        print(f"Setup profiling needs Home Assistant: {err}", file=sys.stderr)
+        return 1
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="nano_pk_profile_") as shared:
+        for number in range(args.runs):
+            config_dir = shared if args.warm else tempfile.mkdtemp(dir=shared)
+            run = asyncio.run(profile_setup(args.template, args.params, config_dir, args.timeout))
+            error = check_order(run["steps"])
+            if error:
+                print(f"Setup steps out of order in run {number + 1}: {error}", file=sys.stderr)
+                return 1
+            runs.append(run)
+
+    steps = report["setup"] = _median_steps(runs)
+    report["setup_entry_ms"] = round(statistics.median(run["setup_entry"] for run in runs) * 1000, 2)
+    report["entities"] = runs[-1]["entities"]
+    print(f"Setup ({args.params}, {report['entities']} entities, {'warm' if args.warm else 'cold'} layout cache): "
+          f"async_setup_entry {report['setup_entry_ms']:.1f} ms")
+    print(f"  {'step':16} {'start':>10} {'duration':>10} {'end':>10}")
+    for step, times in steps.items():
+        print(f"  {step:16} {times['start_ms']:8.2f}ms {times['duration_ms']:8.2f}ms {times['end_ms']:8.2f}ms")
+    missing = [step for step in STEPS if step not in steps]
+    if missing:
+        print(f"  not reached: {', '.join(missing)}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Accelerated soak test: weeks of boiler frames in minutes of wall time.
+
+Boilers are set up through the sensor platform against a bare Home Assistant
+core (see harness.py) and fed as fast as they can decode: by default through
+the `file://` replay transport at max speed, which hands every frame of a
+synthetic capture through the regular session, framing and decode path
+(one day of a real boiler is 86400 frames). `--transport tcp` uses local
+fake boilers instead, to include sockets.
+
+While frames flow, the harness forces reconnects, switches the bridges
+between two layouts (entities then ask for keys the layout lacks) and
+reloads the entries. The frames are those of the longer of the two layouts,
+so that both accept them: the bridge skips frames shorter than its layout.
+Every `--sample` seconds it records RSS, the number of live objects, open
+file descriptors and sockets, asyncio tasks, the size of the bridges'
+error/info logs and the event loop lag. After a warm-up the
+last sample is compared with the first one; metrics that keep growing are
+reported and make the tool exit with 1.
+
+Needs Home Assistant installed.
+
+Example:
+    python3 tools/soak.py --days 14 --boilers 2 --json soak.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from package import missing_homeassistant
+from nano_pk.layout import parse_layout
+
+FRAMES_PER_DAY = 86400
+
+# Metrics checked for growth: name -> (relative limit, absolute allowance)
+_GROWTH_RULES = {
+    "rss_bytes": (None, 0),  # relative limit from --max-growth
+    "objects": (None, 0),
+    "fds": (0.0, 2),
+    "sockets": (0.0, 2),
+    "tasks": (0.0, 2),
+    "log_bytes": (0.0, 4096),
+}
+
+
+def rss_bytes() -> int:
+    """Return the current resident set size (peak RSS where /proc is missing)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def open_fds() -> tuple[int, int]:
+    """Return the number of open file descriptors and of sockets among them."""
+    try:
+        fds = os.listdir("/proc/self/fd")
+    except OSError:
+        return -1, -1
+    sockets = 0
+    for fd in fds:
+        try:
+            if os.readlink(f"/proc/self/fd/{fd}").startswith("socket:"):
+                sockets += 1
+        except OSError:
+            pass
+    return len(fds), sockets
+
+
+async def async_teardown(platform, timeout: float) -> None:
+    """Remove all entities and their sessions, fail loudly if that hangs.
+
+    A hung teardown cannot be recovered from: asyncio.run would wait for the
+    stuck tasks forever, so the tool names them and exits right away.
+    """
+    removal = asyncio.ensure_future(platform.async_remove_all())
+    done, _ = await asyncio.wait((removal,), timeout=timeout)  # no cancel, a stuck task could ignore it
+    if not done:
+        stuck = sorted(task.get_name() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+        print(
+            f"Teardown did not finish within {timeout:g}s, tasks still running: {', '.join(stuck)}",
+            file=sys.stderr,
+            flush=True,
+        )
+        os._exit(1)
+    removal.result()
+
+
+def write_capture(path: Path, template: str, frames: int, seed: int) -> None:
+    """Write a text capture of synthetic frames for `template`."""
+    from fake_boiler import load_descriptor
+    from pm_generator import PmFrameGenerator
+
+    generator = PmFrameGenerator(parse_layout(load_descriptor(template)), seed=seed, toggle=0.02)
+    with open(path, "wb") as capture:
+        for _ in range(frames):
+            capture.write(generator.frame() + b"\r\n")
+
+
+async def async_soak(args) -> dict:
+    """Run the soak and return the samples."""
+    import harness
+    from fake_boiler import load_descriptor
+
+    layouts = [parse_layout(load_descriptor(name)) for name in (args.template, args.alt_template)]
+    source = args.template
+    if args.layout_every and layouts[1]["length"] > layouts[0]["length"]:
+        source = args.alt_template
+    servers = []
+    with tempfile.TemporaryDirectory(prefix="nano_pk_soak_") as workdir:
+        hosts = []
+        if args.transport == "replay":
+            capture = Path(workdir) / "capture.txt"
+            write_capture(capture, source, args.capture_frames, args.seed)
+            for number in range(args.boilers):
+                # one path per boiler, sessions are shared by address
+                link = Path(workdir) / f"boiler{number}.txt"
+                link.symlink_to(capture)
+                hosts.append(f"file://{link}?speed=max")
+        else:
+            for _ in range(args.boilers):
+                server, boiler, port = await harness.async_start_fake_boiler(
+                    source, generate=args.capture_frames, speed=0.0, seed=args.seed
+                )
+                servers.append((server, boiler))
+                hosts.append(f"127.0.0.1:{port}")
+
+        hass = await harness.async_create_hass(workdir)
+        platform = harness.EntityPlatform(hass)
+
+        async def setup_all() -> list:
+            for number, host in enumerate(hosts):
+                entry = harness.FakeConfigEntry(
+                    harness.entry_data(host, args.template, args.params, f"Soak {number}", str(number))
+                )
+                await harness.async_setup_boiler(hass, platform, entry)
+            return [e for e in platform.entities if isinstance(e, harness.HargassnerBridge)]
+
+        bridges = await setup_all()
+        lag = harness.LoopLagMonitor()
+        lag.start()
+
+        target = int(args.days * FRAMES_PER_DAY * args.boilers)
+        start = time.monotonic()
+        next_sample = start
+        next_reconnect = args.reconnect_every
+        next_layout = args.layout_every
+        next_reload = args.reload_every
+        layout_turn = 0
+        samples = []
+        types_after_warmup = None
+        warmup_samples = None
+
+        while platform.frames < target and time.monotonic() - start < args.max_seconds:
+            await asyncio.sleep(0.05)
+            frames = platform.frames
+            if args.reconnect_every and frames >= next_reconnect:
+                next_reconnect += args.reconnect_every
+                for bridge in bridges:
+                    if bridge._connection is not None:
+                        bridge._connection.async_reconnect()
+            if args.layout_every and frames >= next_layout:
+                next_layout += args.layout_every
+                layout_turn += 1
+                for bridge in bridges:
+                    bridge.setLayout(layouts[layout_turn % 2])
+            if args.reload_every and frames >= next_reload:
+                next_reload += args.reload_every
+                await async_teardown(platform, args.teardown_timeout)
+                bridges = await setup_all()
+            if time.monotonic() < next_sample:
+                continue
+            next_sample += args.sample
+
+            gc.collect()
+            fds, sockets = open_fds()
+            sample = {
+                "elapsed_s": round(time.monotonic() - start, 1),
+                "frames": frames,
+                "simulated_days": round(frames / FRAMES_PER_DAY / args.boilers, 3),
+                "rss_bytes": rss_bytes(),
+                "objects": len(gc.get_objects()),
+                "fds": fds,
+                "sockets": sockets,
+                "tasks": len(asyncio.all_tasks()),
+                "log_bytes": sum(len(b._errorLog) + len(b._infoLog) for b in bridges),
+                "state_writes": platform.writes,
+            }
+            lags = lag.take()
+            sample["lag_p99_ms"], sample["lag_max_ms"] = lags["p99"], lags["max"]
+            samples.append(sample)
+            print(
+                f"{sample['elapsed_s']:7.1f}s {sample['simulated_days']:7.2f} days "
+                f"rss {sample['rss_bytes'] / 2**20:7.1f} MiB objects {sample['objects']:>8,} "
+                f"fds {fds:4} sockets {sockets:3} tasks {sample['tasks']:3} "
+                f"logs {sample['log_bytes']:>9,} B lag {sample['lag_p99_ms']:6.1f}/{sample['lag_max_ms']:6.1f} ms"
+            )
+            if warmup_samples is None and sample["elapsed_s"] >= args.warmup:
+                warmup_samples = len(samples)
+                types_after_warmup = Counter(type(o).__name__ for o in gc.get_objects())
+
+        lag.stop()
+        gc.collect()
+        types_at_end = Counter(type(o).__name__ for o in gc.get_objects())
+        await async_teardown(platform, args.teardown_timeout)
+        for server, boiler in servers:
+            await harness.async_stop_fake_boiler(server, boiler)
+
+    growing_types = []
+    if types_after_warmup is not None:
+        growth = types_at_end
+        growth.subtract(types_after_warmup)
+        growing_types = [(name, count) for name, count in growth.most_common(10) if count > 0]
+    return {
+        "samples": samples,
+        "warmup_samples": warmup_samples or 0,
+        "growing_types": growing_types,
+        "frames_per_second": round(platform.frames / max(time.monotonic() - start, 1e-9)),
+    }
+
+
+def find_growth(samples: list[dict], warmup: int, max_growth: float) -> list[str]:
+    """Return descriptions of the metrics that grew beyond their rule after warm-up."""
+    steady = samples[max(warmup - 1, 0):]
+    if len(steady) < 2:
+        return []
+    first, last = steady[0], steady[-1]
+    problems = []
+    for metric, (relative, allowance) in _GROWTH_RULES.items():
+        if first[metric] < 0:
+            continue  # not available on this platform
+        limit = first[metric] * (1.0 + (max_growth / 100.0 if relative is None else relative)) + allowance
+        values = [sample[metric] for sample in steady]
+        # growing = above the limit at the end and mostly rising on the way
+        rising = sum(1 for a, b in zip(values, values[1:]) if b > a) >= (len(values) - 1) * 0.6
+        if last[metric] > limit and rising:
+            problems.append(f"{metric} {first[metric]:,} -> {last[metric]:,}")
+    return problems
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Soak the bridge with weeks of frames in minutes")
+    parser.add_argument("--days", type=float, default=14.0, help="Simulated days per boiler (default: 14)")
+    parser.add_argument("--max-seconds", type=float, default=900.0, help="Wall time limit (default: 900)")
+    parser.add_argument("--boilers", type=int, default=1, help="Number of boilers (default: 1)")
+    parser.add_argument("--transport", choices=("replay", "tcp"), default="replay", help="Frame source (default: replay)")
+    parser.add_argument("--template", default="NANO_PK_FULL", help="Message format of the boilers (default: NANO_PK_FULL)")
+    parser.add_argument("--alt-template", default="NANO_V14L", help="Layout switched to and back (default: NANO_V14L)")
+    parser.add_argument("--params", default="STANDARD", choices=("STANDARD", "FULL"), help="Entity set (default: STANDARD)")
+    parser.add_argument("--capture-frames", type=int, default=20000, help="Frames per replay pass (default: 20000)")
+    parser.add_argument("--reconnect-every", type=int, default=50000, help="Frames between forced reconnects, 0 = never")
+    parser.add_argument("--layout-every", type=int, default=200000, help="Frames between layout switches, 0 = never")
+    parser.add_argument("--reload-every", type=int, default=500000, help="Frames between entry reloads, 0 = never")
+    parser.add_argument("--sample", type=float, default=5.0, help="Seconds between samples (default: 5)")
+    parser.add_argument("--warmup", type=float, default=30.0, help="Seconds before growth is judged (default: 30)")
+    parser.add_argument("--max-growth", type=float, default=10.0, help="Allowed RSS/object growth in %% (default: 10)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the synthetic frames (default: 1)")
+    parser.add_argument(
+        "--teardown-timeout", type=float, default=30.0, help="Seconds an entry unload may take (default: 30)"
+    )
+    parser.add_argument("--json", help="Also write the samples to this JSON file")
+
+    args = parser.parse_args(argv)
+
+    try:
+        import harness  # noqa: F401 - needs Home Assistant
+    except ImportError as err:
+        if not missing_homeassistant(err):
+            raise
+        print(f"Soak test needs Home Assistant: {err}", file=sys.stderr)
+        return 1
+
+    result = asyncio.run(async_soak(args))
+    problems = find_growth(result["samples"], result["warmup_samples"], args.max_growth)
+    print(f"{result['frames_per_second']:,} frames/s on average")
+    if result["growing_types"]:
+        print("Object types that grew after warm-up: " + ", ".join(f"{n} +{c}" for n, c in result["growing_types"]))
+    lags = [s["lag_max_ms"] for s in result["samples"]]
+    if lags:
+        print(f"Event loop lag: median of window maxima {statistics.median(lags):.1f} ms, worst {max(lags):.1f} ms")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({**result, "problems": problems}, indent=2) + "\n", encoding="utf-8")
+    if problems:
+        print("Unbounded growth: " + "; ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
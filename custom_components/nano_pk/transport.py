@@ -0,0 +1,264 @@
+"""Byte stream transports between a boiler and its session.
+
+The host setting of an entry selects the transport:
+
+    192.168.1.50                   telnet on port 23 (default)
+    192.168.1.50:2323              TCP on any port, e.g. ser2net or a relay
+    tcp://relay.local:4000         same, explicit
+    unix:///run/boiler.sock        Unix domain socket of a local relay
+    serial:///dev/ttyUSB0          serial-style device or pty (raw mode)
+    file:///config/capture.txt     replay of a text capture or raw frame
+                                   archive; ?speed=10 or ?speed=max,
+                                   ?interval=1.0 for frames without time
+
+Every transport opens to a (reader, writer) pair with the StreamReader /
+StreamWriter methods the session uses (read, write, drain, close,
+wait_closed), so the production code path is the same for all of them.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+import os
+from urllib.parse import parse_qs
+
+from .archive import read_capture
+from .const import BRIDGE_TIMEOUT, TELNET_PORT
+
+
+class HargassnerTransport(ABC):
+    """Opens the byte stream of one boiler."""
+
+    scheme = ""
+
+    @property
+    @abstractmethod
+    def key(self) -> str:
+        """Return the canonical address, used to share sessions."""
+
+    @abstractmethod
+    async def async_open(self):
+        """Open the stream, return (reader, writer)."""
+
+    def __str__(self) -> str:
+        return self.key
+
+
+class TcpTransport(HargassnerTransport):
+    """TCP connection, the boiler's telnet port by default."""
+
+    scheme = "tcp"
+
+    def __init__(self, host: str, port: int = TELNET_PORT) -> None:
+        self.host = host
+        self.port = port
+
+    @property
+    def key(self) -> str:
+        host = f"[{self.host}]" if ":" in self.host else self.host
+        return f"{host}:{self.port}"
+
+    async def async_open(self):
+        return await asyncio.open_connection(self.host, self.port)
+
+
+class UnixTransport(HargassnerTransport):
+    """Unix domain socket of a local relay."""
+
+    scheme = "unix"
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    @property
+    def key(self) -> str:
+        return f"unix://{self.path}"
+
+    async def async_open(self):
+        return await asyncio.open_unix_connection(self.path)
+
+
+class _PipeWriter:
+    """StreamWriter of a character device that also closes the read side."""
+
+    def __init__(self, writer: asyncio.StreamWriter, read_transport) -> None:
+        self._writer = writer
+        self._read_transport = read_transport
+
+    def write(self, data: bytes) -> None:
+        self._writer.write(data)
+
+    async def drain(self) -> None:
+        await self._writer.drain()
+
+    def close(self) -> None:
+        self._read_transport.close()
+        self._writer.close()
+
+    async def wait_closed(self) -> None:
+        # the write pipe protocol has no close waiter, the pipe transports
+        # finish closing on the next loop iteration
+        await asyncio.sleep(0)
+
+
+class SerialTransport(HargassnerTransport):
+    """Serial-style character device or pty, switched to raw mode.
+
+    Line settings (baud rate etc.) are left as configured on the device,
+    e.g. with stty, or handled by a ser2net relay via TcpTransport.
+    """
+
+    scheme = "serial"
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    @property
+    def key(self) -> str:
+        return f"serial://{self.path}"
+
+    def _open_raw(self) -> int:
+        """Open the device and switch a tty to raw mode (blocking I/O)."""
+        fd = os.open(self.path, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            if os.isatty(fd):
+                import tty
+
+                tty.setraw(fd)
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd
+
+    async def async_open(self):
+        loop = asyncio.get_running_loop()
+        fd = await loop.run_in_executor(None, self._open_raw)
+        try:
+            reader = asyncio.StreamReader()
+            read_transport, _ = await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), os.fdopen(os.dup(fd), "rb", buffering=0)
+            )
+            write_transport, write_protocol = await loop.connect_write_pipe(
+                asyncio.streams.FlowControlMixin, os.fdopen(os.dup(fd), "wb", buffering=0)
+            )
+        finally:
+            os.close(fd)
+        writer = asyncio.StreamWriter(write_transport, write_protocol, reader, loop)
+        return reader, _PipeWriter(writer, read_transport)
+
+
+class _ReplayStream:
+    """Reader and writer of a replayed capture.
+
+    Each read returns the next frame once it is due, so even at max speed
+    every frame takes the normal (non-backlog) path. At max speed every read
+    still yields to the event loop, like a socket read does, so that the
+    replay does not starve other tasks. Writes are discarded. The stream
+    ends after the last frame, which makes the session reconnect and replay
+    the capture again.
+    """
+
+    # Longer gaps in a capture (e.g. HA was down) are shortened to this so
+    # that the session's read timeout does not fire
+    _MAX_DELAY = BRIDGE_TIMEOUT / 2
+
+    def __init__(self, frames: list[tuple[float | None, bytes]], speed: float, interval: float) -> None:
+        self._frames = frames
+        self._speed = speed
+        self._interval = interval
+        self._position = 0
+        self._previous = None
+
+    async def read(self, n: int = -1) -> bytes:
+        if self._position >= len(self._frames):
+            return b""
+        timestamp, line = self._frames[self._position]
+        if self._speed > 0 and self._position:
+            if timestamp is not None and self._previous is not None:
+                delay = max(timestamp - self._previous, 0.0) / self._speed
+            else:
+                delay = self._interval / self._speed
+            await asyncio.sleep(min(delay, self._MAX_DELAY))
+        else:
+            await asyncio.sleep(0)
+        self._position += 1
+        self._previous = timestamp
+        return line + b"\r\n"
+
+    def write(self, data: bytes) -> None:
+        pass
+
+    async def drain(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._position = len(self._frames)
+
+    async def wait_closed(self) -> None:
+        pass
+
+
+class ReplayTransport(HargassnerTransport):
+    """Replay of a recorded capture, for deterministic tests of the full path."""
+
+    scheme = "file"
+
+    def __init__(self, path: str, speed: float = 1.0, interval: float = 1.0) -> None:
+        self.path = path
+        self.speed = speed
+        self.interval = interval
+        self._frames = None
+
+    @property
+    def key(self) -> str:
+        return f"file://{self.path}"
+
+    async def async_open(self):
+        if self._frames is None:
+            self._frames = await asyncio.get_running_loop().run_in_executor(None, read_capture, self.path)
+        stream = _ReplayStream(self._frames, self.speed, self.interval)
+        return stream, stream
+
+
+def parse_transport(spec: str) -> HargassnerTransport:
+    """Return the transport selected by a host setting (see module docstring).
+
+    Raises ValueError for unknown schemes or malformed addresses.
+    """
+    spec = spec.strip()
+    scheme, sep, rest = spec.partition("://")
+    if not sep:
+        scheme, rest = TcpTransport.scheme, spec
+    if not rest:
+        raise ValueError(f"Missing address in '{spec}'")
+
+    if scheme == TcpTransport.scheme:
+        host, port = rest, TELNET_PORT
+        if rest.startswith("["):  # [IPv6]:port
+            host, _, tail = rest[1:].partition("]")
+            if tail:
+                port = tail.lstrip(":")
+        elif rest.count(":") == 1:
+            host, port = rest.split(":")
+        try:
+            port = int(port)
+        except ValueError as err:
+            raise ValueError(f"Invalid port in '{spec}'") from err
+        return TcpTransport(host, port)
+    if scheme == UnixTransport.scheme:
+        return UnixTransport(rest)
+    if scheme in (SerialTransport.scheme, "pty"):
+        return SerialTransport(rest)
+    if scheme == ReplayTransport.scheme:
+        path, _, query = rest.partition("?")
+        options = {k: v[-1] for k, v in parse_qs(query).items()}
+        speed = options.get("speed", "1")
+        try:
+            return ReplayTransport(
+                path,
+                speed=0.0 if speed == "max" else float(speed),
+                interval=float(options.get("interval", 1.0)),
+            )
+        except ValueError as err:
+            raise ValueError(f"Invalid replay options in '{spec}'") from err
+    raise ValueError(f"Unknown transport '{scheme}' in '{spec}'")
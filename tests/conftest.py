@@ -0,0 +1,10 @@
+"""Make the integration (as `nano_pk`) and its tools importable for the tests."""
+
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1] / "custom_components" / "nano_pk" / "tools"
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import package  # noqa: E402,F401 - puts custom_components on sys.path
@@ -0,0 +1,16 @@
+"""Rotation of the raw frame archive."""
+
+from nano_pk.archive import COMPRESSION_NONE, HargassnerArchiveWriter, archive_segments, read_archive_dir
+
+
+def test_segments_rotate_on_record_timestamps(tmp_path):
+    archive = HargassnerArchiveWriter(tmp_path, compression=COMPRESSION_NONE, max_age=3600)
+    archive.start()
+    # two hours of frames from 2023, written in well under a second
+    records = [(1_700_000_000.0 + second * 60, b"pm %d" % second) for second in range(121)]
+    for timestamp, line in records:
+        archive.append(line, timestamp, block=True)
+    archive.close()
+
+    assert len(archive_segments(tmp_path)) == 3
+    assert list(read_archive_dir(tmp_path)) == records
@@ -0,0 +1,43 @@
+"""Shared sessions of the bridges to a boiler."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+
+def test_removing_the_last_bridge_stops_the_session(tmp_path):
+    import harness
+    from nano_pk.connection import async_get_connection_manager
+
+    async def run():
+        hass = await harness.async_create_hass(tmp_path)
+        server, boiler, port = await harness.async_start_fake_boiler(generate=20, interval=0.05, seed=1)
+        address = f"127.0.0.1:{port}"
+        platform = harness.EntityPlatform(hass)
+        for number in (1, 2):
+            entry = harness.FakeConfigEntry(harness.entry_data(address, "NANO_PK_FULL", "STANDARD", unique_id=str(number)))
+            await harness.async_setup_boiler(hass, platform, entry)
+        first, second = [e for e in platform.entities if isinstance(e, harness.HargassnerBridge)]
+        manager = async_get_connection_manager(hass)
+        connection = manager.get(address)
+        task = connection._task
+        while not (first.hasRecentData() and second.hasRecentData()):
+            await asyncio.sleep(0.01)
+        assert connection.subscriber_count == 2
+        assert len(connection.framer) == 0  # between frames
+        assert first.get_diagnostics_data()["message_parsing"]["framed_lines"] > 0
+
+        await first.async_will_remove_from_hass()
+        assert connection.subscriber_count == 1
+        assert manager.get(address) is connection
+        assert not task.done()
+
+        await second.async_will_remove_from_hass()
+        assert connection.subscriber_count == 0
+        assert manager.get(address) is None
+        assert task.done()
+        await harness.async_stop_fake_boiler(server, boiler)
+
+    asyncio.run(run())
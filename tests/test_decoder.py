@@ -0,0 +1,14 @@
+"""The compiled decode plan."""
+
+from nano_pk.decoder import HargassnerDecodePlan
+
+
+def test_analogue_values_round_to_their_dop_only():
+    plan = HargassnerDecodePlan([("A", 0, None), ("B", 1, 0), ("C", 2, 2)], [])
+    values, _ = plan.decode([b"84.4567", b"12.6", b"3.14159"])
+    assert values == {"A": 84.4567, "B": 13, "C": 3.14}
+    assert type(values["A"]) is float and type(values["B"]) is int
+
+    # the per-field fallback of non-numeric fields keeps the same conversion
+    values, _ = plan.decode([b"0.123456789", b"x", b"1"])
+    assert values == {"A": 0.123456789, "B": None, "C": 1.0}
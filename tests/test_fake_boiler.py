@@ -0,0 +1,50 @@
+"""The descriptor clients against the fake boiler."""
+
+import asyncio
+
+from fake_boiler import FakeBoiler, Faults, load_descriptor, load_frames
+from nano_pk.daq_fetcher import DAQ_TERMINATOR, async_fetch_daq_template, encode_command
+from nano_pk.descriptor_client import async_fetch_descriptor
+
+
+def _fake_boiler(**kwargs):
+    descriptor = load_descriptor("NANO_PK_FULL")
+    return descriptor, FakeBoiler(descriptor, load_frames(None, descriptor, generate=50, seed=1), seed=1, **kwargs)
+
+
+def _run(boiler, client):
+    async def run():
+        server = await asyncio.start_server(boiler.handle_client, "127.0.0.1", 0)
+        async with server:
+            return await asyncio.wait_for(client(server.sockets[0].getsockname()[1]), 10)
+
+    return asyncio.run(run())
+
+
+def test_descriptor_client_reads_only_the_descriptor():
+    descriptor, boiler = _fake_boiler(speed=0.0)
+    assert _run(boiler, lambda port: async_fetch_descriptor("127.0.0.1", port=port)) == descriptor
+
+
+def test_daq_fetcher_reads_the_descriptor():
+    descriptor, boiler = _fake_boiler(speed=0.0)
+    assert _run(boiler, lambda port: async_fetch_daq_template("127.0.0.1", port=port)) == descriptor
+
+
+def test_reply_does_not_interleave_with_the_stream():
+    descriptor, boiler = _fake_boiler(interval=0.01, command_window=0.0, faults=Faults(split=1.0))
+
+    async def client(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            await reader.readline()  # the stream is running, frames are written in two parts
+            writer.write(encode_command())
+            return await reader.readuntil(DAQ_TERMINATOR)
+        finally:
+            writer.close()
+
+    reply = _run(boiler, client)
+    expected = descriptor.encode("latin-1")
+    assert reply.endswith(expected)
+    before = reply[: -len(expected)]  # whole frames only
+    assert not before or before.endswith(b"\r\n")
@@ -0,0 +1,26 @@
+"""Framing of the telnet stream into pm lines."""
+
+import random
+
+from nano_pk.framing import PmLineFramer, clean_telnet_noise, replace_prompt_markers
+
+_PREFIXES = (b"", b"", b" ", b"\r", b"\t ", b">>>", b"$<<<", b"\xff\xfb\x01", b"\xff\xf1", b"\xff\xfa\x18\x01\xff\xf0")
+_BODIES = (b"pm 1 2 3", b"pm 4.5 x", b"pm", b"abc 1", b"", b"p m 1", b"$DAQ", b">>>pm 7")
+
+
+def test_feed_latest_counts_the_lines_feed_hands_out():
+    rnd = random.Random(1)
+    for _ in range(2000):
+        data = b"".join(
+            rnd.choice(_PREFIXES) + rnd.choice(_BODIES) + rnd.choice((b"\r\n", b"\n"))
+            for _ in range(rnd.randint(0, 12))
+        ) + rnd.choice((b"", b"pm 9 9", b">>>"))
+        lines = PmLineFramer().feed(data)
+        line, skipped = PmLineFramer().feed_latest(data)
+        assert line == (lines[-1] if lines else None)
+        assert skipped == max(len(lines) - 1, 0), data
+
+
+def test_prompt_markers_are_brackets_in_the_descriptor_and_noise_in_the_stream():
+    assert replace_prompt_markers(b"$<<<DAQPRJ>>>", brackets=True) == b"<DAQPRJ>"
+    assert clean_telnet_noise(b"$<<<>>>pm 1 2\r") == b"pm 1 2"
@@ -0,0 +1,67 @@
+"""The deadband heartbeat reaches the state writes of unchanged sensors."""
+
+import pytest
+
+from nano_pk.deadband import HargassnerDeadbandFilter
+from nano_pk.timing import HargassnerFrameTiming
+
+
+def test_deadband_reports_heartbeat_keys():
+    deadband = HargassnerDeadbandFilter({"TK": 0.5}, max_age=600)
+    assert deadband.changed({"TK": 60.0, "TRG": 120.0}, 0.0) == ["TK", "TRG"]
+    assert deadband.heartbeat() == []
+    assert deadband.changed({"TK": 60.2, "TRG": 120.0}, 10.0) == []
+    assert deadband.changed({"TK": 60.2, "TRG": 121.0}, 600.0) == ["TK", "TRG"]
+    assert deadband.heartbeat() == ["TK"]
+    assert deadband.changed({"TK": 60.2, "TRG": 121.0}, 610.0) == []
+    assert deadband.heartbeat() == []
+
+
+class _Bridge:
+    """The parts of HargassnerBridge a sensor uses."""
+
+    def __init__(self, state):
+        self.state = state
+        self.value = 60.0
+        self.heartbeat = frozenset()
+
+    def getUniqueIdBase(self):
+        return "test"
+
+    def getUnit(self, paramName):
+        return "°C"
+
+    def getStateClass(self, paramName):
+        return "measurement"
+
+    def getValue(self, paramName):
+        return self.value
+
+    def isHeartbeat(self, paramName):
+        return paramName in self.heartbeat
+
+    def timing(self):
+        return HargassnerFrameTiming()
+
+
+def test_heartbeat_writes_unchanged_sensor_state():
+    pytest.importorskip("homeassistant")
+    from nano_pk.const import BRIDGE_STATE_OK
+    from nano_pk.sensor import HargassnerSensor
+
+    bridge = _Bridge(BRIDGE_STATE_OK)
+    sensor = HargassnerSensor(bridge, "boiler temperature", "TK")
+    writes = []
+    sensor.async_write_ha_state = lambda: writes.append(sensor.native_value)
+
+    sensor._handle_bridge_update(None)
+    sensor._handle_bridge_update(None)
+    assert writes == [60.0]  # no-op write suppressed
+
+    bridge.heartbeat = frozenset({"TK"})
+    sensor._handle_bridge_update(None)
+    assert writes == [60.0, 60.0]  # heartbeat refreshes last_reported
+
+    bridge.heartbeat = frozenset()
+    sensor._handle_bridge_update(None)
+    assert writes == [60.0, 60.0]
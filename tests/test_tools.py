@@ -0,0 +1,135 @@
+"""Smoke tests of the tools (see custom_components/nano_pk/tools).
+
+The tools that drive Home Assistant are run end to end when it is
+installed; their helpers and the fake boilers run without it.
+"""
+
+import asyncio
+import importlib.util
+import json
+
+import pytest
+
+needs_homeassistant = pytest.mark.skipif(
+    importlib.util.find_spec("homeassistant") is None, reason="needs Home Assistant"
+)
+
+
+def test_fuzz_decoder_plan_agrees_with_the_reference():
+    import fuzz_decoder
+
+    assert fuzz_decoder.main(["--target", "plan", "--cases", "100"]) == 0
+
+
+def test_profile_startup_checks_the_step_order():
+    from profile_startup import check_order
+
+    steps = {"csv_load": (0.0, 0.1), "connect": (0.1, 0.2), "first_frame": (0.2, 0.3), "first_available": (0.3, 0.4)}
+    assert check_order(steps) is None
+    assert "first_frame" in check_order({**steps, "first_frame": (0.1, 0.15)})
+
+
+def test_soak_reports_only_metrics_that_keep_growing():
+    from soak import find_growth
+
+    def sample(rss, tasks):
+        return {"rss_bytes": rss, "objects": 1000, "fds": 10, "sockets": 2, "tasks": tasks, "log_bytes": 0}
+
+    flat = [sample(100 << 20, 5) for _ in range(10)]
+    assert find_growth(flat, warmup=2, max_growth=10.0) == []
+    # growth during the warm-up does not count
+    assert find_growth([sample(10 << 20, 50)] + flat, warmup=2, max_growth=10.0) == []
+    growing = [sample((100 + 5 * n) << 20, 5 + n) for n in range(10)]
+    assert [p.split()[0] for p in find_growth(growing, warmup=1, max_growth=10.0)] == ["rss_bytes", "tasks"]
+
+
+def test_load_test_boilers_send_on_their_schedule():
+    from load_test import ScheduledBoilers, saturated
+
+    boilers = ScheduledBoilers(2, "NANO_PK_FULL", interval=0.05, aligned=False, seed=1)
+    ports = boilers.start()
+    try:
+        async def read(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            lines = [(await reader.readline()).rstrip(b"\r\n") for _ in range(3)]
+            writer.close()
+            return lines
+
+        for port in ports:
+            lines = asyncio.run(asyncio.wait_for(read(port), 10))
+            assert all(line.startswith(b"pm ") for line in lines)
+            assert boilers.match(port, lines[-1]) is not None
+            assert boilers.match(port, lines[0]) is None  # older frames were dropped
+    finally:
+        boilers.stop()
+
+    result = {"loop_load": 0.2, "delivered": 1.0, "frame_to_state_ms": {"p99": 20.0}}
+    assert saturated(result, interval=1.0, max_load=0.9) == []
+    assert saturated({**result, "delivered": 0.5}, interval=1.0, max_load=0.9) == ["50% delivered"]
+
+
+@needs_homeassistant
+def test_memory_budget_runs_one_budget(tmp_path):
+    import memory_budget
+
+    report = tmp_path / "memory.json"
+    assert memory_budget.main([
+        "--boilers", "1", "--params", "STANDARD", "--settle", "0.5", "--timeout", "30",
+        "--max-bytes-per-boiler", str(1 << 30), "--json", str(report),
+    ]) == 0
+
+    (result,) = json.loads(report.read_text())["results"]
+    assert result["boilers"] == 1
+    assert result["entities"] > 0
+    assert result["bytes_per_bridge"] > 0
+    assert result["bytes_per_entity"] > 0
+
+
+@needs_homeassistant
+def test_profile_startup_profiles_the_setup(tmp_path):
+    import profile_startup
+
+    report = tmp_path / "startup.json"
+    assert profile_startup.main(["--runs", "1", "--skip-imports", "--json", str(report)]) == 0
+
+    steps = json.loads(report.read_text())["setup"]
+    assert {"connect", "first_frame", "first_available"} <= set(steps)
+
+
+@needs_homeassistant
+@pytest.mark.parametrize("transport", ["replay", "tcp"])
+def test_soak_survives_reconnects_layout_switches_and_reloads(tmp_path, transport):
+    import soak
+
+    report = tmp_path / "soak.json"
+    assert soak.main([
+        "--transport", transport, "--days", "0.05", "--max-seconds", "60", "--capture-frames", "500",
+        "--reconnect-every", "700", "--layout-every", "1100", "--reload-every", "2300",
+        "--sample", "0.5", "--warmup", "0", "--max-growth", "1000", "--json", str(report),
+    ]) == 0
+
+    result = json.loads(report.read_text())
+    assert result["samples"][-1]["frames"] > 0
+    assert result["problems"] == []
+
+
+@needs_homeassistant
+def test_load_test_measures_a_small_fleet(tmp_path):
+    import load_test
+
+    report = tmp_path / "load.json"
+    assert load_test.main([
+        "--boilers", "2", "--interval", "0.2", "--duration", "2", "--warmup", "0.5", "--json", str(report),
+    ]) == 0
+
+    (result,) = json.loads(report.read_text())["results"]
+    assert result["boilers"] == 2
+    assert result["frames"] > 0
+    assert result["handling_ms"]["p50"] > 0
+
+
+@needs_homeassistant
+def test_fuzz_decoder_bridge_agrees_with_the_reference():
+    import fuzz_decoder
+
+    assert fuzz_decoder.main(["--target", "bridge", "--cases", "50"]) == 0
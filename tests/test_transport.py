@@ -0,0 +1,33 @@
+"""Transports of the boiler byte stream."""
+
+import asyncio
+
+from nano_pk.transport import ReplayTransport, parse_transport
+
+
+def test_replay_at_max_speed_yields_to_the_loop(tmp_path):
+    capture = tmp_path / "capture.txt"
+    capture.write_bytes(b"pm 1 2 3\r\n" * 500)
+    transport = parse_transport(f"file://{capture}?speed=max")
+    assert isinstance(transport, ReplayTransport)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        reader, writer = await transport.async_open()
+        frames = 0
+        while await reader.read():
+            frames += 1
+        task.cancel()
+        return frames, ticks
+
+    frames, ticks = asyncio.run(run())
+    assert frames == 500
+    assert ticks >= frames